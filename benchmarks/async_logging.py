@@ -0,0 +1,79 @@
+"""Benchmark training step latency: synchronous vs. async logger updates.
+
+Usage: python benchmarks/async_logging.py --num_steps 200 --log_every 10
+"""
+
+import time
+import shutil
+import argparse
+import tempfile
+import numpy as np
+from mle_logging import MLELogger
+from mle_toolbox.utils.async_logger import AsyncLogWriter
+
+
+def run_training(
+    log_dir: str,
+    writer,
+    num_steps: int,
+    log_every: int,
+    step_time: float,
+    model_mb: float,
+) -> np.ndarray:
+    """Simulated training loop - returns wall time of every step."""
+    log = MLELogger(
+        experiment_dir=log_dir,
+        time_to_track=["num_steps"],
+        what_to_track=["loss"],
+        model_type="numpy",
+        verbose=False,
+    )
+    params = {"w": np.random.normal(size=int(model_mb * 2**20 / 8))}
+    step_times = []
+    for step in range(1, num_steps + 1):
+        start_t = time.time()
+        # Compute of the step - in place update of the parameters
+        time.sleep(step_time)
+        params["w"] *= 0.999
+        if step % log_every == 0:
+            if writer is not None:
+                writer.flush()
+                writer.submit(
+                    log, {"num_steps": step}, {"loss": 1 / step}, params, save=True
+                )
+            else:
+                log.update({"num_steps": step}, {"loss": 1 / step}, params, save=True)
+        step_times.append(time.time() - start_t)
+    if writer is not None:
+        writer.close(verbose=False)
+    return np.array(step_times)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num_steps", type=int, default=200)
+    parser.add_argument("--log_every", type=int, default=10)
+    parser.add_argument("--step_time", type=float, default=0.01)
+    parser.add_argument("--model_mb", type=float, default=50)
+    args = parser.parse_args()
+
+    for name in ["sync", "async"]:
+        log_dir = tempfile.mkdtemp()
+        writer = AsyncLogWriter() if name == "async" else None
+        start_t = time.time()
+        step_times = run_training(
+            log_dir,
+            writer,
+            args.num_steps,
+            args.log_every,
+            args.step_time,
+            args.model_mb,
+        )
+        time_elapsed = time.time() - start_t
+        log_steps = step_times[args.log_every - 1 :: args.log_every]
+        print(
+            f"{name:>6}: {time_elapsed:.2f}s total - step mean"
+            f" {1000 * step_times.mean():.1f}ms, log step mean"
+            f" {1000 * log_steps.mean():.1f}ms / max {1000 * log_steps.max():.1f}ms"
+        )
+        shutil.rmtree(log_dir)
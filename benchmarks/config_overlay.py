@@ -0,0 +1,78 @@
+"""Benchmark per-proposal config generation: deepcopy vs. copy-on-write overlay.
+
+Usage: python benchmarks/config_overlay.py --num_proposals 20000 --list_len 1000
+"""
+
+import copy
+import time
+import argparse
+import tracemalloc
+from dotmap import DotMap
+from mle_toolbox.hyperopt.config_overlay import overlay_proposal
+
+
+def deepcopy_configs(base_config: DotMap, proposals: list) -> list:
+    """Previous `gen_hyperparam_configs` path - deepcopy base per proposal."""
+    configs = []
+    for proposal in proposals:
+        sample_config = copy.deepcopy(base_config)
+        for param_name, param_value in proposal.items():
+            config_id, param = param_name.split(":")
+            if config_id == "train":
+                sample_config.train_config[param] = param_value
+            elif config_id == "model":
+                sample_config.model_config[param] = param_value
+        configs.append(sample_config)
+    return configs
+
+
+def overlay_configs(base_config: DotMap, proposals: list) -> list:
+    """Overlay path - share base dict & only store proposed params."""
+    base_dict = base_config.toDict()
+    return [overlay_proposal(base_dict, proposal) for proposal in proposals]
+
+
+def run_benchmark(gen_fn, base_config: DotMap, proposals: list):
+    """Time config generation + dict conversion & track peak memory."""
+    tracemalloc.start()
+    start_t = time.time()
+    configs = gen_fn(base_config, proposals)
+    # Conversion to dict is required before writing the config files
+    for config in configs:
+        config.toDict()
+    total_t = time.time() - start_t
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return total_t, peak / 1024**2
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num_proposals", type=int, default=20000)
+    parser.add_argument("--list_len", type=int, default=1000)
+    args = parser.parse_args()
+
+    base_config = DotMap(
+        {
+            "train_config": {
+                "lrate": 0.1,
+                "num_epochs": 10,
+                "schedule": list(range(args.list_len)),
+                "env_params": {"name": "CartPole-v1", "num_envs": 16},
+            },
+            "model_config": {
+                "layers": [{"units": 64, "act": "relu"}] * 20,
+            },
+            "log_config": {"time_to_track": ["num_updates"]},
+        }
+    )
+    proposals = [
+        {"train:lrate": 0.001 * i, "model:num_layers": i % 5}
+        for i in range(args.num_proposals)
+    ]
+    for name, gen_fn in [("deepcopy", deepcopy_configs), ("overlay", overlay_configs)]:
+        total_t, peak_mb = run_benchmark(gen_fn, base_config, proposals)
+        print(
+            f"{name:>8}: {total_t:.2f}s - peak memory {peak_mb:.1f}MB"
+            f" ({args.num_proposals} proposals)"
+        )
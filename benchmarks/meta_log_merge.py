@@ -0,0 +1,74 @@
+"""Benchmark per-batch meta-log bookkeeping: full re-merge vs. incremental.
+
+Usage: python benchmarks/meta_log_merge.py --num_batches 50 --evals_per_batch 8
+"""
+
+import os
+import time
+import shutil
+import argparse
+import tempfile
+import h5py
+import numpy as np
+from mle_logging import merge_config_logs, load_log
+from mle_toolbox.hyperopt.merge_logs import merge_batch_logs
+
+
+def write_run_log(
+    experiment_dir: str, run_id: str, num_seeds: int, num_steps: int
+) -> None:
+    """Write synthetic seed-merged run log <run_id>/logs/log.hdf5."""
+    log_dir = os.path.join(experiment_dir, run_id, "logs")
+    os.makedirs(log_dir, exist_ok=True)
+    with h5py.File(os.path.join(log_dir, "log.hdf5"), "w") as h5f:
+        for seed_id in range(num_seeds):
+            seed = f"seed_{seed_id}"
+            for k, v in {
+                "experiment_dir": experiment_dir,
+                "config_fname": run_id + ".yaml",
+                "eval_id": run_id,
+                "model_type": "no-model-type",
+                "config_dict": "{}",
+                "log_paths": os.path.join(log_dir, f"log_{seed}.hdf5"),
+            }.items():
+                h5f.create_dataset(f"{seed}/meta/{k}", data=[v.encode()])
+            h5f.create_dataset(f"{seed}/time/num_updates", data=np.arange(num_steps))
+            h5f.create_dataset(f"{seed}/stats/loss", data=np.random.rand(num_steps))
+
+
+def main(num_batches: int, evals_per_batch: int, num_seeds: int, num_steps: int):
+    """Time full vs. incremental merge + load for each search batch."""
+    for mode in ["full", "incremental"]:
+        experiment_dir = tempfile.mkdtemp()
+        all_run_ids, batch_times = [], []
+        for b in range(1, num_batches + 1):
+            run_ids = [f"b_{b}_eval_{i}" for i in range(evals_per_batch)]
+            for run_id in run_ids:
+                write_run_log(experiment_dir, run_id, num_seeds, num_steps)
+            start_t = time.time()
+            if mode == "full":
+                merge_config_logs(experiment_dir, all_run_ids + run_ids)
+                load_log(
+                    os.path.join(experiment_dir, "meta_log.hdf5"),
+                    aggregate_seeds=True,
+                )
+            else:
+                merge_batch_logs(experiment_dir, run_ids)
+            batch_times.append(time.time() - start_t)
+            all_run_ids += run_ids
+        shutil.rmtree(experiment_dir)
+        print(
+            f"{mode:>12} | first batch: {batch_times[0]:.3f}s"
+            f" | last batch: {batch_times[-1]:.3f}s"
+            f" | total: {np.sum(batch_times):.3f}s"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num_batches", type=int, default=50)
+    parser.add_argument("--evals_per_batch", type=int, default=8)
+    parser.add_argument("--num_seeds", type=int, default=2)
+    parser.add_argument("--num_steps", type=int, default=100)
+    args = parser.parse_args()
+    main(args.num_batches, args.evals_per_batch, args.num_seeds, args.num_steps)
@@ -0,0 +1,81 @@
+"""Benchmark local job throughput: fresh python subprocess vs. warm workers.
+
+Usage: python benchmarks/warm_pool.py --num_jobs 40 --max_running_jobs 4
+"""
+
+import os
+import time
+import shutil
+import argparse
+import threading
+import tempfile
+from mle_scheduler import MLEJob
+from mle_toolbox.utils.warm_pool import get_warm_pool
+
+# Short job - startup (imports, config, proxy setup) dominates run time
+job_script = """
+from mle_toolbox import MLExperiment
+
+mle = MLExperiment()
+mle.train_config.lrate * 2
+"""
+
+job_config = """
+train_config:
+  lrate: 0.1
+log_config:
+  time_to_track: [num_updates]
+  what_to_track: [loss]
+  verbose: false
+"""
+
+
+def run_jobs(submit_fn, num_jobs: int, max_running_jobs: int) -> float:
+    """Run `num_jobs` seed jobs w. at most `max_running_jobs` at a time."""
+    start_t = time.time()
+    to_launch, running = list(range(num_jobs)), []
+    while len(to_launch) > 0 or len(running) > 0:
+        while len(to_launch) > 0 and len(running) < max_running_jobs:
+            running.append(submit_fn(to_launch.pop(0)))
+        running = [proc for proc in running if proc.poll() is None]
+        time.sleep(0.01)
+    return time.time() - start_t
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num_jobs", type=int, default=40)
+    parser.add_argument("--max_running_jobs", type=int, default=4)
+    parser.add_argument("--preload", nargs="*", default=[])
+    args = parser.parse_args()
+
+    tmp_dir = tempfile.mkdtemp()
+    job_fname = os.path.join(tmp_dir, "train.py")
+    config_fname = os.path.join(tmp_dir, "config.yaml")
+    with open(job_fname, "w") as f:
+        f.write(job_script + "".join([f"import {m}\n" for m in args.preload]))
+    with open(config_fname, "w") as f:
+        f.write(job_config)
+    experiment_dir = os.path.join(tmp_dir, "experiments")
+
+    def submit_subprocess(seed_id):
+        job = MLEJob("local", job_fname, {}, config_fname, experiment_dir, seed_id)
+        proc = job.schedule()
+        # Drain stdout/stderr pipes like `EvalJobPool` so jobs don't block
+        threading.Thread(target=proc.communicate, daemon=True).start()
+        return proc
+
+    pool = get_warm_pool(args.preload)
+    # Start the fork server (preloading) outside of the timed section
+    pool.submit_job(job_fname, config_fname, experiment_dir, 0).wait()
+
+    def submit_warm(seed_id):
+        return pool.submit_job(job_fname, config_fname, experiment_dir, seed_id)
+
+    for name, submit_fn in [("subprocess", submit_subprocess), ("warm", submit_warm)]:
+        time_elapsed = run_jobs(submit_fn, args.num_jobs, args.max_running_jobs)
+        print(
+            f"{name:>10}: {time_elapsed:.2f}s - "
+            f"{60 * args.num_jobs / time_elapsed:.1f} jobs/min"
+        )
+    shutil.rmtree(tmp_dir)
@@ -20,18 +20,21 @@ def train_your_net(
 @experiment("toy_single_objective/base_config_1.yaml")
 def main(mle):
     """Example training 'loop' using MLE-Logging."""
-    for epoch in range(1, 11):
-        train_loss, test_loss = train_your_net(epoch, **mle.train_config)
-        # Update & save the newest log - only if epoch % log_every_j_steps
-        if mle.ready_to_log(epoch):
-            mle.log.update(
-                {"num_epochs": epoch},
-                {"train_loss": train_loss, "test_loss": test_loss},
-                save=True,
-            )
-    # Generate a sample plot and store it
-    fig = plot_loss(mle.log.stats_log.stats_tracked["train_loss"])
-    mle.log.save_plot(fig)
+    # Loop over seeds - multiple only if launched w. `seeds_per_process`
+    for seed_id in mle.seed_ids:
+        mle.set_seed(seed_id)
+        for epoch in range(1, 11):
+            train_loss, test_loss = train_your_net(epoch, **mle.train_config)
+            # Update & save the newest log - only if epoch % log_every_j_steps
+            if mle.ready_to_log(epoch):
+                mle.log.update(
+                    {"num_epochs": epoch},
+                    {"train_loss": train_loss, "test_loss": test_loss},
+                    save=True,
+                )
+        # Generate a sample plot and store it
+        fig = plot_loss(mle.log.stats_log.stats_tracked["train_loss"])
+        mle.log.save_plot(fig)
     time.sleep(5)
 
 
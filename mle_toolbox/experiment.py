@@ -1,5 +1,9 @@
+import os
+import sys
+import atexit
 from typing import Union
 import functools
+from dotmap import DotMap
 from .utils.core_experiment import (
     load_job_config,
     parse_experiment_args,
@@ -9,6 +13,10 @@ from .utils.core_experiment import (
     mle_config,
 )
 from .utils.helpers import print_framed, get_os_env_ready
+from .utils.batch_resume import get_seed_marker_fname
+from .utils.async_logger import get_async_log_writer
+from .utils.checkpoint import get_checkpoint_manager
+from .utils.profiler import StepProfiler, profile_to_str, write_profile
 from mle_logging import MLELogger
 from mle_logging.load import load_model
 
@@ -25,8 +33,19 @@ class MLExperiment(object):
         log_config: Union[None, dict] = None,
         model_config: Union[None, dict] = None,
         device_config: Union[None, dict] = None,
+        async_logging: Union[bool, dict] = False,
+        async_checkpointing: Union[bool, dict] = False,
+        profile: bool = False,
     ):
-        """Load job configuration for MLE experiment, setup logger & random seeds."""
+        """Load job configuration for MLE experiment, setup logger & random seeds.
+        - `async_logging` (or `log_config.async_logging`) writes logger updates
+          from a background thread (True or `queue_size`/`drop_when_full`)
+        - `async_checkpointing` (or `log_config.async_checkpointing`) writes
+          model ckpts in the background (True or `keep_last`/`num_buffers`)
+        - `profile` (or `log_config.profile`) collects a per-phase timing
+          breakdown (`timer`, `step`) stored as `profile` in the meta log
+          once the job completes (`mark_completed`, also called at exit)
+        """
         setup_proxy_server()
         self.config_fname = config_fname
         self.experiment_dir = experiment_dir
@@ -55,8 +74,19 @@ class MLExperiment(object):
         self.device_config = loaded_configs[3]
         self.extra_config = extra_config
         self.create_jax_prng = create_jax_prng
+        self.async_logging = async_logging
+        self.log_writer = None
+        self.async_checkpointing = async_checkpointing
+        self.ckpt_manager = None
+        self.profiling = profile
+        self.profiler = StepProfiler(enabled=False)
+        self.completed = False
         self.default_seed = seed_id
         self.seed_id = seed_id
+        # Optional: Multiple seeds run in this process (`seeds_per_process`)
+        self.seed_ids = None
+        if cmd_args.seed_ids is not None:
+            self.seed_ids = [int(s) for s in cmd_args.seed_ids.split(",")]
 
         # Get model ckpt path from command line argument or look in config!
         self.model_ckpt_path = cmd_args.model_ckpt_path
@@ -92,6 +122,11 @@ class MLExperiment(object):
                 f"{self.default_seed}."
             )
 
+        # Multi-seed processes start out with their first seed
+        if self.seed_ids is not None:
+            self.train_config.seed_id = self.seed_ids[0]
+            self.log_config.seed_id = self.seed_ids[0]
+
         # Setup the device configuration (cuda visibility, jax, etc)
         if self.device_config is not None:
             get_os_env_ready(**self.device_config)
@@ -137,7 +172,26 @@ class MLExperiment(object):
                     else:
                         self.log_config.wandb_config["group"] = None
 
-        self.log = MLELogger(**self.log_config)
+        # Optional: Background writer thread for logger updates
+        if "async_logging" in self.log_config.keys():
+            self.async_logging = self.log_config.pop("async_logging")
+        self.log_writer = get_async_log_writer(self.async_logging)
+        if "async_checkpointing" in self.log_config.keys():
+            self.async_checkpointing = self.log_config.pop("async_checkpointing")
+        self.ckpt_manager = get_checkpoint_manager(self.async_checkpointing)
+        if "profile" in self.log_config.keys():
+            self.profiling = self.log_config.pop("profile")
+        self.profiler = StepProfiler(enabled=bool(self.profiling))
+
+        # One logger per seed - each writes its own `log_seed_<id>.hdf5`
+        if self.seed_ids is None:
+            self.seed_ids = [self.seed_id]
+        self.logs = {}
+        for seed_id in self.seed_ids:
+            seed_log_config = DotMap(self.log_config.toDict(), _dynamic=False)
+            seed_log_config.seed_id = seed_id
+            self.logs[seed_id] = MLELogger(**seed_log_config)
+        self.log = self.logs[self.seed_id]
 
         # Load model if checkpoint is provided
         if self.model_ckpt_path is not None:
@@ -147,6 +201,9 @@ class MLExperiment(object):
         else:
             self.model_ckpt = None
 
+        # Mark seeds completed at process exit - also w/o `experiment` decorator
+        atexit.register(self.complete_at_exit)
+
     def update_log(
         self,
         clock_tick: dict,
@@ -155,15 +212,123 @@ class MLExperiment(object):
         plot_fig=None,
         extra_obj=None,
         save=False,
+        seed_id: Union[int, None] = None,
     ) -> None:
-        """Update the MLE_Logger instance with stats, model params & save."""
-        self.log.update(
-            clock_tick, stats_tick, model, plot_fig, extra_obj, save
-        )
+        """Update the MLE_Logger instance with stats, model params & save.
+        - `seed_id` selects the seed's logger (default: current seed)
+        - With async logging the update is queued for the writer thread
+        - With async checkpointing the model is snapshotted & written in the
+          background to the same final ckpt path (see `wait_for_checkpoints`)
+        """
+        log = self.log if seed_id is None else self.logs[seed_id]
+        if (
+            model is not None
+            and self.ckpt_manager is not None
+            and self.ckpt_manager.supports(log)
+        ):
+            with self.profiler.phase("checkpointing"):
+                self.ckpt_manager.save_log_model(log, model)
+            model = None
+        with self.profiler.phase("logging"):
+            if self.log_writer is not None:
+                self.log_writer.submit(
+                    log, clock_tick, stats_tick, model, plot_fig, extra_obj, save
+                )
+            else:
+                log.update(
+                    clock_tick,
+                    stats_tick,
+                    model=model,
+                    plot_fig=plot_fig,
+                    extra_obj=extra_obj,
+                    save=save,
+                )
+
+    def flush_log(self) -> None:
+        """Wait until all queued async logger updates are written."""
+        if self.log_writer is not None:
+            with self.profiler.phase("logging"):
+                self.log_writer.flush()
+
+    def wait_for_checkpoints(self) -> None:
+        """Wait until all background model checkpoints are written."""
+        if self.ckpt_manager is not None:
+            with self.profiler.phase("checkpointing"):
+                self.ckpt_manager.wait()
+
+    def timer(self, name: str):
+        """Time a phase of the job (no-op unless profiling is enabled).
+        Usage:
+            with mle.timer("data"):
+                batch = next(loader)
+            with mle.timer("train"):
+                loss = train_step(batch)
+            mle.step()
+        """
+        return self.profiler.phase(name)
+
+    def step(self, num_steps: int = 1) -> None:
+        """Step hook - count training steps for the profiled throughput."""
+        self.profiler.step(num_steps)
+
+    def save_profile(self) -> None:
+        """Write profile summary into the meta log of all seeds in process."""
+        if not self.profiler.enabled:
+            return
+        profile = self.profiler.summary()
+        for log in self.logs.values():
+            write_profile(log, profile)
+        print_framed(f"PROFILE - {profile_to_str(profile)}")
+
+    def set_seed(self, seed_id: int):
+        """Switch to another seed of the process - reseed & select its logger.
+        Usage (sequential seeds in one process):
+            for seed_id in mle.seed_ids:
+                mle.set_seed(seed_id)
+                ...
+                mle.update_log(time_tic, stats_tic)
+        Returns a JAX PRNG key if `create_jax_prng` is set.
+        """
+        assert seed_id in self.logs.keys(), f"Seed {seed_id} not in process."
+        self.seed_id = seed_id
+        self.train_config.seed_id = seed_id
+        self.log = self.logs[seed_id]
+        if self.create_jax_prng:
+            self.rng = set_random_seeds(seed_id, return_key=True)
+            return self.rng
+        set_random_seeds(seed_id)
 
     def ready_to_log(self, update_counter: int) -> bool:
-        """Check whether update_counter is modulo of log_every_k_steps in logger."""
-        return self.log.ready_to_log(update_counter)
+        """Check whether update_counter is modulo of log_every_k_steps in logger.
+        - Async logging: flushes the previous log step before the next one
+        """
+        ready = self.log.ready_to_log(update_counter)
+        if ready:
+            self.flush_log()
+        return ready
+
+    def mark_completed(self) -> None:
+        """Mark seed runs as completed - resumed search batches skip them."""
+        if self.completed:
+            return
+        self.completed = True
+        atexit.unregister(self.complete_at_exit)
+        if self.log_writer is not None:
+            self.log_writer.close()
+        self.wait_for_checkpoints()
+        if self.ckpt_manager is not None and self.ckpt_manager.num_saved > 0:
+            print(self.ckpt_manager.summary())
+        self.save_profile()
+        os.makedirs(self.log.experiment_dir, exist_ok=True)
+        for seed_id in self.seed_ids:
+            marker_fname = get_seed_marker_fname(self.log.experiment_dir, seed_id)
+            open(marker_fname, "w").close()
+
+    def complete_at_exit(self) -> None:
+        """Exit hook: mark seeds completed unless job died w. an exception."""
+        # Interpreter sets `sys.last_value` for unhandled exceptions
+        if not hasattr(sys, "last_value"):
+            self.mark_completed()
 
 
 def experiment(
@@ -209,6 +374,8 @@ def experiment(
         @functools.wraps(function)
         def wrapper(*args, **kwargs):
             result = function(mle, *args, **kwargs)
+            if hasattr(mle, "log"):
+                mle.mark_completed()
             return result
 
         return wrapper
@@ -0,0 +1,65 @@
+from typing import Union
+from mle_hyperopt.utils import merge_config_dicts
+
+
+class ConfigOverlay(object):
+    def __init__(self, base_dict: dict):
+        """Copy-on-write config: shares base & stores only overridden keys.
+        - `overrides` maps (section, key) to value. Section `None` is top-level.
+        - Only overridden sections are copied (shallowly) when serialising.
+        """
+        self.base_dict = base_dict
+        self.overrides = {}
+
+    def set(self, section: Union[str, None], key: str, value) -> None:
+        """Override a single key of a config section (or top-level)."""
+        self.overrides[(section, key)] = value
+
+    def get(self, section: Union[str, None], key: str, default=None):
+        """Get value of a key - overridden value or otherwise base value."""
+        if (section, key) in self.overrides.keys():
+            return self.overrides[(section, key)]
+        if section is None:
+            return self.base_dict.get(key, default)
+        return self.base_dict.get(section, {}).get(key, default)
+
+    def toDict(self) -> dict:
+        """Get plain dict for writing to file - untouched parts are shared."""
+        config_dict = dict(self.base_dict)
+        copied_sections = []
+        for (section, key), value in self.overrides.items():
+            if section is None:
+                config_dict[key] = value
+                continue
+            if section not in copied_sections:
+                config_dict[section] = dict(config_dict.get(section, {}))
+                copied_sections.append(section)
+            config_dict[section][key] = value
+        return config_dict
+
+
+def overlay_proposal(base_dict: dict, proposal: dict) -> ConfigOverlay:
+    """Construct config overlay from base config dict & a single proposal."""
+    sample_config = ConfigOverlay(base_dict)
+    for param_name, param_value in proposal.items():
+        # Differentiate between model_config & train_config params
+        if "train_config" in base_dict.keys():
+            if len(param_name.split(":")) == 2:
+                config_id, param = param_name.split(":")
+                if config_id == "train":
+                    sample_config.set("train_config", param, param_value)
+                elif config_id == "model":
+                    sample_config.set("model_config", param, param_value)
+            # Merge nested config dictionaries
+            elif type(param_value) == dict:
+                base_value = sample_config.get("train_config", param_name, {})
+                sample_config.set(
+                    "train_config",
+                    param_name,
+                    dict(merge_config_dicts(base_value, param_value)),
+                )
+            else:
+                sample_config.set("train_config", param_name, param_value)
+        else:
+            sample_config.set(None, param_name, param_value)
+    return sample_config
@@ -0,0 +1,161 @@
+import os
+import glob
+import time
+import h5py
+import numpy as np
+from typing import List, Union
+
+
+class PercentileStoppingRule(object):
+    def __init__(self, percentile: float = 50.0, min_steps: int = 5, min_runs: int = 3):
+        """Stop run if it is not within best `percentile`% of reference runs.
+        - Compares running mean of the metric up to the same logged step
+        - Requires `min_steps` logged values & `min_runs` reference curves
+        """
+        self.percentile = percentile
+        self.min_steps = min_steps
+        self.min_runs = min_runs
+
+    def should_stop(
+        self, curve: np.ndarray, ref_curves: List[np.ndarray], max_objective: bool
+    ) -> bool:
+        """Check if intermediate curve is losing against reference curves."""
+        num_steps = len(curve)
+        if num_steps < self.min_steps:
+            return False
+        ref_curves = [c for c in ref_curves if len(c) >= num_steps]
+        if len(ref_curves) < self.min_runs:
+            return False
+        score = np.nanmean(curve)
+        ref_scores = [np.nanmean(c[:num_steps]) for c in ref_curves]
+        if max_objective:
+            return score < np.nanpercentile(ref_scores, 100 - self.percentile)
+        return score > np.nanpercentile(ref_scores, self.percentile)
+
+
+class MedianStoppingRule(PercentileStoppingRule):
+    def __init__(self, min_steps: int = 5, min_runs: int = 3):
+        """Stop run if running mean is worse than median of other runs."""
+        super().__init__(50.0, min_steps, min_runs)
+
+
+class CurveExtrapolationRule(object):
+    def __init__(
+        self,
+        final_step: Union[int, None] = None,
+        min_steps: int = 5,
+        min_runs: int = 1,
+    ):
+        """Stop run if log-linear fit of its curve can't beat the best run.
+        - Fits `a + b * log(step)` to the intermediate values
+        - Predicts value at `final_step` (default: longest reference curve)
+        """
+        self.final_step = final_step
+        self.min_steps = min_steps
+        self.min_runs = min_runs
+
+    def should_stop(
+        self, curve: np.ndarray, ref_curves: List[np.ndarray], max_objective: bool
+    ) -> bool:
+        """Check if extrapolated final value is worse than best final value."""
+        if len(curve) < self.min_steps or len(ref_curves) < self.min_runs:
+            return False
+        final_step = self.final_step
+        if final_step is None:
+            final_step = max([len(c) for c in ref_curves])
+        if len(curve) >= final_step:
+            return False
+        steps = np.arange(1, len(curve) + 1)
+        valid = np.isfinite(curve)
+        if valid.sum() < 2:
+            return False
+        b, a = np.polyfit(np.log(steps[valid]), curve[valid], 1)
+        prediction = a + b * np.log(final_step)
+        ref_finals = [c[-1] for c in ref_curves]
+        if max_objective:
+            return prediction < np.nanmax(ref_finals)
+        return prediction > np.nanmin(ref_finals)
+
+
+StoppingRules = {
+    "median": MedianStoppingRule,
+    "percentile": PercentileStoppingRule,
+    "extrapolation": CurveExtrapolationRule,
+}
+
+
+class EarlyStopper(object):
+    def __init__(
+        self,
+        experiment_dir: str,
+        max_objective: bool,
+        metric: str,
+        rule: str = "median",
+        check_every: float = 30.0,
+        **rule_kwargs,
+    ):
+        """Read intermediate seed logs of running evals & flag losing runs.
+        - Curves are averaged over the available seed logs of a run
+        - Completed runs are kept as reference curves for the stopping rule
+        - Checks are rate limited to once every `check_every` seconds
+        """
+        assert rule in StoppingRules.keys(), f"Stopping rule {rule} unknown."
+        self.experiment_dir = experiment_dir
+        self.max_objective = max_objective
+        self.metric = metric
+        self.rule = StoppingRules[rule](**rule_kwargs)
+        self.check_every = check_every
+        self.last_check_t = 0.0
+        self.completed_curves = {}
+        self.stopped_run_ids = []
+
+    def read_curve(self, run_id: str) -> Union[np.ndarray, None]:
+        """Seed-averaged intermediate metric curve (None if nothing logged)."""
+        log_dir = os.path.join(self.experiment_dir, run_id, "logs")
+        seed_curves = []
+        for log_path in glob.glob(os.path.join(log_dir, "log_*.hdf5")):
+            # Logs are rewritten on every save - skip files mid-write
+            try:
+                with h5py.File(log_path, "r") as h5f:
+                    for seed_id in h5f.keys():
+                        seed_curves.append(
+                            np.asarray(h5f[seed_id]["stats"][self.metric][:], float)
+                        )
+            except Exception:
+                continue
+        seed_curves = [c for c in seed_curves if len(c) > 0]
+        if len(seed_curves) == 0:
+            return None
+        # Pad ragged seed curves - average over seeds reaching each step
+        num_steps = max([len(c) for c in seed_curves])
+        padded = np.full((len(seed_curves), num_steps), np.nan)
+        for i, c in enumerate(seed_curves):
+            padded[i, : len(c)] = c
+        return np.nanmean(padded, axis=0)
+
+    def add_completed(self, run_id: str) -> None:
+        """Store curve of completed run as reference (before seed merging)."""
+        curve = self.read_curve(run_id)
+        if curve is not None:
+            self.completed_curves[run_id] = curve
+
+    def check(self, running_run_ids: List[str]) -> List[str]:
+        """Return running evals which should be stopped according to rule."""
+        if time.time() - self.last_check_t < self.check_every:
+            return []
+        self.last_check_t = time.time()
+        running_curves = {}
+        for run_id in running_run_ids:
+            curve = self.read_curve(run_id)
+            if curve is not None:
+                running_curves[run_id] = curve
+
+        to_stop = []
+        for run_id, curve in running_curves.items():
+            ref_curves = list(self.completed_curves.values()) + [
+                c for r, c in running_curves.items() if r != run_id
+            ]
+            if self.rule.should_stop(curve, ref_curves, self.max_objective):
+                to_stop.append(run_id)
+        self.stopped_run_ids += to_stop
+        return to_stop
@@ -0,0 +1,98 @@
+import os
+import json
+import pickle
+import hashlib
+import numpy as np
+from typing import List, Union
+
+
+class EvalCache(object):
+    def __init__(
+        self,
+        cache_dir: str,
+        job_fname: str,
+        base_config: dict,
+        scoring: dict,
+    ):
+        """Persistent evaluation cache shared across searches/experiments.
+        - Key: hash of (training script, base config, proposal, seeds)
+        - Entries store scores & run meta data - one .pkl file per eval
+        - Entries are only hits if they were scored the same way
+        """
+        self.cache_dir = os.path.expanduser(cache_dir)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # Hash script content - edits to the training code invalidate cache
+        if os.path.exists(job_fname):
+            with open(job_fname, "rb") as f:
+                self.script_hash = hashlib.sha256(f.read()).hexdigest()
+        else:
+            self.script_hash = job_fname
+        self.base_config_hash = canonical_hash(base_config)
+        self.scoring = scoring
+        self.hits, self.misses = 0, 0
+
+    def get_key(self, proposal: dict, seeds: List[int]) -> str:
+        """Canonical hash of a single evaluation."""
+        return canonical_hash(
+            {
+                "script": self.script_hash,
+                "base_config": self.base_config_hash,
+                "proposal": proposal,
+                "seeds": sorted([int(s) for s in seeds]),
+            }
+        )
+
+    def lookup(self, proposal: dict, seeds: List[int]) -> Union[dict, None]:
+        """Get stored evaluation (scores & meta) or None - count hit/miss."""
+        cache_fname = os.path.join(
+            self.cache_dir, self.get_key(proposal, seeds) + ".pkl"
+        )
+        entry = None
+        if os.path.exists(cache_fname):
+            try:
+                with open(cache_fname, "rb") as f:
+                    entry = pickle.load(f)
+            except Exception:
+                entry = None
+        if entry is not None and entry["scoring"] == self.scoring:
+            self.hits += 1
+            return entry
+        self.misses += 1
+        return None
+
+    def store(self, proposal: dict, seeds: List[int], eval_iter: dict) -> None:
+        """Store scores & meta data of completed evaluation (atomic write)."""
+        entry = {
+            "scoring": self.scoring,
+            "scores": {m: eval_iter[m] for m in self.scoring["eval_metrics"]},
+            "meta": {
+                k: v
+                for k, v in eval_iter.items()
+                if k not in ["params", "time_elapsed", "run_id"]
+                and k not in self.scoring["eval_metrics"]
+            },
+        }
+        cache_fname = os.path.join(
+            self.cache_dir, self.get_key(proposal, seeds) + ".pkl"
+        )
+        tmp_fname = cache_fname + f".{os.getpid()}.tmp"
+        with open(tmp_fname, "wb") as f:
+            pickle.dump(entry, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_fname, cache_fname)
+
+    def reset_counters(self) -> None:
+        """Reset hit/miss counters (e.g. at start of a batch)."""
+        self.hits, self.misses = 0, 0
+
+
+def canonical_hash(obj) -> str:
+    """Order-independent sha256 hash of json-serializable (nested) dict."""
+    obj_str = json.dumps(obj, sort_keys=True, default=to_serializable)
+    return hashlib.sha256(obj_str.encode()).hexdigest()
+
+
+def to_serializable(obj):
+    """Convert numpy scalars to python types - otherwise use string repr."""
+    if isinstance(obj, np.generic):
+        return obj.item()
+    return str(obj)
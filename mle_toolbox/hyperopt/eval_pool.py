@@ -0,0 +1,229 @@
+import os
+import time
+import threading
+import subprocess as sp
+from typing import List, Tuple, Union
+from mle_scheduler import MLEJob
+from mle_toolbox import mle_config
+from ..utils.warm_pool import use_warm_pool, get_warm_pool
+from ..utils.job_queue import use_seeds_per_process, add_seed_ids_arg
+
+
+class JobBudget(object):
+    def __init__(self, max_running_jobs: int):
+        """Thread-safe count of running jobs shared by concurrent searches.
+        - Hold `lock` while checking & launching to not oversubscribe slots
+        """
+        self.max_running_jobs = max_running_jobs
+        self.num_running_jobs = 0
+        self.lock = threading.RLock()
+
+    def can_launch(self, num_jobs: int) -> bool:
+        """Check if enough slots are free - always launch into empty budget."""
+        with self.lock:
+            if self.num_running_jobs == 0:
+                return True
+            return self.num_running_jobs + num_jobs <= self.max_running_jobs
+
+    def acquire(self, num_jobs: int) -> None:
+        """Occupy slots for newly launched jobs."""
+        with self.lock:
+            self.num_running_jobs += num_jobs
+
+    def release(self, num_jobs: int) -> None:
+        """Free slots of completed/stopped jobs."""
+        with self.lock:
+            self.num_running_jobs -= num_jobs
+
+
+class EvalJobPool(object):
+    def __init__(
+        self,
+        resource_to_run: str,
+        job_fname: str,
+        job_arguments: dict,
+        experiment_dir: str,
+        max_running_jobs: int,
+        debug_mode: bool = False,
+        budget: Union[JobBudget, None] = None,
+    ):
+        """Slot-based pool launching & monitoring seed jobs of single evals.
+        - Each seed of an evaluation occupies one of `max_running_jobs` slots
+        - `poll` returns evals for which all seed jobs have completed
+        - A shared `budget` limits running jobs across multiple pools
+        """
+        self.resource_to_run = resource_to_run
+        self.job_fname = job_fname
+        self.job_arguments = job_arguments.copy()
+        self.experiment_dir = experiment_dir
+        self.max_running_jobs = max_running_jobs
+        self.debug_mode = debug_mode
+
+        # Extract extra_cmd_line_input from job_arguments (passed to MLEJob)
+        if "extra_cmd_line_input" in self.job_arguments.keys():
+            self.extra_cmd_line_input = self.job_arguments["extra_cmd_line_input"]
+            del self.job_arguments["extra_cmd_line_input"]
+        else:
+            self.extra_cmd_line_input = None
+
+        # Local seed jobs can run in pre-forked warm workers
+        self.warm_pool = None
+        if use_warm_pool(resource_to_run, self.job_arguments):
+            self.warm_pool = get_warm_pool(self.job_arguments.get("warm_pool_preload"))
+        # Optionally run all seeds of an eval (launch) in a single job
+        self.seeds_per_process = use_seeds_per_process(self.job_arguments)
+
+        # Slots are private unless budget is shared with other searches
+        if budget is None:
+            budget = JobBudget(max_running_jobs)
+        self.budget = budget
+
+        # Running evals: run_id -> launched seed jobs & start time
+        self.running = {}
+        # Track slot-seconds of completed jobs for utilisation reporting
+        self.busy_time = 0.0
+        self.start_t = time.time()
+
+    def launch(self, run_id: str, config_fname: str, seeds: List[int]) -> None:
+        """Launch one job per seed (or seed group) for a single eval config."""
+        jobs = []
+        if self.seeds_per_process:
+            seed_groups = [list(seeds)]
+        else:
+            seed_groups = [[seed_id] for seed_id in seeds]
+        self.budget.acquire(len(seed_groups))
+        for group in seed_groups:
+            seed_id = group[0]
+            extra_cmd_line_input = self.extra_cmd_line_input
+            if self.seeds_per_process:
+                extra_cmd_line_input = add_seed_ids_arg(extra_cmd_line_input, group)
+            if self.warm_pool is not None:
+                # Per-job stdout/stderr files in run dir (debug mode only)
+                log_dir = None
+                if self.debug_mode:
+                    log_dir = os.path.join(self.experiment_dir, run_id)
+                job = None
+                job_id = self.warm_pool.submit_job(
+                    self.job_fname,
+                    config_fname,
+                    self.experiment_dir,
+                    seed_id,
+                    extra_cmd_line_input,
+                    log_dir,
+                )
+            else:
+                job = MLEJob(
+                    self.resource_to_run,
+                    self.job_fname,
+                    self.job_arguments,
+                    config_fname,
+                    self.experiment_dir,
+                    seed_id,
+                    extra_cmd_line_input,
+                    False,
+                    self.debug_mode,
+                    mle_config.gcp,
+                )
+                job_id = job.schedule()
+                # Drain stdout/stderr pipes of local processes so they don't block
+                if self.resource_to_run == "local":
+                    threading.Thread(target=job_id.communicate, daemon=True).start()
+            jobs.append(
+                {
+                    "job": job,
+                    "job_id": job_id,
+                    "seed_ids": group,
+                    "start_t": time.time(),
+                    "done": False,
+                }
+            )
+        self.running[run_id] = {
+            "config_fname": config_fname,
+            "jobs": jobs,
+            "start_t": time.time(),
+        }
+
+    def poll(self) -> List[Tuple[str, float]]:
+        """Check running jobs & return (run_id, time) of completed evals."""
+        completed = []
+        for run_id in list(self.running.keys()):
+            eval_jobs = self.running[run_id]["jobs"]
+            for job in eval_jobs:
+                if not job["done"] and not job_is_running(
+                    self.resource_to_run, job["job"], job["job_id"]
+                ):
+                    job["done"] = True
+                    self.busy_time += time.time() - job["start_t"]
+                    self.budget.release(1)
+                    # Clean up after job completion (e.g. VM instance)
+                    if not self.debug_mode and job["job"] is not None:
+                        job["job"].clean_up(job["job_id"])
+            if all([job["done"] for job in eval_jobs]):
+                time_elapsed = time.time() - self.running[run_id]["start_t"]
+                completed.append((run_id, time_elapsed))
+                del self.running[run_id]
+        return completed
+
+    def stop(self, run_id: str) -> float:
+        """Kill remaining seed jobs of an eval & return its time elapsed."""
+        for job in self.running[run_id]["jobs"]:
+            if not job["done"]:
+                kill_job(self.resource_to_run, job["job_id"])
+                job["done"] = True
+                self.busy_time += time.time() - job["start_t"]
+                self.budget.release(1)
+        time_elapsed = time.time() - self.running[run_id]["start_t"]
+        del self.running[run_id]
+        return time_elapsed
+
+    def can_launch(self, num_seeds: int) -> bool:
+        """Check if enough slots of (shared) budget are free to launch seeds."""
+        if self.seeds_per_process:
+            return self.budget.can_launch(1)
+        return self.budget.can_launch(num_seeds)
+
+    @property
+    def num_running_jobs(self) -> int:
+        """Number of launched seed jobs that have not completed yet."""
+        return sum(
+            [
+                len([j for j in v["jobs"] if not j["done"]])
+                for v in self.running.values()
+            ]
+        )
+
+    @property
+    def slot_utilisation(self) -> float:
+        """Fraction of slot-time used by running jobs since pool start."""
+        running_time = sum(
+            [
+                time.time() - j["start_t"]
+                for v in self.running.values()
+                for j in v["jobs"]
+                if not j["done"]
+            ]
+        )
+        total_time = self.max_running_jobs * (time.time() - self.start_t)
+        return (self.busy_time + running_time) / max(total_time, 1e-08)
+
+
+def job_is_running(resource_to_run: str, job: MLEJob, job_id: Union[str, int]) -> bool:
+    """Non-blocking status check of a single scheduled job."""
+    if resource_to_run == "local":
+        return job_id.poll() is None
+    return job.monitor(job_id, False) == 1
+
+
+def kill_job(resource_to_run: str, job_id: Union[sp.Popen, str, int]) -> None:
+    """Terminate a single scheduled job (local process or cluster job)."""
+    if resource_to_run == "local":
+        # Jobs are launched via shell - terminate python child processes too
+        try:
+            sp.run(["pkill", "-TERM", "-P", str(job_id.pid)], stderr=sp.DEVNULL)
+        except FileNotFoundError:
+            pass
+        job_id.terminate()
+    elif resource_to_run == "sge-cluster":
+        sp.run(["qdel", str(job_id)], stdout=sp.DEVNULL, stderr=sp.DEVNULL)
+    elif resource_to_run == "slurm-cluster":
+        sp.run(["scancel", str(job_id)], stdout=sp.DEVNULL, stderr=sp.DEVNULL)
@@ -1,8 +1,12 @@
 import os
+import bisect
 import numpy as np
 import logging
 from typing import Union, List
-from ..utils import load_pkl_object, save_pkl_object, print_framed
+from ..utils import save_pkl_object, print_framed
+from ..utils.hyper_log import load_pkl_hyper_log
+from ..utils.hyper_journal import HyperLogJournal, get_journal_fname
+from ..utils.profiler import get_throughput
 
 
 class HyperoptLogger(object):
@@ -15,6 +19,9 @@ class HyperoptLogger(object):
         eval_metrics: Union[str, list] = [],  # Metric names stored
         reload_log: bool = False,  # Reload previous log
         no_results_logging: bool = False,  # .hdf5 run logging
+        use_journal: bool = False,  # Append evals instead of re-pickling
+        compact_every: int = 100,  # Journal records before compaction
+        top_k: int = 5,  # No. of leaders tracked per metric
     ):
         """Mini-class to log the"""
         self.hyperlog_fname = hyperlog_fname  # Where to save the log to
@@ -35,6 +42,11 @@ class HyperoptLogger(object):
             self.eval_metrics = [self.eval_metrics]
         # Want to not log metrics? - Don't need to rely on meta_log setup
         self.no_results_logging = no_results_logging
+        # Journaled storage: snapshot .pkl + appended record per evaluation
+        if use_journal:
+            self.journal = HyperLogJournal(self.hyperlog_fname, compact_every)
+        else:
+            self.journal = None
 
         # Instantiate the meta-logger
         self.logger = logging.getLogger(__name__)
@@ -50,6 +62,10 @@ class HyperoptLogger(object):
             )
             self.logger.info(f"Metrics: {self.eval_metrics}")
 
+        # Top-k (sort key, iter_id) per metric - best score first
+        self.top_k = max(top_k, 1)
+        self.leaderboard = {}
+
         # Reload previous log if desired!
         if reload_log:
             self.reload_log()
@@ -61,10 +77,11 @@ class HyperoptLogger(object):
             self.all_evaluated_params = []  # All evaluated parameters
             self.reloaded = False
         self.batch_id = 0  # Batch evaluation tracker
+        self.saved_iter_id = self.iter_id  # Last eval stored in journal
 
         print_framed("HYPEROPT LOGGER INITIALIZED")
 
-    def update_log(self, params, meta_eval_log, time_elapsed, run_ids):
+    def update_log(self, params, meta_eval_log, time_elapsed, run_ids, truncated=False):
         """Update  log dictionary with the most recent result dictionary"""
         # Update the batch evaluation counter
         self.batch_id += 1
@@ -101,6 +118,9 @@ class HyperoptLogger(object):
                 "time_elapsed": time_elapsed,
                 "run_id": run_ids[iter],
             }
+            # Mark evals stopped early - scores are based on partial logs
+            if truncated:
+                current_iter["truncated"] = True
             if not self.no_results_logging:
                 # Add all of the individual tracked metrics
                 for k, v in perf_measures.items():
@@ -112,6 +132,11 @@ class HyperoptLogger(object):
                     except Exception:
                         continue
 
+                # Profiled throughput (steps/sec) if jobs ran w. `profile`
+                throughput = get_throughput(meta_eval_log[run_ids[iter]].meta)
+                if throughput is not None:
+                    current_iter["throughput"] = throughput
+
                 # Add collected log path (after merging seeds)
                 current_iter["log_fname"] = os.path.join(
                     current_iter["experiment_dir"],
@@ -136,18 +161,72 @@ class HyperoptLogger(object):
             ckpts = None
 
         if not self.no_results_logging:
-            # Update best performance tracker
+            # Update best performance tracker with new evals only
+            new_iter_ids = range(self.iter_id - len(params) + 1, self.iter_id + 1)
+            self.update_leaderboard(new_iter_ids, perf_measures.keys())
             self.best_per_metric = self.get_best_performances(perf_measures.keys())
         return perf_measures, ckpts
 
+    def update_log_cached(self, params, cached_evals, run_ids):
+        """Add evals answered from evaluation cache (stored scores & meta)"""
+        perf_measures = {metric: {} for metric in self.eval_metrics}
+        ckpts = []
+        for iter in range(len(params)):
+            self.iter_id += 1
+            current_iter = {
+                "params": params[iter],
+                "time_elapsed": 0.0,
+                "run_id": run_ids[iter],
+            }
+            for k, v in cached_evals[iter]["scores"].items():
+                current_iter[k] = v
+                perf_measures[k][run_ids[iter]] = v
+            # Meta data (log paths, ckpt, etc.) point to the original run
+            current_iter.update(cached_evals[iter]["meta"])
+            if "model_ckpt" in current_iter.keys():
+                ckpts.append(current_iter["model_ckpt"])
+            self.opt_log[self.iter_id] = current_iter
+            self.all_evaluated_params.append(params[iter])
+        self.all_run_ids += run_ids
+
+        # Return None if no checkpoints where found in log
+        if len(ckpts) == 0:
+            ckpts = None
+
+        new_iter_ids = range(self.iter_id - len(params) + 1, self.iter_id + 1)
+        self.update_leaderboard(new_iter_ids, self.eval_metrics)
+        self.best_per_metric = self.get_best_performances(self.eval_metrics)
+        return perf_measures, ckpts
+
     def save_log(self):
         """Save current state of hyperparameter optimization as .pkl file"""
-        save_pkl_object(self.opt_log, self.hyperlog_fname)
+        if self.journal is None:
+            save_pkl_object(self.opt_log, self.hyperlog_fname)
+            # Full .pkl supersedes journal of a previously journaled search
+            if os.path.exists(get_journal_fname(self.hyperlog_fname)):
+                os.remove(get_journal_fname(self.hyperlog_fname))
+            return
+        # Fresh log overwrites previous files - afterwards only append evals
+        if self.saved_iter_id == 0:
+            self.journal.compact(self.opt_log)
+        else:
+            new_evals = {
+                i: self.opt_log[i]
+                for i in range(self.saved_iter_id + 1, self.iter_id + 1)
+            }
+            self.journal.append(new_evals)
+            if self.journal.compaction_due:
+                self.journal.compact(self.opt_log)
+        self.saved_iter_id = self.iter_id
 
     def reload_log(self):
         """Reload the previously stored .pkl log file"""
         try:
-            self.opt_log = load_pkl_object(self.hyperlog_fname)
+            if self.journal is None:
+                self.opt_log = load_pkl_hyper_log(self.hyperlog_fname)
+            else:
+                self.opt_log = self.journal.load()
+                assert len(self.opt_log) > 0
             self.all_evaluated_params = []
             self.all_run_ids = []
             for key, eval_iter in self.opt_log.items():
@@ -164,27 +243,64 @@ class HyperoptLogger(object):
 
         # Get best performing params for each eval metric
         if not self.no_results_logging:
+            self.leaderboard = {}
+            self.update_leaderboard(self.opt_log.keys(), self.eval_metrics)
             self.best_per_metric = self.get_best_performances(self.eval_metrics)
 
+    def update_leaderboard(self, iter_ids, eval_metrics):
+        """Insert new evals into top-k leaderboard of each metric"""
+        for metric in eval_metrics:
+            board = self.leaderboard.setdefault(metric, [])
+            for iter_id in iter_ids:
+                score = self.opt_log[iter_id][metric]
+                # Sort ascending - ties are won by the earlier evaluation
+                sort_key = -score if self.max_objective else score
+                bisect.insort(board, (sort_key, iter_id))
+            del board[self.top_k :]
+
+    def get_leaderboard(self, metric: str, top_k: Union[int, None] = None):
+        """Get current top-k evals for a metric (best first)"""
+        leaders = []
+        for _, iter_id in self.leaderboard.get(metric, [])[:top_k]:
+            leaders.append(
+                {
+                    "iter_id": iter_id,
+                    "run_id": self.opt_log[iter_id]["run_id"],
+                    "score": self.opt_log[iter_id][metric],
+                    "params": self.opt_log[iter_id]["params"],
+                }
+            )
+        return leaders
+
+    def rank_by_throughput(self, top_k: Union[int, None] = None):
+        """Rank profiled evals by throughput (steps/sec, fastest first)"""
+        profiled = [
+            (iter_id, eval_iter)
+            for iter_id, eval_iter in self.opt_log.items()
+            if "throughput" in eval_iter.keys()
+        ]
+        profiled.sort(key=lambda x: -x[1]["throughput"])
+        return [
+            {
+                "iter_id": iter_id,
+                "run_id": eval_iter["run_id"],
+                "throughput": eval_iter["throughput"],
+                "params": eval_iter["params"],
+            }
+            for iter_id, eval_iter in profiled[:top_k]
+        ]
+
     def get_best_performances(self, eval_metrics):
         """Get best performing hyperparam configuration up to current iter"""
-        # Loop over all iterations and get best score for each metric
+        # Read off leader for each metric - no rescan of full log
         best_performances = {}
         for metric in eval_metrics:
-            all_scores = []
-            if len(self.opt_log.items()) > 0:
-                for iter_id, iter_values in self.opt_log.items():
-                    all_scores.append(iter_values[metric])
-                if self.max_objective:
-                    best_id = np.argmax(all_scores) + 1
-                else:
-                    best_id = np.argmin(all_scores) + 1
-                best_score = self.opt_log[best_id][metric]
-                best_params = self.opt_log[best_id]["params"]
+            leaders = self.get_leaderboard(metric, 1)
+            if len(leaders) > 0:
                 best_performances[metric] = {
-                    "run_id": best_id,
-                    "score": best_score,
-                    "params": best_params,
+                    "run_id": leaders[0]["iter_id"],
+                    "score": leaders[0]["score"],
+                    "params": leaders[0]["params"],
                 }
             else:
                 best_performances[metric] = {
@@ -227,6 +343,36 @@ def evaluate_hyperparams(
     return perf_scores
 
 
+def stack_metric_series(
+    eval_logs,
+    eval_metrics: List[str],
+    run_ids: List[str],
+    aggregate_seeds: str = "mean",
+):
+    """Stack seed-aggregated metric series of all runs into padded arrays.
+    OUT: dict of [num_runs, max_len] arrays (nan-padded) & length masks
+    """
+    # Single pass over runs - index nested run stats only once per run
+    series = {metric: [] for metric in eval_metrics}
+    for run in run_ids:
+        run_stats = eval_logs[run]["stats"]
+        for metric in eval_metrics:
+            series[metric].append(np.asarray(run_stats[metric][aggregate_seeds]))
+
+    stacked = {}
+    for metric in eval_metrics:
+        lengths = np.array([s.shape[0] for s in series[metric]])
+        # Keep stored dtype so that scores are identical to per-run numpy ops
+        dtype = np.result_type(*set([s.dtype for s in series[metric]]))
+        if not np.issubdtype(dtype, np.floating):
+            dtype = np.float64
+        padded = np.full((len(run_ids), lengths.max()), np.nan, dtype=dtype)
+        mask = np.arange(padded.shape[1])[None, :] < lengths[:, None]
+        padded[mask] = np.concatenate(series[metric])
+        stacked[metric] = (padded, mask)
+    return stacked
+
+
 def evaluate_mean_score(
     eval_logs,
     eval_metrics: List[str],
@@ -235,14 +381,19 @@ def evaluate_mean_score(
 ):
     """
     IN: Evaluation df of evaluation, what key to use for evaluation
-    OUT: dict of final scores at end of training for all metrics
+    OUT: dict of mean scores over course of training for all metrics
     """
     perf_per_metric = {}
+    stacked = stack_metric_series(eval_logs, eval_metrics, run_ids, aggregate_seeds)
     for metric in eval_metrics:
-        int_out = {}
-        for run in run_ids:
-            int_out[run] = np.mean(eval_logs[run]["stats"][metric][aggregate_seeds])
-        perf_per_metric[metric] = int_out
+        padded, mask = stacked[metric]
+        lengths = mask.sum(axis=1)
+        scores = np.empty(len(run_ids), dtype=padded.dtype)
+        # Average runs of equal length jointly - same summation order as np.mean
+        for length in np.unique(lengths):
+            idx = np.where(lengths == length)[0]
+            scores[idx] = padded[idx, :length].mean(axis=1)
+        perf_per_metric[metric] = dict(zip(run_ids, scores))
     return perf_per_metric
 
 
@@ -257,11 +408,11 @@ def evaluate_final_score(
     OUT: dict of final scores at end of training for all metrics
     """
     perf_per_metric = {}
+    stacked = stack_metric_series(eval_logs, eval_metrics, run_ids, aggregate_seeds)
     for metric in eval_metrics:
-        int_out = {}
-        for run in run_ids:
-            int_out[run] = eval_logs[run]["stats"][metric][aggregate_seeds][-1]
-        perf_per_metric[metric] = int_out
+        padded, mask = stacked[metric]
+        scores = padded[np.arange(len(run_ids)), mask.sum(axis=1) - 1]
+        perf_per_metric[metric] = dict(zip(run_ids, scores))
     return perf_per_metric
 
 
@@ -277,12 +428,12 @@ def evaluate_best_score(
     OUT: dict of best scores during course of training for all metrics
     """
     perf_per_metric = {}
+    stacked = stack_metric_series(eval_logs, eval_metrics, run_ids, aggregate_seeds)
     for metric in eval_metrics:
-        int_out = {}
-        for run in run_ids:
-            if max_objective:
-                int_out[run] = np.max(eval_logs[run]["stats"][metric][aggregate_seeds])
-            else:
-                int_out[run] = np.min(eval_logs[run]["stats"][metric][aggregate_seeds])
-        perf_per_metric[metric] = int_out
+        padded, mask = stacked[metric]
+        if max_objective:
+            scores = np.where(mask, padded, -np.inf).max(axis=1)
+        else:
+            scores = np.where(mask, padded, np.inf).min(axis=1)
+        perf_per_metric[metric] = dict(zip(run_ids, scores))
     return perf_per_metric
@@ -0,0 +1,145 @@
+import os
+import glob
+import time
+import h5py
+from typing import List, Union
+
+# Safely import inotify - otherwise fall back to polling with backoff
+try:
+    from inotify_simple import INotify, flags
+
+    __inotify_installed = True
+except ImportError:
+    __inotify_installed = False
+    pass
+
+
+class RunLogWatcher(object):
+    def __init__(
+        self,
+        experiment_dir: str,
+        run_ids: List[str],
+        num_seeds: int,
+        timeout: Union[float, None] = 3600,
+        max_backoff: float = 30.0,
+    ):
+        """Watch per-run seed log files & report runs once logs are complete.
+        - A run is ready if its seed-merged `log.hdf5` or all `num_seeds`
+          `log_seed_<id>.hdf5` files exist and can be opened with h5py.
+        - Waits on inotify events if available & otherwise polls with
+          exponential backoff. Raises after `timeout` seconds w/o progress.
+        - Use as context manager (or call `close`) to release the inotify fd.
+        """
+        self.experiment_dir = experiment_dir
+        self.pending = list(run_ids)
+        self.num_seeds = num_seeds
+        self.timeout = timeout
+        self.max_backoff = max_backoff
+        # Keep track of last issue per run for informative timeout errors
+        self.issues = {run_id: "missing logs" for run_id in run_ids}
+        self.inotify = setup_inotify()
+        self.watched_dirs = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self) -> None:
+        """Close inotify instance (fd & watches) - falls back to polling."""
+        if self.inotify is not None:
+            self.inotify.close()
+            self.inotify = None
+        self.watched_dirs = []
+
+    def check_run(self, run_id: str) -> bool:
+        """Check if logs of a single run are complete and readable."""
+        log_dir = os.path.join(self.experiment_dir, run_id, "logs")
+        merged_path = os.path.join(log_dir, "log.hdf5")
+        if os.path.exists(merged_path):
+            log_paths = [merged_path]
+        else:
+            log_paths = glob.glob(os.path.join(log_dir, "log_seed_*.hdf5"))
+            if len(log_paths) < self.num_seeds:
+                self.issues[run_id] = (
+                    f"missing logs ({len(log_paths)}/{self.num_seeds} seeds)"
+                )
+                return False
+        for log_path in log_paths:
+            try:
+                with h5py.File(log_path, "r") as h5f:
+                    seed_ids = list(h5f.keys())
+                    assert len(seed_ids) > 0
+                    for seed_id in seed_ids:
+                        assert "meta" in h5f[seed_id].keys()
+            except Exception as err:
+                self.issues[run_id] = f"corrupt log {log_path} ({err})"
+                return False
+        return True
+
+    def ready_runs(self) -> List[str]:
+        """Check all pending runs once & return those that became ready."""
+        ready = [run_id for run_id in self.pending if self.check_run(run_id)]
+        for run_id in ready:
+            self.pending.remove(run_id)
+            del self.issues[run_id]
+        return ready
+
+    def wait(self):
+        """Yield lists of ready runs until all pending runs are completed."""
+        backoff, last_progress = 0.1, time.time()
+        while len(self.pending) > 0:
+            ready = self.ready_runs()
+            if len(ready) > 0:
+                backoff, last_progress = 0.1, time.time()
+                yield ready
+                continue
+            if self.timeout is not None and time.time() - last_progress > self.timeout:
+                issues = [f"{k}: {v}" for k, v in self.issues.items()]
+                raise TimeoutError(
+                    f"Logs not completed after {self.timeout}s - " + " | ".join(issues)
+                )
+            self.update_watches()
+            wait_for_changes(self.inotify, backoff)
+            backoff = min(2 * backoff, self.max_backoff)
+
+    def wait_all(self) -> None:
+        """Block until the logs of all pending runs are ready."""
+        for _ in self.wait():
+            continue
+
+    def update_watches(self) -> None:
+        """Add inotify watches for newly created run/log directories."""
+        if self.inotify is None:
+            return
+        dirs = [self.experiment_dir]
+        for run_id in self.pending:
+            dirs += [
+                os.path.join(self.experiment_dir, run_id),
+                os.path.join(self.experiment_dir, run_id, "logs"),
+            ]
+        for d in dirs:
+            if d not in self.watched_dirs and os.path.isdir(d):
+                self.inotify.add_watch(
+                    d, flags.CREATE | flags.CLOSE_WRITE | flags.MOVED_TO
+                )
+                self.watched_dirs.append(d)
+
+
+def setup_inotify():
+    """Create inotify instance if `inotify_simple` is installed."""
+    if __inotify_installed:
+        try:
+            return INotify()
+        except Exception:
+            return None
+    return None
+
+
+def wait_for_changes(inotify, timeout: float) -> None:
+    """Wait for file events (inotify) or simply sleep for timeout secs."""
+    if inotify is None:
+        time.sleep(timeout)
+    else:
+        inotify.read(timeout=int(1000 * timeout))
@@ -0,0 +1,42 @@
+import os
+import h5py
+from typing import List
+from mle_logging import load_log
+from mle_logging.merge import merge_hdf5_files
+
+
+def get_run_log_path(experiment_dir: str, run_id: str) -> str:
+    """Get path of seed-merged .hdf5 log for a single run/eval id."""
+    log_dir = os.path.join(experiment_dir, run_id, "logs")
+    # MLEQueue seed merging stores aggregated log as <run_id>/logs/log.hdf5
+    for fname in ["log.hdf5", run_id + ".hdf5"]:
+        log_path = os.path.join(log_dir, fname)
+        if os.path.exists(log_path):
+            return log_path
+    raise FileNotFoundError(f"No merged .hdf5 log found for {run_id}.")
+
+
+def merge_batch_logs(
+    experiment_dir: str,
+    run_ids: List[str],
+    meta_log_fname: str = "meta_log.hdf5",
+):
+    """Append batch run logs to meta log & load only newly added runs."""
+    log_paths = [get_run_log_path(experiment_dir, run_id) for run_id in run_ids]
+
+    # Merge batch logs into temporary file - same layout as the meta log
+    batch_log_fname = os.path.join(experiment_dir, "batch_log.hdf5")
+    merge_hdf5_files(batch_log_fname, log_paths, file_ids=run_ids)
+    batch_log = load_log(batch_log_fname, aggregate_seeds=True)
+
+    # Copy run groups over to meta log - replace runs that were re-evaluated
+    meta_log_path = os.path.join(experiment_dir, meta_log_fname)
+    with h5py.File(batch_log_fname, "r") as file_from, h5py.File(
+        meta_log_path, "a"
+    ) as file_to:
+        for run_id in run_ids:
+            if run_id in file_to:
+                del file_to[run_id]
+            file_from.copy(file_from[run_id], file_to, name=run_id)
+    os.remove(batch_log_fname)
+    return batch_log
@@ -1,17 +1,34 @@
 import time
 import os
+import glob
+import h5py
 import shutil
-import copy
 import logging
 import numpy as np
+from dotmap import DotMap
 from typing import Union, List
 from .hyper_logger import HyperoptLogger
-from ..utils import print_framed
-from mle_logging import merge_config_logs, load_log, load_config
-from mle_scheduler import MLEQueue
+from .merge_logs import merge_batch_logs
+from .eval_pool import EvalJobPool, JobBudget
+from .log_watcher import RunLogWatcher
+from .config_overlay import overlay_proposal
+from .eval_cache import EvalCache, canonical_hash
+from .early_stopping import EarlyStopper
+from .racing import SeedRacer
+from .speculation import StragglerDetector, SpeculativeJobQueue
+from ..utils import print_framed, save_pkl_object, load_pkl_object
+from ..utils.batch_resume import (
+    get_pending_batch_fname,
+    get_missing_seed_jobs,
+    remove_partial_seed_logs,
+)
+from ..utils.config_manifest import write_config_manifest, parse_manifest_ref
+from ..utils.job_queue import get_job_queue_class, use_seeds_per_process
+from ..utils.job_array import use_job_array
+from mle_logging import merge_config_logs, merge_seed_logs, load_log, load_config
 from mle_monitor import MLEProtocol
 from mle_hyperopt import Strategies
-from mle_hyperopt.utils import write_configs, merge_config_dicts
+from mle_hyperopt.utils import write_configs
 from mle_toolbox import mle_config, check_single_job_args
 
 
@@ -31,6 +48,14 @@ class MLE_BatchSearch(object):
         message_id: Union[str, None] = None,
         protocol_db: Union[MLEProtocol, None] = None,
         debug_mode: bool = False,
+        incremental_merge: bool = False,
+        log_timeout: Union[float, None] = 3600,
+        config_manifest: bool = False,
+        eval_cache_dir: Union[str, None] = None,
+        early_stopping: Union[dict, None] = None,
+        job_budget: Union[JobBudget, None] = None,
+        racing: Union[dict, None] = None,
+        speculation: Union[dict, None] = None,
     ):
         """
         Base Class for Running Hyperparameter Optimisation Searches
@@ -55,6 +80,10 @@ class MLE_BatchSearch(object):
         self.job_arguments = check_single_job_args(
             resource_to_run, job_arguments.copy()
         )
+        # Warm local workers (`use_warm_pool`), all seeds in one process, etc.
+        self.job_queue_class = get_job_queue_class(
+            resource_to_run, self.job_arguments
+        )
         self.experiment_dir = experiment_dir  # Where to store all logs
         if self.experiment_dir[-1] != "/":
             self.experiment_dir += "/"
@@ -62,9 +91,12 @@ class MLE_BatchSearch(object):
         # Create the directory if it doesn't exist yet & set log json name
         if not os.path.exists(self.experiment_dir):
             os.makedirs(self.experiment_dir)
-        self.search_log_path = os.path.join(
-            self.experiment_dir, "search_log.yaml"
-        )
+        # Iterative strategies can only be reloaded from pickled state
+        if search_type in ["PBT", "Halving", "Hyperband"]:
+            search_log_fname = "search_log.pkl"
+        else:
+            search_log_fname = "search_log.yaml"
+        self.search_log_path = os.path.join(self.experiment_dir, search_log_fname)
 
         # Copy over base config .json file -  to be copied + modified in search
         config_copy = os.path.join(
@@ -86,6 +118,15 @@ class MLE_BatchSearch(object):
         # Debug mode for queue - keep around log/err
         self.debug_mode = debug_mode
 
+        # Only append new runs to meta log instead of re-merging all batches
+        self.incremental_merge = incremental_merge
+        # Max. time to wait for missing/corrupt run logs before raising
+        self.log_timeout = log_timeout
+        # Write all batch configs to single indexed manifest file
+        self.config_manifest = config_manifest
+        # Running job slots shared with concurrent searches (async only)
+        self.job_budget = job_budget
+
         # Setup the search strategy
         assert self.search_type in [
             "Grid",
@@ -110,6 +151,73 @@ class MLE_BatchSearch(object):
         if self.hyper_log.reloaded:
             self.strategy.load(self.search_log_path)
 
+        # Persistent evaluation cache - answer previously evaluated proposals
+        # Not for PBT/Halving/Hyperband since evals continue from checkpoints
+        if (
+            eval_cache_dir is not None
+            and self.search_type not in ["PBT", "Halving", "Hyperband"]
+            and not self.hyper_log.no_results_logging
+        ):
+            self.eval_cache = EvalCache(
+                eval_cache_dir,
+                job_fname,
+                self.base_config.toDict(),
+                {
+                    "problem_type": hyper_log.problem_type,
+                    "aggregate_seeds": hyper_log.aggregate_seeds,
+                    "max_objective": hyper_log.max_objective,
+                    "eval_metrics": hyper_log.eval_metrics,
+                },
+            )
+        else:
+            self.eval_cache = None
+
+        # Stop losing async evals based on their intermediate seed logs
+        # Not for PBT/Halving/Hyperband since they schedule budgets themselves
+        if (
+            early_stopping is not None
+            and self.search_type not in ["PBT", "Halving", "Hyperband"]
+            and not self.hyper_log.no_results_logging
+        ):
+            early_stopping = early_stopping.copy()
+            if "metric" not in early_stopping.keys():
+                early_stopping["metric"] = hyper_log.eval_metrics[0]
+            self.early_stopper = EarlyStopper(
+                self.experiment_dir, hyper_log.max_objective, **early_stopping
+            )
+        else:
+            self.early_stopper = None
+
+        # Race seeds of async evals - only add seeds to evals in contention
+        if (
+            racing is not None
+            and self.search_type not in ["PBT", "Halving", "Hyperband"]
+            and not self.hyper_log.no_results_logging
+        ):
+            racing = racing.copy()
+            if "metric" not in racing.keys():
+                racing["metric"] = hyper_log.eval_metrics[0]
+            self.racer = SeedRacer(
+                self.experiment_dir,
+                problem_type=hyper_log.problem_type,
+                max_objective=hyper_log.max_objective,
+                **racing,
+            )
+        else:
+            self.racer = None
+
+        # Duplicate straggling seed jobs of sync batches - first copy wins
+        # Not for PBT/Halving/Hyperband (ckpt paths), seed groups & job arrays
+        if (
+            speculation is not None
+            and self.search_type not in ["PBT", "Halving", "Hyperband"]
+            and not use_seeds_per_process(self.job_arguments)
+            and not use_job_array(resource_to_run, self.job_arguments)
+        ):
+            self.straggler_detector = StragglerDetector(**speculation)
+        else:
+            self.straggler_detector = None
+
     def run_search(
         self,
         num_search_batches: Union[None, int] = None,
@@ -191,62 +299,295 @@ class MLE_BatchSearch(object):
         num_seeds_per_eval: int = 1,
         random_seeds: Union[None, List[int]] = None,
     ):
-        """Run jobs asynchronously - launch whenever resource available."""
-        # Does not work with Batch SMBO since proposals rely on GP!
-        assert self.search_type != "smbo", "Async scheduling - No SMBO support"
-        # Get all hyperparameters & plug them into config dicts, store jsons
-        batch_proposals = self.ask(num_total_evals)
-        # Ensure that batch_proposals is a list for single config case
-        if type(batch_proposals) == dict:
-            batch_proposals = [batch_proposals]
-        batch_configs = self.gen_hyperparam_configs(batch_proposals)
-        batch_fnames, run_ids = self.write_configs_to_file(batch_configs)
+        """Run jobs asynchronously - ask/tell whenever a slot becomes free."""
+        # Cloud VMs/SSH results are only synced back at end of full queue
+        if self.resource_to_run not in ["local", "sge-cluster", "slurm-cluster"]:
+            assert self.job_budget is None, "Shared budget requires local/cluster"
+            return self.run_async_queue_search(
+                num_total_evals, max_running_jobs, num_seeds_per_eval, random_seeds
+            )
+
+        # Sample seeds once - all evals share them for seed aggregation
+        random_seeds = sample_random_seeds(num_seeds_per_eval, random_seeds)
+        num_seeds_per_eval = len(random_seeds)
+        if max_running_jobs is None:
+            max_running_jobs = num_total_evals * num_seeds_per_eval
 
-        # Generate a queue of jobs to launch and work through them
-        # Different seed logs are merged within queue whenever all completed
+        # Single eval logs are appended to the meta log as soon as completed
+        # Configs are written one eval at a time - no manifest batching
+        self.incremental_merge = True
+        self.config_manifest = False
         self.logger.info(
             f"START - {num_total_evals} Eval Configs - "
             f"{max_running_jobs} Jobs at a Time -"
             f" {num_seeds_per_eval} Seeds"
         )
-        start_t = time.time()
-        job_queue = MLEQueue(
-            resource_to_run=self.resource_to_run,
-            job_filename=self.job_fname,
-            job_arguments=self.job_arguments,
-            config_filenames=batch_fnames,
-            experiment_dir=self.experiment_dir,
-            num_seeds=num_seeds_per_eval,
-            random_seeds=random_seeds,
-            max_running_jobs=max_running_jobs,
-            cloud_settings=mle_config.gcp,
-            automerge_configs=True,
-            use_slack_bot=(self.message_id is not None),
-            slack_message_id=self.message_id,
-            slack_user_name=mle_config.slack.user_name,
-            slack_auth_token=mle_config.slack.slack_token,
-            protocol_db=self.protocol_db,
-            debug_mode=self.debug_mode,
+        pool = EvalJobPool(
+            self.resource_to_run,
+            self.job_fname,
+            self.job_arguments,
+            self.experiment_dir,
+            max_running_jobs,
+            self.debug_mode,
+            self.job_budget,
         )
-        job_queue.run()
-        time_elapsed = time.time() - start_t
+        # Grid proposals are non-adaptive - ask full grid once upfront
+        # Note: Grid strategy can't be asked while evals are pending/unordered
+        if self.search_type == "Grid":
+            grid_proposals = self.ask(num_total_evals)
+            if type(grid_proposals) == dict:
+                grid_proposals = [grid_proposals]
+            num_total_evals = len(grid_proposals)
+
+        # Racing evals start with subset of seeds - more added if in contention
+        if self.racer is not None:
+            launch_seeds = random_seeds[: self.racer.min_seeds]
+        else:
+            launch_seeds = random_seeds
+
+        running_evals, eval_seeds, raced_time = {}, {}, {}
+        # Extra seeds of raced evals waiting for free slots
+        postponed_seeds = {}
+        num_launched, num_completed = 0, 0
+        while num_completed < num_total_evals:
+            # Fill up free slots with single new proposals from strategy
+            # Hold budget lock so that concurrent searches don't oversubscribe
+            with pool.budget.lock:
+                # Raced evals in contention get free slots before new proposals
+                for run_id in list(postponed_seeds.keys()):
+                    if not pool.can_launch(len(postponed_seeds[run_id])):
+                        continue
+                    new_seeds = postponed_seeds.pop(run_id)
+                    pool.launch(run_id, running_evals[run_id][1], new_seeds)
+                    eval_seeds[run_id] += new_seeds
+                while (
+                    len(postponed_seeds) == 0
+                    and num_launched < num_total_evals
+                    and pool.can_launch(len(launch_seeds))
+                ):
+                    if self.search_type == "Grid":
+                        proposal = grid_proposals[num_launched]
+                    else:
+                        pending = [v[0] for v in running_evals.values()]
+                        proposal = self.ask_async(pending)
+                    # Wait for running evals if strategy has no new proposal
+                    if proposal is None:
+                        if len(running_evals) == 0:
+                            num_total_evals = num_launched
+                        break
+                    # Answer previously evaluated proposal directly from cache
+                    cached_proposals, cached_evals, _ = self.lookup_eval_cache(
+                        [proposal], random_seeds
+                    )
+                    if len(cached_proposals) > 0:
+                        run_ids, perf_measures, ckpts = self.log_cached_evals(
+                            cached_proposals, cached_evals, eval_offset=num_launched
+                        )
+                        self.hyper_log.save_log()
+                        self.tell(run_ids, cached_proposals, perf_measures, ckpts)
+                        num_launched += 1
+                        num_completed += 1
+                        continue
+                    eval_config = self.gen_hyperparam_configs([proposal])
+                    config_fnames, run_ids = self.write_configs_to_file(
+                        eval_config, eval_offset=num_launched
+                    )
+                    pool.launch(run_ids[0], config_fnames[0], launch_seeds)
+                    running_evals[run_ids[0]] = (proposal, config_fnames[0])
+                    eval_seeds[run_ids[0]] = list(launch_seeds)
+                    num_launched += 1
+
+            # Merge seeds, update log & tell strategy for each completed eval
+            for run_id, time_elapsed in pool.poll():
+                if not self.hyper_log.no_results_logging:
+                    with RunLogWatcher(
+                        self.experiment_dir,
+                        [run_id],
+                        len(eval_seeds[run_id]),
+                        self.log_timeout,
+                    ) as watcher:
+                        watcher.wait_all()
+                # Add seeds to eval if its CI still overlaps the current best
+                if self.racer is not None:
+                    leaders = self.hyper_log.get_leaderboard(self.racer.metric, 1)
+                    new_seeds = self.racer.next_seeds(
+                        run_id,
+                        eval_seeds[run_id],
+                        random_seeds,
+                        leaders[0]["score"] if len(leaders) > 0 else None,
+                    )
+                    # Launched under budget lock once enough slots are free
+                    if len(new_seeds) > 0:
+                        postponed_seeds[run_id] = new_seeds
+                        raced_time[run_id] = raced_time.get(run_id, 0) + time_elapsed
+                        continue
+                proposal, config_fname = running_evals.pop(run_id)
+                used_seeds = eval_seeds.pop(run_id)
+                time_elapsed += raced_time.pop(run_id, 0)
+                if not self.hyper_log.no_results_logging:
+                    # Keep full curve as reference before seed logs are merged
+                    if self.early_stopper is not None:
+                        self.early_stopper.add_completed(run_id)
+                    eval_dir = os.path.join(self.experiment_dir, run_id)
+                    merge_seed_logs(
+                        os.path.join(eval_dir, "logs", "log.hdf5"),
+                        eval_dir,
+                        len(used_seeds),
+                    )
+                perf_measures, ckpts = self.update_hyper_log(
+                    [proposal], [run_id], time_elapsed, len(used_seeds)
+                )
+                self.update_eval_cache([proposal], random_seeds, used_seeds)
+                self.hyper_log.save_log()
+                self.tell([run_id], [proposal], perf_measures, ckpts)
+                os.remove(config_fname)
+                num_completed += 1
+                if self.protocol_db is not None:
+                    for _ in range(num_seeds_per_eval):
+                        self.protocol_db.update_progress_bar()
+
+            # Kill losing evals & score them on their partial logs
+            if self.early_stopper is not None:
+                # Postponed raced evals have no running jobs to stop
+                launched_evals = [
+                    run_id for run_id in running_evals if run_id not in postponed_seeds
+                ]
+                for run_id in self.early_stopper.check(launched_evals):
+                    time_elapsed = pool.stop(run_id) + raced_time.pop(run_id, 0)
+                    proposal, config_fname = running_evals.pop(run_id)
+                    eval_seeds.pop(run_id)
+                    perf_measures, ckpts = self.update_truncated_log(
+                        proposal, run_id, time_elapsed
+                    )
+                    if perf_measures is not None:
+                        self.hyper_log.save_log()
+                        self.tell([run_id], [proposal], perf_measures, ckpts)
+                    os.remove(config_fname)
+                    num_completed += 1
+                    if self.protocol_db is not None:
+                        for _ in range(num_seeds_per_eval):
+                            self.protocol_db.update_progress_bar()
+            time.sleep(0.1)
 
+        self.slot_utilisation = pool.slot_utilisation
+        if self.early_stopper is not None:
+            self.logger.info(
+                f"EARLY STOPPING - {len(self.early_stopper.stopped_run_ids)}"
+                f" of {num_total_evals} Evals Stopped"
+            )
+        if self.racer is not None:
+            self.logger.info(
+                f"RACING - {self.racer.num_dropped} Evals Dropped Early -"
+                f" {self.racer.num_saved_seeds} Seed Jobs Saved"
+            )
+        if self.eval_cache is not None:
+            self.logger.info(
+                f"CACHE - {self.eval_cache.hits} Hits |"
+                f" {self.eval_cache.misses} Misses"
+            )
         self.logger.info(
             f"DONE - {num_total_evals} Eval Configs - "
             f"{max_running_jobs} Jobs at a Time -"
-            f" {num_seeds_per_eval} Seeds"
+            f" {num_seeds_per_eval} Seeds -"
+            f" Slot Utilisation: {100 * self.slot_utilisation:.1f}%"
+        )
+        print_framed(f"COMPLETED ASYNC SEARCH {num_total_evals} EVALS")
+
+    def run_async_queue_search(
+        self,
+        num_total_evals: int,
+        max_running_jobs: Union[int, None] = None,
+        num_seeds_per_eval: int = 1,
+        random_seeds: Union[None, List[int]] = None,
+    ):
+        """Run full queue of proposals - ask once, tell after all completed."""
+        # Does not work with Batch SMBO since proposals rely on GP!
+        assert self.search_type != "smbo", "Async scheduling - No SMBO support"
+        # Get all hyperparameters & plug them into config dicts, store jsons
+        batch_proposals = self.ask(num_total_evals)
+        # Ensure that batch_proposals is a list for single config case
+        if type(batch_proposals) == dict:
+            batch_proposals = [batch_proposals]
+
+        # Answer previously evaluated proposals from evaluation cache
+        if self.eval_cache is not None:
+            random_seeds = sample_random_seeds(num_seeds_per_eval, random_seeds)
+        cached_proposals, cached_evals, batch_proposals = self.lookup_eval_cache(
+            batch_proposals, random_seeds
         )
 
-        # Update + save hyperlog after merging eval log .hdf5 files
-        perf_measures, ckpts = self.update_hyper_log(
-            batch_proposals, run_ids, time_elapsed, num_seeds_per_eval
+        run_ids, perf_measures, ckpts = [], {}, None
+        if len(batch_proposals) > 0:
+            batch_configs = self.gen_hyperparam_configs(batch_proposals)
+            batch_fnames, run_ids = self.write_configs_to_file(batch_configs)
+
+            # Generate a queue of jobs to launch and work through them
+            # Different seed logs are merged within queue whenever all completed
+            self.logger.info(
+                f"START - {len(batch_proposals)} Eval Configs - "
+                f"{max_running_jobs} Jobs at a Time -"
+                f" {num_seeds_per_eval} Seeds"
+            )
+            start_t = time.time()
+            job_queue = self.job_queue_class(
+                resource_to_run=self.resource_to_run,
+                job_filename=self.job_fname,
+                job_arguments=self.job_arguments,
+                config_filenames=batch_fnames,
+                experiment_dir=self.experiment_dir,
+                num_seeds=num_seeds_per_eval,
+                random_seeds=random_seeds,
+                max_running_jobs=max_running_jobs,
+                cloud_settings=mle_config.gcp,
+                automerge_seeds=self.incremental_merge,
+                automerge_configs=not self.incremental_merge,
+                use_slack_bot=(self.message_id is not None),
+                slack_message_id=self.message_id,
+                slack_user_name=mle_config.slack.user_name,
+                slack_auth_token=mle_config.slack.slack_token,
+                protocol_db=self.protocol_db,
+                debug_mode=self.debug_mode,
+            )
+            job_queue.run()
+            time_elapsed = time.time() - start_t
+            # Local admission control - report queue wait vs. run time
+            if hasattr(job_queue, "admission"):
+                self.logger.info(job_queue.admission.summary())
+
+            self.logger.info(
+                f"DONE - {len(batch_proposals)} Eval Configs - "
+                f"{max_running_jobs} Jobs at a Time -"
+                f" {num_seeds_per_eval} Seeds"
+            )
+
+            # Update + save hyperlog after merging eval log .hdf5 files
+            perf_measures, ckpts = self.update_hyper_log(
+                batch_proposals, run_ids, time_elapsed, num_seeds_per_eval
+            )
+            self.update_eval_cache(batch_proposals, job_queue.random_seeds)
+            self.remove_config_files(batch_fnames)
+
+        # Log cache hits & tell strategy about all proposals
+        cached_run_ids, cached_measures, cached_ckpts = self.log_cached_evals(
+            cached_proposals, cached_evals, eval_offset=len(run_ids)
         )
         self.hyper_log.save_log()
+        if self.eval_cache is not None:
+            self.logger.info(
+                f"CACHE - {self.eval_cache.hits} Hits |"
+                f" {self.eval_cache.misses} Misses"
+            )
 
         # Clean up after search batch iteration
-        self.tell(run_ids, batch_proposals, perf_measures, ckpts)
-        for f in batch_fnames:
-            os.remove(f)
+        perf_measures, ckpts = merge_eval_results(
+            perf_measures, ckpts, cached_measures, cached_ckpts
+        )
+        self.tell(
+            run_ids + cached_run_ids,
+            batch_proposals + cached_proposals,
+            perf_measures,
+            ckpts,
+        )
         print_framed(f"COMPLETED QUEUE CLEAN-UP {num_total_evals} EVALS")
 
     def run_sync_search(
@@ -263,110 +604,226 @@ class MLE_BatchSearch(object):
             prev_batches = int(self.current_iter / num_evals_per_batch)
             self.current_iter = int(self.current_iter / num_evals_per_batch)
         else:
-            # TODO: Can't reload hyperband/halving at this moment!
-            self.current_iter = 0
-            prev_batches = 0
+            # Halving/Hyperband batch sizes vary - count logged batch ids
+            prev_batches = max(
+                [int(r.split("_")[1]) for r in self.hyper_log.all_run_ids] + [0]
+            )
+            self.current_iter = prev_batches
+            num_search_batches -= prev_batches
 
         for search_iter in range(num_search_batches):
             # Update the hyperopt iteration counter
             self.current_iter += 1
 
-            # Get a set of hyperparameters & plug them into config dicts
-            # Note: num_evals_per_batch doesn't affect PBT/Halving/Hyperband
-            batch_proposals = self.ask(num_evals_per_batch)
-            # Ensure that batch_proposals is a list for single config case
-            if type(batch_proposals) == dict:
-                batch_proposals = [batch_proposals]
-            batch_configs = self.gen_hyperparam_configs(batch_proposals)
-            batch_fnames, run_ids = self.write_configs_to_file(batch_configs)
-
-            self.logger.info(
-                f"START - {self.current_iter}/"
-                f"{num_search_batches + prev_batches} Batch of"
-                f" Hyperparameters - {num_seeds_per_eval} Seeds"
+            # Resume interrupted batch w. its stored proposals & seeds
+            pending_fname = get_pending_batch_fname(
+                self.experiment_dir, self.current_iter
             )
-
-            # Training w. prev. specified hyperparams & eval, get time taken
-            if (
-                type(num_evals_per_batch) == int
-                and max_running_jobs is not None
-            ):
-                max_jobs = num_seeds_per_eval * num_evals_per_batch
+            resume_batch = os.path.exists(pending_fname)
+            if resume_batch:
+                pending = load_pkl_object(pending_fname)
+                batch_proposals = pending["proposals"]
+                random_seeds = pending["random_seeds"]
             else:
-                max_jobs = max_running_jobs
+                # Get a set of hyperparameters & plug them into config dicts
+                # Note: num_evals_per_batch doesn't affect PBT/Halving/Hyperband
+                batch_proposals = self.ask(num_evals_per_batch)
+                # Ensure that batch_proposals is a list for single config case
+                if type(batch_proposals) == dict:
+                    batch_proposals = [batch_proposals]
+                # Store batch before launch - seeds are fixed for resuming
+                random_seeds = sample_random_seeds(num_seeds_per_eval, random_seeds)
+                num_seeds_per_eval = len(random_seeds)
+                save_pkl_object(
+                    {"proposals": batch_proposals, "random_seeds": random_seeds},
+                    pending_fname,
+                )
 
-            start_t = time.time()
-            job_queue = MLEQueue(
-                self.resource_to_run,
-                self.job_fname,
-                self.job_arguments,
-                batch_fnames,
-                self.experiment_dir,
-                num_seeds_per_eval,
-                random_seeds=random_seeds,
-                max_running_jobs=max_jobs,
-                debug_mode=True,
-                cloud_settings=mle_config.gcp,
-                use_slack_bot=(self.message_id is not None),
-                slack_message_id=self.message_id,
-                slack_user_name=mle_config.slack.user_name,
-                slack_auth_token=mle_config.slack.slack_token,
-                protocol_db=self.protocol_db,
-                automerge_configs=True,
-            )
-            job_queue.run()
-            time_elapsed = time.time() - start_t
-            self.logger.info(
-                f"DONE - {self.current_iter}/"
-                f"{num_search_batches + prev_batches} Batch of"
-                f" Hyperparameters - {num_seeds_per_eval} Seeds"
+            # Answer previously evaluated proposals from evaluation cache
+            if self.eval_cache is not None:
+                self.eval_cache.reset_counters()
+            cached_proposals, cached_evals, batch_proposals = self.lookup_eval_cache(
+                batch_proposals, random_seeds
             )
-            time_elapsed = time.time() - start_t
 
-            # Overwrite provided seeds with the ones sampled in the JobQueue
-            # Otherwise this will resample seeds which will cause problems
-            # when aggregating the different logs across batch iterations
-            # Potential danger: Overfitting of one specific seed?
-            random_seeds = job_queue.random_seeds
+            run_ids, perf_measures, ckpts = [], {}, None
+            if len(batch_proposals) > 0:
+                batch_configs = self.gen_hyperparam_configs(batch_proposals)
+                batch_fnames, run_ids = self.write_configs_to_file(batch_configs)
 
-            # Update + save hyperlog after merging eval log .hdf5 files
-            perf_measures, ckpts = self.update_hyper_log(
-                batch_proposals, run_ids, time_elapsed, num_seeds_per_eval
+                self.logger.info(
+                    f"START - {self.current_iter}/"
+                    f"{num_search_batches + prev_batches} Batch of"
+                    f" Hyperparameters - {num_seeds_per_eval} Seeds"
+                )
+
+                # Training w. prev. specified hyperparams & eval, get time taken
+                if (
+                    type(num_evals_per_batch) == int
+                    and max_running_jobs is not None
+                ):
+                    max_jobs = num_seeds_per_eval * num_evals_per_batch
+                else:
+                    max_jobs = max_running_jobs
+
+                start_t = time.time()
+                if resume_batch:
+                    # Only relaunch (run_id, seed) jobs that didn't complete
+                    self.run_missing_seed_jobs(
+                        batch_fnames, run_ids, random_seeds, max_jobs
+                    )
+                else:
+                    queue_class, queue_kwargs = self.job_queue_class, {}
+                    if self.straggler_detector is not None:
+                        queue_class = SpeculativeJobQueue
+                        queue_kwargs = {
+                            "detector": self.straggler_detector,
+                            "config_keys": [
+                                canonical_hash(p) for p in batch_proposals
+                            ],
+                        }
+                    job_queue = queue_class(
+                        self.resource_to_run,
+                        self.job_fname,
+                        self.job_arguments,
+                        batch_fnames,
+                        self.experiment_dir,
+                        num_seeds_per_eval,
+                        random_seeds=random_seeds,
+                        max_running_jobs=max_jobs,
+                        debug_mode=True,
+                        cloud_settings=mle_config.gcp,
+                        use_slack_bot=(self.message_id is not None),
+                        slack_message_id=self.message_id,
+                        slack_user_name=mle_config.slack.user_name,
+                        slack_auth_token=mle_config.slack.slack_token,
+                        protocol_db=self.protocol_db,
+                        automerge_seeds=self.incremental_merge,
+                        automerge_configs=not self.incremental_merge,
+                        **queue_kwargs,
+                    )
+                    job_queue.run()
+                    if hasattr(job_queue, "admission"):
+                        self.logger.info(job_queue.admission.summary())
+                    if self.straggler_detector is not None:
+                        self.logger.info(self.straggler_detector.summary())
+                time_elapsed = time.time() - start_t
+                self.logger.info(
+                    f"DONE - {self.current_iter}/"
+                    f"{num_search_batches + prev_batches} Batch of"
+                    f" Hyperparameters - {num_seeds_per_eval} Seeds"
+                )
+
+                # Update + save hyperlog after merging eval log .hdf5 files
+                perf_measures, ckpts = self.update_hyper_log(
+                    batch_proposals, run_ids, time_elapsed, num_seeds_per_eval
+                )
+                self.update_eval_cache(batch_proposals, random_seeds)
+                self.remove_config_files(batch_fnames)
+
+            # Log cache hits & tell strategy about full batch of proposals
+            cached_run_ids, cached_measures, cached_ckpts = self.log_cached_evals(
+                cached_proposals, cached_evals, eval_offset=len(run_ids)
             )
             self.hyper_log.save_log()
+            if self.eval_cache is not None:
+                self.logger.info(
+                    f"CACHE - {self.current_iter}/"
+                    f"{num_search_batches + prev_batches} Batch -"
+                    f" {self.eval_cache.hits} Hits | {self.eval_cache.misses} Misses"
+                )
 
             # Clean up after search batch iteration - delete redundant configs
-            self.tell(run_ids, batch_proposals, perf_measures, ckpts)
-            for f in batch_fnames:
-                os.remove(f)
+            perf_measures, ckpts = merge_eval_results(
+                perf_measures, ckpts, cached_measures, cached_ckpts
+            )
+            self.tell(
+                run_ids + cached_run_ids,
+                batch_proposals + cached_proposals,
+                perf_measures,
+                ckpts,
+            )
+            os.remove(pending_fname)
             print_framed(
                 f"COMPLETED BATCH CLEAN-UP {self.current_iter}/"
                 f"{num_search_batches + prev_batches}"
             )
 
+    def run_missing_seed_jobs(
+        self,
+        batch_fnames: list,
+        run_ids: List[str],
+        random_seeds: List[int],
+        max_running_jobs: Union[int, None],
+    ):
+        """Relaunch incomplete seed jobs of an interrupted batch & merge seeds."""
+        missing = get_missing_seed_jobs(self.experiment_dir, run_ids, random_seeds)
+        remove_partial_seed_logs(self.experiment_dir, missing)
+        num_missing = sum([len(seeds) for seeds in missing.values()])
+        self.logger.info(
+            f"RESUME - {self.current_iter} Batch -"
+            f" {num_missing}/{len(run_ids) * len(random_seeds)} Seed Jobs Missing"
+        )
+        # Queues share seeds across configs - one queue per missing seed set
+        seed_groups = {}
+        for run_id, seeds in missing.items():
+            fname = batch_fnames[run_ids.index(run_id)]
+            seed_groups.setdefault(tuple(seeds), []).append(fname)
+        for seeds, config_fnames in seed_groups.items():
+            job_queue = self.job_queue_class(
+                self.resource_to_run,
+                self.job_fname,
+                self.job_arguments,
+                config_fnames,
+                self.experiment_dir,
+                len(seeds),
+                random_seeds=list(seeds),
+                max_running_jobs=max_running_jobs,
+                debug_mode=True,
+                cloud_settings=mle_config.gcp,
+                protocol_db=self.protocol_db,
+            )
+            job_queue.run()
+
+        # Merge seed logs of all runs - previously completed & relaunched
+        if self.hyper_log.no_results_logging:
+            return
+        for run_id in run_ids:
+            eval_dir = os.path.join(self.experiment_dir, run_id)
+            merged_path = os.path.join(eval_dir, "logs", "log.hdf5")
+            if not os.path.exists(merged_path):
+                merge_seed_logs(merged_path, eval_dir, len(random_seeds))
+
     def update_hyper_log(
         self, batch_proposals, run_ids, time_elapsed, num_seeds_per_eval
     ):
         """Merge eval log .hdf5 files & update hyperlogger w. performance."""
-        # Attempt merging of hyperlogs - until successful!
         if not self.hyper_log.no_results_logging:
-            while True:
-                try:
-                    merge_config_logs(
-                        self.experiment_dir,
-                        self.hyper_log.all_run_ids + run_ids,
-                    )
+            # Wait for complete run logs - raise if missing/corrupt at timeout
+            with RunLogWatcher(
+                self.experiment_dir, run_ids, num_seeds_per_eval, self.log_timeout
+            ) as watcher:
+                if self.incremental_merge:
+                    # Append runs to meta log as soon as their logs are ready
+                    meta_eval_log = DotMap(_dynamic=False)
+                    for ready_ids in watcher.wait():
+                        batch_log = merge_batch_logs(self.experiment_dir, ready_ids)
+                        for run_id in ready_ids:
+                            meta_eval_log[run_id] = batch_log[run_id]
+                else:
+                    watcher.wait_all()
+                    merge_run_ids = self.hyper_log.all_run_ids + run_ids
+                    # Cache hits have no run directory in this experiment
+                    if self.eval_cache is not None:
+                        merge_run_ids = [
+                            run_id
+                            for run_id in merge_run_ids
+                            if os.path.isdir(os.path.join(self.experiment_dir, run_id))
+                        ]
+                    merge_config_logs(self.experiment_dir, merge_run_ids)
                     # Load in meta-results log with values meaned over seeds
-                    meta_log_fname = os.path.join(
-                        self.experiment_dir, "meta_log.hdf5"
-                    )
-                    meta_eval_log = load_log(
-                        meta_log_fname, aggregate_seeds=True
-                    )
-                    break
-                except Exception:
-                    time.sleep(1)
-                    continue
+                    meta_log_fname = os.path.join(self.experiment_dir, "meta_log.hdf5")
+                    meta_eval_log = load_log(meta_log_fname, aggregate_seeds=True)
 
             self.logger.info(
                 f"MERGE - {len(run_ids)} Eval Configs of "
@@ -377,6 +834,18 @@ class MLE_BatchSearch(object):
             perf_measures, ckpts = self.hyper_log.update_log(
                 batch_proposals, meta_eval_log, time_elapsed, run_ids
             )
+            # Report current leaders from tracker - no rescan of hyper log
+            for metric in perf_measures.keys():
+                leaders = [
+                    f"{leader['run_id']} {leader['score']:.4g}"
+                    for leader in self.hyper_log.get_leaderboard(metric, 3)
+                ]
+                self.logger.info(f"LEADERS - {metric}: " + " | ".join(leaders))
+            # Report fastest profiled configs (jobs run w. `profile`)
+            fastest = self.hyper_log.rank_by_throughput(3)
+            if len(fastest) > 0:
+                ranking = [f"{f['run_id']} {f['throughput']:.4g}" for f in fastest]
+                self.logger.info("THROUGHPUT - steps/sec: " + " | ".join(ranking))
         else:
             # Log without collected results - perf_measures None output
             perf_measures, ckpts = self.hyper_log.update_log(
@@ -388,10 +857,100 @@ class MLE_BatchSearch(object):
             )
         return perf_measures, ckpts
 
+    def update_truncated_log(self, proposal: dict, run_id: str, time_elapsed: float):
+        """Merge partial seed logs of stopped eval & log it as truncated."""
+        eval_dir = os.path.join(self.experiment_dir, run_id)
+        log_dir = os.path.join(eval_dir, "logs")
+        # Drop partially written seed logs & logs without any stats yet
+        log_paths = glob.glob(os.path.join(log_dir, "log_seed_*.hdf5"))
+        num_logs = 0
+        for log_path in log_paths:
+            try:
+                with h5py.File(log_path, "r") as h5f:
+                    seed_ids = list(h5f.keys())
+                    assert len(seed_ids) > 0
+                    assert all(["stats" in h5f[k].keys() for k in seed_ids])
+                num_logs += 1
+            except Exception:
+                os.remove(log_path)
+        if num_logs == 0:
+            self.logger.info(f"STOPPED - {run_id} without readable logs")
+            return None, None
+        merge_seed_logs(os.path.join(log_dir, "log.hdf5"), eval_dir, None)
+        meta_eval_log = merge_batch_logs(self.experiment_dir, [run_id])
+        perf_measures, ckpts = self.hyper_log.update_log(
+            [proposal], meta_eval_log, time_elapsed, [run_id], truncated=True
+        )
+        self.logger.info(
+            f"STOPPED - {run_id} after {time_elapsed:.1f}s - {num_logs} Seeds"
+        )
+        return perf_measures, ckpts
+
+    def lookup_eval_cache(self, proposals: list, random_seeds: List[int]):
+        """Split proposals into cache hits (w. stored evals) & misses."""
+        if self.eval_cache is None:
+            return [], [], proposals
+        cached_proposals, cached_evals, missing_proposals = [], [], []
+        for proposal in proposals:
+            cached_eval = self.eval_cache.lookup(proposal, random_seeds)
+            if cached_eval is not None:
+                cached_proposals.append(proposal)
+                cached_evals.append(cached_eval)
+            else:
+                missing_proposals.append(proposal)
+        return cached_proposals, cached_evals, missing_proposals
+
+    def log_cached_evals(
+        self, proposals: list, cached_evals: list, eval_offset: int = 0
+    ):
+        """Add cache hits to hyper log - no configs/jobs/run dirs created."""
+        run_ids = [
+            "b_" + str(self.current_iter) + "_eval_" + str(s_id + eval_offset)
+            for s_id in range(len(proposals))
+        ]
+        if len(proposals) == 0:
+            return run_ids, {}, None
+        perf_measures, ckpts = self.hyper_log.update_log_cached(
+            proposals, cached_evals, run_ids
+        )
+        return run_ids, perf_measures, ckpts
+
+    def update_eval_cache(
+        self,
+        proposals: list,
+        random_seeds: List[int],
+        used_seeds: Union[List[int], None] = None,
+    ):
+        """Store the most recently logged evals of proposals in cache.
+        - Lookups use all `random_seeds` - raced evals which only ran a subset
+          of them (`used_seeds`) are not stored
+        """
+        if self.eval_cache is None or len(proposals) == 0:
+            return
+        if used_seeds is not None and sorted(used_seeds) != sorted(random_seeds):
+            return
+        start_id = self.hyper_log.iter_id - len(proposals) + 1
+        for i, proposal in enumerate(proposals):
+            eval_iter = self.hyper_log.opt_log[start_id + i]
+            self.eval_cache.store(proposal, random_seeds, eval_iter)
+
     def ask(self, num_iter_batch: int):
         """Get proposals to eval - implemented by specific hyperopt algo"""
         return self.strategy.ask(num_iter_batch)
 
+    def ask_async(self, pending_proposals: List[dict]) -> Union[dict, None]:
+        """Get single proposal that is not already running/pending."""
+        # Nevergrad keeps track of asked but not yet told candidates
+        if self.search_type == "Nevergrad":
+            return self.ask(1)
+        proposals = self.ask(len(pending_proposals) + 1)
+        if type(proposals) == dict:
+            proposals = [proposals]
+        for proposal in proposals:
+            if proposal not in pending_proposals:
+                return proposal
+        return None
+
     def tell(
         self,
         run_ids: list,
@@ -427,49 +986,82 @@ class MLE_BatchSearch(object):
         self.strategy.save(self.search_log_path)
 
     def gen_hyperparam_configs(self, proposals: list):
-        """Generate config file for a specific proposal to evaluate"""
+        """Generate config overlays for specific proposals to evaluate"""
+        # Share base config & only store proposed params (no deepcopy)
+        base_dict = self.base_config.toDict()
         config_params_batch = []
-        # Sample a new configuration for each eval in the batch
         for s_id in range(len(proposals)):
-            sample_config = copy.deepcopy(self.base_config)
-            # Construct config dicts individually - set params in train config
-            for param_name, param_value in proposals[s_id].items():
-                # Differentiate between model_config & train_config params
-                if "train_config" in sample_config.keys():
-                    try:
-                        config_id, param = param_name.split(":")
-                        if config_id == "train":
-                            sample_config.train_config[param] = param_value
-                        elif config_id == "model":
-                            sample_config.model_config[param] = param_value
-                    except Exception:
-                        # Merge nested config dictionaries
-                        if type(param_value) == dict:
-                            sample_config.train_config[param_name] = dict(
-                                merge_config_dicts(
-                                    sample_config.train_config[param_name],
-                                    param_value,
-                                )
-                            )
-                        else:
-                            sample_config.train_config[param_name] = param_value
-                else:
-                    sample_config[param_name] = param_value
+            sample_config = overlay_proposal(base_dict, proposals[s_id])
             # Add param configs to batch lists
             config_params_batch.append(sample_config)
         return config_params_batch
 
-    def write_configs_to_file(self, config_params_batch: list):
+    def write_configs_to_file(self, config_params_batch: list, eval_offset: int = 0):
         """Take batch-list of configs & write to jsons. Return fnames."""
         # Init list of config filenames to exec & base string for postproc
         params_batch, config_fnames_batch, all_run_ids = [], [], []
         for s_id in range(len(config_params_batch)):
-            run_id = "b_" + str(self.current_iter) + "_eval_" + str(s_id)
+            eval_id = s_id + eval_offset
+            run_id = "b_" + str(self.current_iter) + "_eval_" + str(eval_id)
             s_config_fname = os.path.join(
                 self.experiment_dir, run_id + self.config_fext
             )
             params_batch.append(config_params_batch[s_id].toDict())
             config_fnames_batch.append(s_config_fname)
             all_run_ids.append(run_id)
-        write_configs(params_batch, config_fnames_batch)
+        if self.config_manifest:
+            # Single file per batch - jobs get `<run_id>.<manifest>:<index>`
+            manifest_fname = os.path.join(
+                self.experiment_dir, f"b_{self.current_iter}_manifest.json"
+            )
+            config_fnames_batch = write_config_manifest(
+                params_batch, all_run_ids, manifest_fname
+            )
+        else:
+            write_configs(params_batch, config_fnames_batch)
         return config_fnames_batch, all_run_ids
+
+    def remove_config_files(self, config_fnames_batch: list):
+        """Delete batch configs after evaluation (or the batch manifest)."""
+        if self.config_manifest:
+            manifest_fnames = set(
+                [parse_manifest_ref(f)[0] for f in config_fnames_batch]
+            )
+            for f in manifest_fnames:
+                os.remove(f)
+        else:
+            for f in config_fnames_batch:
+                os.remove(f)
+
+
+def sample_random_seeds(
+    num_seeds_per_eval: int, random_seeds: Union[None, List[int]] = None
+) -> List[int]:
+    """Sample seeds shared by all evals (same scheme as in MLEQueue)."""
+    if random_seeds is not None:
+        return random_seeds
+    if num_seeds_per_eval > 1:
+        return np.random.choice(
+            np.arange(100000, 999999), num_seeds_per_eval, replace=False
+        ).tolist()
+    return [0]
+
+
+def merge_eval_results(
+    perf_measures: dict,
+    ckpts: Union[list, None],
+    cached_measures: dict,
+    cached_ckpts: Union[list, None],
+):
+    """Merge scores & ckpts of launched evals with cache hits."""
+    if len(cached_measures) == 0:
+        return perf_measures, ckpts
+    merged_measures = {}
+    for metric in set(perf_measures.keys()).union(cached_measures.keys()):
+        merged_measures[metric] = {
+            **perf_measures.get(metric, {}),
+            **cached_measures.get(metric, {}),
+        }
+    if ckpts is None and cached_ckpts is None:
+        return merged_measures, None
+    return merged_measures, (ckpts or []) + (cached_ckpts or [])
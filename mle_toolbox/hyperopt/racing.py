@@ -0,0 +1,85 @@
+import os
+import glob
+import h5py
+import numpy as np
+from statistics import NormalDist
+from typing import List, Union
+
+
+class SeedRacer(object):
+    def __init__(
+        self,
+        experiment_dir: str,
+        metric: str,
+        problem_type: str,
+        max_objective: bool,
+        min_seeds: int = 2,
+        seeds_per_round: Union[int, None] = None,
+        confidence: float = 0.95,
+    ):
+        """Adaptive seed allocation - only race evals still in contention.
+        - Evals start w. `min_seeds` & add `seeds_per_round` seeds as long as
+          the confidence interval of their per-seed scores overlaps the best
+        - Per-seed scores are computed from `log_seed_<id>.hdf5` files
+        """
+        self.experiment_dir = experiment_dir
+        self.metric = metric
+        self.problem_type = problem_type
+        self.max_objective = max_objective
+        self.min_seeds = min_seeds
+        self.seeds_per_round = seeds_per_round or min_seeds
+        # Two-sided normal quantile for the confidence interval half width
+        self.z_score = NormalDist().inv_cdf(0.5 + confidence / 2)
+        self.num_dropped, self.num_saved_seeds = 0, 0
+
+    def seed_scores(self, run_id: str) -> np.ndarray:
+        """Score each completed seed log of a run (final/best/mean)."""
+        log_dir = os.path.join(self.experiment_dir, run_id, "logs")
+        scores = []
+        for log_path in sorted(glob.glob(os.path.join(log_dir, "log_seed_*.hdf5"))):
+            with h5py.File(log_path, "r") as h5f:
+                for seed_id in h5f.keys():
+                    series = np.asarray(h5f[seed_id]["stats"][self.metric][:], float)
+                    if self.problem_type == "final":
+                        scores.append(series[-1])
+                    elif self.problem_type == "mean":
+                        scores.append(np.mean(series))
+                    elif self.max_objective:
+                        scores.append(np.max(series))
+                    else:
+                        scores.append(np.min(series))
+        return np.array(scores)
+
+    def confidence_interval(self, scores: np.ndarray):
+        """Normal approximation CI of the mean score over seeds."""
+        mean = np.mean(scores)
+        if len(scores) < 2:
+            return mean, -np.inf, np.inf
+        half_width = self.z_score * np.std(scores, ddof=1) / np.sqrt(len(scores))
+        return mean, mean - half_width, mean + half_width
+
+    def in_contention(self, scores: np.ndarray, best_score: Union[float, None]) -> bool:
+        """Check if CI of an eval's score still overlaps the current best."""
+        if best_score is None:
+            return True
+        _, lower, upper = self.confidence_interval(scores)
+        if self.max_objective:
+            return upper >= best_score
+        return lower <= best_score
+
+    def next_seeds(
+        self,
+        run_id: str,
+        used_seeds: List[int],
+        all_seeds: List[int],
+        best_score: Union[float, None],
+    ) -> List[int]:
+        """Get seeds to add to an eval - empty list if race is finished."""
+        remaining = [s for s in all_seeds if s not in used_seeds]
+        if len(remaining) == 0:
+            return []
+        if self.in_contention(self.seed_scores(run_id), best_score):
+            return remaining[: self.seeds_per_round]
+        self.num_dropped += 1
+        self.num_saved_seeds += len(remaining)
+        return []
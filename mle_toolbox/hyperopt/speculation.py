@@ -0,0 +1,389 @@
+import os
+import time
+import shutil
+import random
+import logging
+import threading
+import h5py
+import numpy as np
+from typing import List, Union
+from mle_scheduler import MLEJob
+from mle_logging.utils import write_to_hdf5
+from mle_toolbox import mle_config
+from .eval_pool import job_is_running, kill_job
+from ..utils.warm_pool import (
+    use_warm_pool,
+    get_warm_pool,
+    merge_queue_logs,
+    QueueProgress,
+)
+from ..utils.config_manifest import get_run_id
+from ..utils.batch_resume import get_seed_marker_fname
+
+# Seed log meta entries storing paths inside the job's run dir
+meta_path_keys = ["experiment_dir", "log_paths", "config_fname", "model_ckpt"]
+
+
+class StragglerDetector(object):
+    def __init__(
+        self,
+        slowdown: float = 2.0,
+        min_completed: float = 0.5,
+        min_runtime: float = 0.0,
+        max_speculative: Union[int, None] = None,
+    ):
+        """Flag seed jobs running much longer than expected for their batch.
+        - Expected runtime: median of earlier runs of the same config, else of
+          completed jobs in the batch (once `min_completed` of it is done),
+          else of all jobs of previous batches
+        - Jobs running `slowdown` x longer (& > `min_runtime` secs) straggle
+        - Keeps runtimes & speculation stats across the batches of a search
+        """
+        self.slowdown = slowdown
+        self.min_completed = min_completed
+        self.min_runtime = min_runtime
+        self.max_speculative = max_speculative
+        self.config_runtimes = {}
+        self.past_runtimes, self.batch_runtimes = [], []
+        self.num_speculative, self.num_won, self.time_saved = 0, 0, 0.0
+        self.start_batch(0)
+
+    def start_batch(self, num_jobs: int) -> None:
+        """Move runtimes of previous batch into history & reset batch counts."""
+        self.past_runtimes += self.batch_runtimes
+        self.batch_runtimes = []
+        self.num_jobs = num_jobs
+        self.batch_speculative, self.batch_won, self.batch_saved = 0, 0, 0.0
+
+    def add_runtime(self, config_key: Union[str, None], runtime: float) -> None:
+        """Record runtime of a completed (winning) seed job."""
+        self.batch_runtimes.append(runtime)
+        if config_key is not None:
+            self.config_runtimes.setdefault(config_key, []).append(runtime)
+
+    def expected_runtime(self, config_key: Union[str, None]) -> Union[float, None]:
+        """Runtime a seed job of config should take - None if no estimate."""
+        if config_key in self.config_runtimes.keys():
+            return float(np.median(self.config_runtimes[config_key]))
+        if len(self.batch_runtimes) >= max(1, self.min_completed * self.num_jobs):
+            return float(np.median(self.batch_runtimes))
+        if len(self.past_runtimes) > 0:
+            return float(np.median(self.past_runtimes))
+        return None
+
+    def is_straggler(self, config_key: Union[str, None], elapsed: float) -> bool:
+        """Check if running job should get a speculative duplicate."""
+        if elapsed < self.min_runtime:
+            return False
+        if self.max_speculative is not None:
+            if self.batch_speculative >= self.max_speculative:
+                return False
+        expected = self.expected_runtime(config_key)
+        return expected is not None and elapsed > self.slowdown * expected
+
+    def record_speculation(self) -> None:
+        """Count launched speculative duplicate."""
+        self.batch_speculative += 1
+        self.num_speculative += 1
+
+    def record_win(self, time_saved: float) -> None:
+        """Count duplicate finishing before its straggler & estimated savings."""
+        self.batch_won += 1
+        self.num_won += 1
+        self.batch_saved += time_saved
+        self.time_saved += time_saved
+
+    def summary(self) -> str:
+        """Report of speculative launches & estimated time saved in batch."""
+        return (
+            f"SPECULATION - {self.batch_speculative} Duplicates Launched -"
+            f" {self.batch_won} Won - Saved ~{self.batch_saved:.1f}s"
+            f" (Total: {self.num_speculative} | {self.num_won} |"
+            f" ~{self.time_saved:.1f}s)"
+        )
+
+
+def count_logged_steps(log_fname: str) -> int:
+    """Number of logged time steps in a (possibly still written) seed log."""
+    try:
+        with h5py.File(log_fname, "r") as h5f:
+            for seed_id in h5f.keys():
+                time_keys = list(h5f[seed_id]["time"].keys())
+                return len(h5f[seed_id]["time"][time_keys[0]])
+    except Exception:
+        pass
+    return 0
+
+
+def relocate_log_paths(log_fname: str, src_dir: str, dst_dir: str) -> None:
+    """Point path meta entries of a moved seed log to its new run dir."""
+    with h5py.File(log_fname, "r") as h5f:
+        meta_paths = {}
+        for seed_id in h5f.keys():
+            if "meta" not in h5f[seed_id].keys():
+                continue
+            meta = h5f[seed_id]["meta"]
+            for key in meta_path_keys:
+                if key in meta.keys():
+                    meta_paths[f"{seed_id}/meta/{key}"] = [
+                        p.decode() if isinstance(p, bytes) else p
+                        for p in np.asarray(meta[key]).ravel()
+                    ]
+    for log_path, paths in meta_paths.items():
+        paths = [
+            dst_dir + p[len(src_dir) :] if p.startswith(src_dir) else p for p in paths
+        ]
+        write_to_hdf5(log_fname, log_path, paths)
+
+
+def move_run_files(src_dir: str, dst_dir: str) -> None:
+    """Move all files of a duplicate's run dir into the original run dir."""
+    for root, _, fnames in os.walk(src_dir):
+        target_root = os.path.join(dst_dir, os.path.relpath(root, src_dir))
+        os.makedirs(target_root, exist_ok=True)
+        for fname in fnames:
+            os.replace(os.path.join(root, fname), os.path.join(target_root, fname))
+
+
+class SpeculativeJobQueue(object):
+    def __init__(
+        self,
+        resource_to_run: str,
+        job_filename: str,
+        job_arguments: dict,
+        config_filenames: Union[List[str], str],
+        experiment_dir: str,
+        num_seeds: int = 1,
+        default_seed: int = 0,
+        random_seeds: Union[None, List[int]] = None,
+        max_running_jobs: Union[int, None] = 10,
+        automerge_seeds: bool = False,
+        automerge_configs: bool = False,
+        debug_mode: bool = False,
+        detector: Union[StragglerDetector, None] = None,
+        config_keys: Union[List[str], None] = None,
+        poll_every: float = 1.0,
+        **kwargs,
+    ):
+        """Drop-in for `MLEQueue` duplicating straggling seed jobs of a batch.
+        - Once all jobs are launched, stragglers get a duplicate in a free slot
+        - Duplicates log to `<experiment_dir>/.speculative/` - the first copy
+          to finish successfully wins, the other is killed & reaped before
+          winning logs are moved in place (failed copies don't win)
+        - Each seed job gets at most one duplicate
+        - `config_keys` identify configs across batches for runtime history
+        - Completed jobs update protocol & slack progress bars (`QueueProgress`)
+        """
+        self.resource_to_run = resource_to_run
+        self.job_filename = job_filename
+        self.job_arguments = job_arguments.copy()
+        if type(config_filenames) != list:
+            config_filenames = [config_filenames]
+        self.config_filenames = config_filenames
+        self.experiment_dir = experiment_dir
+        if random_seeds is not None:
+            num_seeds = len(random_seeds)
+        elif num_seeds > 1:
+            random_seeds = random.sample(range(100000, 999999), num_seeds)
+        else:
+            random_seeds = [default_seed]
+        self.num_seeds = num_seeds
+        self.random_seeds = random_seeds
+        self.automerge_seeds = automerge_seeds
+        self.automerge_configs = automerge_configs
+        self.debug_mode = debug_mode
+        self.detector = detector if detector is not None else StragglerDetector()
+        self.poll_every = poll_every
+        self.extra_cmd_line_input = self.job_arguments.pop("extra_cmd_line_input", None)
+        self.warm_pool = None
+        if use_warm_pool(resource_to_run, self.job_arguments):
+            self.warm_pool = get_warm_pool(self.job_arguments.get("warm_pool_preload"))
+        self.speculative_dir = os.path.join(experiment_dir, ".speculative")
+        self.logger = logging.getLogger(__name__)
+        self.progress = QueueProgress(**kwargs)
+
+        self.queue, self.mle_log_dirs, self.mle_run_ids = [], [], []
+        for i, config_fname in enumerate(self.config_filenames):
+            base_str = get_run_id(config_fname)
+            self.mle_log_dirs.append(os.path.join(experiment_dir, base_str))
+            self.mle_run_ids.append(base_str)
+            for seed_id in self.random_seeds:
+                self.queue.append(
+                    {
+                        "config_fname": config_fname,
+                        "config_key": None if config_keys is None else config_keys[i],
+                        "run_id": base_str,
+                        "seed_id": seed_id,
+                        "copies": [],
+                        "start_t": None,
+                        "speculated": False,
+                        "done": False,
+                    }
+                )
+        self.max_running_jobs = max_running_jobs or len(self.queue)
+
+    def run(self) -> None:
+        """Run all config/seed jobs, duplicate stragglers & merge logs at end."""
+        self.detector.start_batch(len(self.queue))
+        self.progress.start(self)
+        to_launch = list(self.queue)
+        while not all([job["done"] for job in self.queue]):
+            while len(to_launch) > 0 and self.num_running < self.max_running_jobs:
+                self.launch(to_launch.pop(0))
+            for job in self.queue:
+                if not job["done"]:
+                    self.check_copies(job)
+            # Speculate only at the batch tail & only into free slots
+            if len(to_launch) == 0:
+                for job in self.queue:
+                    if self.num_running >= self.max_running_jobs:
+                        break
+                    if job["done"] or job["speculated"]:
+                        continue
+                    elapsed = time.time() - job["start_t"]
+                    if self.detector.is_straggler(job["config_key"], elapsed):
+                        self.launch(job, speculative=True)
+                        job["speculated"] = True
+                        self.detector.record_speculation()
+                        expected = self.detector.expected_runtime(job["config_key"])
+                        self.logger.info(
+                            f"SPECULATE - {job['run_id']} Seed {job['seed_id']}"
+                            f" - Running {elapsed:.1f}s (Expected {expected:.1f}s)"
+                        )
+            time.sleep(self.poll_every)
+
+        if os.path.exists(self.speculative_dir):
+            shutil.rmtree(self.speculative_dir, ignore_errors=True)
+        merge_queue_logs(
+            self.experiment_dir,
+            self.mle_log_dirs,
+            self.mle_run_ids,
+            self.num_seeds,
+            self.automerge_seeds,
+            self.automerge_configs,
+        )
+
+    @property
+    def num_running(self) -> int:
+        """Number of running job copies (originals & duplicates)."""
+        return sum([len(job["copies"]) for job in self.queue if not job["done"]])
+
+    def launch(self, job: dict, speculative: bool = False) -> None:
+        """Launch original job or its speculative duplicate (own exp dir)."""
+        experiment_dir = self.experiment_dir
+        if speculative:
+            experiment_dir = os.path.join(
+                self.speculative_dir, f"{job['run_id']}_{job['seed_id']}"
+            )
+            os.makedirs(experiment_dir, exist_ok=True)
+        if self.warm_pool is not None:
+            mle_job = None
+            job_id = self.warm_pool.submit_job(
+                self.job_filename,
+                job["config_fname"],
+                experiment_dir,
+                job["seed_id"],
+                self.extra_cmd_line_input,
+            )
+        else:
+            mle_job = MLEJob(
+                self.resource_to_run,
+                self.job_filename,
+                self.job_arguments,
+                job["config_fname"],
+                experiment_dir,
+                job["seed_id"],
+                self.extra_cmd_line_input,
+                False,
+                self.debug_mode,
+                mle_config.gcp,
+            )
+            job_id = mle_job.schedule()
+            # Drain stdout/stderr pipes of local processes so they don't block
+            if self.resource_to_run == "local":
+                threading.Thread(target=job_id.communicate, daemon=True).start()
+        if not speculative:
+            job["start_t"] = time.time()
+        job["copies"].append(
+            {
+                "job": mle_job,
+                "job_id": job_id,
+                "experiment_dir": experiment_dir,
+                "start_t": time.time(),
+                "speculative": speculative,
+            }
+        )
+
+    def check_copies(self, job: dict) -> None:
+        """First successful copy wins - stop other copy & keep winner's logs.
+        - A failed copy is dropped while the other copy keeps running
+        """
+        for winner in list(job["copies"]):
+            if job_is_running(self.resource_to_run, winner["job"], winner["job_id"]):
+                continue
+            succeeded = self.copy_succeeded(job, winner)
+            if not succeeded and len(job["copies"]) > 1:
+                job["copies"].remove(winner)
+                if winner["speculative"]:
+                    shutil.rmtree(winner["experiment_dir"], ignore_errors=True)
+                self.logger.info(
+                    f"SPECULATE - {job['run_id']} Seed {job['seed_id']} -"
+                    f" {'Duplicate' if winner['speculative'] else 'Original'}"
+                    " Failed - Waiting for Other Copy"
+                )
+                continue
+            job["done"] = True
+            self.progress.job_completed()
+            runtime = time.time() - winner["start_t"]
+            if succeeded:
+                self.detector.add_runtime(job["config_key"], runtime)
+            for other in job["copies"]:
+                if other is winner:
+                    continue
+                self.stop_copy(other)
+                if other["speculative"]:
+                    shutil.rmtree(other["experiment_dir"], ignore_errors=True)
+            if winner["speculative"]:
+                if succeeded:
+                    self.promote(job, winner, runtime)
+                shutil.rmtree(winner["experiment_dir"], ignore_errors=True)
+            return
+
+    def copy_succeeded(self, job: dict, copy: dict) -> bool:
+        """Local copies need exit code 0 - cluster copies their seed marker."""
+        if self.resource_to_run == "local":
+            return copy["job_id"].poll() == 0
+        run_dir = os.path.join(copy["experiment_dir"], job["run_id"])
+        return os.path.exists(get_seed_marker_fname(run_dir, job["seed_id"]))
+
+    def stop_copy(self, copy: dict) -> None:
+        """Kill losing copy & wait until it exited - no more log writes."""
+        kill_job(self.resource_to_run, copy["job_id"])
+        while job_is_running(self.resource_to_run, copy["job"], copy["job_id"]):
+            time.sleep(min(self.poll_every, 0.1))
+
+    def promote(self, job: dict, winner: dict, runtime: float) -> None:
+        """Replace the straggler's partial logs w. the duplicate's run files.
+        - Path meta entries of the seed log are rewritten to the real run dir
+        - Time saved is extrapolated from the straggler's logged steps
+        """
+        log_name = os.path.join("logs", f"log_seed_{job['seed_id']}.hdf5")
+        run_dir = os.path.join(self.experiment_dir, job["run_id"])
+        spec_run_dir = os.path.join(winner["experiment_dir"], job["run_id"])
+        done_steps = count_logged_steps(os.path.join(spec_run_dir, log_name))
+        straggler_steps = count_logged_steps(os.path.join(run_dir, log_name))
+        elapsed = time.time() - job["start_t"]
+        if straggler_steps > 0 and done_steps > straggler_steps:
+            progress = straggler_steps / done_steps
+            time_saved = elapsed * (1 - progress) / progress
+        else:
+            # No usable progress logged - assume it needed at least as long
+            time_saved = runtime
+        move_run_files(spec_run_dir, run_dir)
+        if os.path.exists(os.path.join(run_dir, log_name)):
+            relocate_log_paths(os.path.join(run_dir, log_name), spec_run_dir, run_dir)
+        self.detector.record_win(time_saved)
+        self.logger.info(
+            f"SPECULATE - {job['run_id']} Seed {job['seed_id']} - Duplicate"
+            f" Won after {runtime:.1f}s - Saved ~{time_saved:.1f}s"
+        )
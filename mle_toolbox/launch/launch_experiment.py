@@ -3,7 +3,13 @@ from .processing_job import run_processing_job
 from .multi_config import run_multiple_configs
 from .search_experiment import run_hyperparameter_search
 from .prepare_experiment import prepare_logger
+from .pipeline import StagePipeline
+from .spawn_jobs import spawn_multiple_seeds
+from ..hyperopt.eval_cache import canonical_hash
+from ..hyperopt.mle_batch_search import sample_random_seeds
 from ..utils import print_framed
+from ..utils.config_manifest import get_run_id
+from mle_logging import merge_config_logs
 from mle_toolbox import mle_config
 from mle_monitor import MLEProtocol
 from typing import Union
@@ -19,19 +25,30 @@ def launch_processing(
     message_id: Union[str, None] = None,
     bot=None,
     debug_mode: bool = False,
+    run_id: Union[str, None] = None,
+    protocol_db: Union[MLEProtocol, None] = None,
 ):
+    """Run pre-/post-processing job (optionally for a single config run)."""
     if preprocess:
         print_framed("PRE-PROCESSING")
+        processing_args = job_config.pre_processing_args
     else:
         print_framed("POST-PROCESSING")
+        processing_args = job_config.post_processing_args
     str_to_log = "Pre-processing" if preprocess else "Post-processing"
+    experiment_dir = job_config.meta_job_args["experiment_dir"]
+    # Per-config post-processing runs on the config's sub-directory
+    if run_id is not None:
+        str_to_log += f" {run_id}"
+        experiment_dir = os.path.join(experiment_dir, run_id)
     logger = prepare_logger()
     logger.info(f"{str_to_log} job for experiment - STARTING")
     run_processing_job(
         resource_to_run,
-        job_config.pre_processing_args,
-        job_config.meta_job_args["experiment_dir"],
+        processing_args,
+        experiment_dir,
         debug_mode,
+        protocol_db,
     )
     logger.info(f"{str_to_log} experiment results - COMPLETED")
 
@@ -52,6 +69,15 @@ def launch_experiment(
     protocol_db: Union[MLEProtocol, None] = None,
     debug_mode: bool = False,
 ):
+    """Run pre-processing, main experiment & post-processing stages.
+    - Stages are executed as dependency graph (`StagePipeline`)
+    - `post_processing_args.per_config` (multi-config only) post-processes
+      each config as soon as its seeds completed - overlaps w. other configs
+    - `meta_job_args.cache_stages` skips the pre-processing stage if it
+      completed before w. the same arguments (markers in
+      `<experiment_dir>/.stages`) - main stages always rerun, so post-processing
+      of their fresh results does, too
+    """
     if not no_protocol and mle_config.general.use_slack_bot:
         try:
             from clusterbot import ClusterBot, activate_logger
@@ -68,16 +94,128 @@ def launch_experiment(
         )
     else:
         bot = None
+
+    prepare_wandb_args(job_config)
+    pipeline = build_experiment_pipeline(
+        resource_to_run,
+        job_config,
+        no_protocol,
+        message_id,
+        protocol_db,
+        bot,
+        debug_mode,
+    )
+    pipeline.run()
+
+
+def build_experiment_pipeline(
+    resource_to_run: str,
+    job_config: dict,
+    no_protocol: bool = False,
+    message_id: Union[str, None] = None,
+    protocol_db: Union[MLEProtocol, None] = None,
+    bot=None,
+    debug_mode: bool = False,
+) -> StagePipeline:
+    """Construct stage graph: pre -> main (per config) -> post (per config)."""
+    experiment_dir = job_config.meta_job_args["experiment_dir"]
+    cache_dir = None
+    if job_config.meta_job_args.get("cache_stages", False):
+        cache_dir = os.path.join(experiment_dir, ".stages")
+    pipeline = StagePipeline(cache_dir)
+
+    def processing_stage(preprocess: bool, run_id: Union[str, None] = None):
+        return lambda: launch_processing(
+            preprocess,
+            resource_to_run,
+            job_config,
+            no_protocol,
+            message_id,
+            bot,
+            debug_mode,
+            run_id,
+            protocol_db,
+        )
+
+    def processing_key(processing_args: dict):
+        return canonical_hash({"args": processing_args, "dir": experiment_dir})
+
     # Perform pre-processing if arguments are provided
+    main_deps = []
     if "pre_processing_args" in job_config.keys():
-        launch_processing(
-            True, job_config, no_protocol, message_id, bot, debug_mode
+        pipeline.add_stage(
+            "pre",
+            processing_stage(True),
+            cache_key=processing_key(job_config.pre_processing_args),
         )
+        main_deps = ["pre"]
+
+    # Run the main experiment - split multi-config runs for per-config post
+    per_config = False
+    if "post_processing_args" in job_config.keys():
+        per_config = job_config.post_processing_args.get("per_config", False)
+    if per_config:
+        assert (
+            job_config.meta_job_args["experiment_type"] == "multiple-configs"
+        ), "Per-config post-processing requires a multiple-configs experiment."
+        multi_config_args = job_config.multi_config_args
+        if "random_seeds" not in multi_config_args.keys():
+            multi_config_args["random_seeds"] = None
+        if "num_seeds" not in multi_config_args.keys():
+            multi_config_args["num_seeds"] = len(multi_config_args["random_seeds"])
+        # All configs share seeds (as in a single multi-config queue)
+        random_seeds = sample_random_seeds(
+            multi_config_args["num_seeds"], multi_config_args["random_seeds"]
+        )
+        run_ids = []
+        for config_fname in multi_config_args["config_fnames"]:
+            run_id = get_run_id(config_fname)
+            run_ids.append(run_id)
+            pipeline.add_stage(
+                f"main/{run_id}",
+                lambda config_fname=config_fname: launch_config_seeds(
+                    resource_to_run,
+                    job_config,
+                    config_fname,
+                    random_seeds,
+                    message_id,
+                    protocol_db,
+                    debug_mode,
+                ),
+                main_deps,
+            )
+            pipeline.add_stage(
+                f"post/{run_id}", processing_stage(False, run_id), [f"main/{run_id}"]
+            )
+        pipeline.add_stage(
+            "main",
+            lambda: finish_config_seeds(
+                job_config, run_ids, no_protocol, message_id, bot
+            ),
+            [f"main/{run_id}" for run_id in run_ids],
+        )
+    else:
+        pipeline.add_stage(
+            "main",
+            lambda: launch_main_experiment(
+                resource_to_run,
+                job_config,
+                no_protocol,
+                message_id,
+                protocol_db,
+                bot,
+                debug_mode,
+            ),
+            main_deps,
+        )
+        # Perform post-processing of results if arguments are provided
+        if "post_processing_args" in job_config.keys():
+            pipeline.add_stage("post", processing_stage(False), ["main"])
+    return pipeline
 
-    # Run the main experiment
-    print_framed("RUN EXPERIMENT")
 
-    # W&B - update single_job_args with project_name and experiment_dir ending
+def prepare_wandb_args(job_config: dict) -> None:
+    """W&B - update single_job_args with project_name & experiment_dir ending."""
     if "extra_cmd_line_input" not in job_config.single_job_args.keys():
         job_config.single_job_args["extra_cmd_line_input"] = {}
     job_config.single_job_args["extra_cmd_line_input"][
@@ -89,6 +227,80 @@ def launch_experiment(
         [datetime.today().strftime("%m-%d-%H-%M")] + path.split(os.sep)[1:]
     )
     job_config.single_job_args["extra_cmd_line_input"]["wb_group"] = group_name
+
+
+def launch_config_seeds(
+    resource_to_run: str,
+    job_config: dict,
+    config_fname: str,
+    random_seeds: list,
+    message_id: Union[str, None] = None,
+    protocol_db: Union[MLEProtocol, None] = None,
+    debug_mode: bool = False,
+) -> None:
+    """Run all seeds of a single config of a multi-config experiment.
+    - Completed seed jobs update the protocol & slack progress bar
+    """
+    print_framed(f"RUN CONFIG {config_fname}")
+    spawn_multiple_seeds(
+        resource_to_run,
+        job_config.meta_job_args["base_train_fname"],
+        config_fname,
+        job_config.single_job_args,
+        job_config.meta_job_args["experiment_dir"],
+        len(random_seeds),
+        random_seeds=random_seeds,
+        slack_message_id=message_id,
+        protocol_db=protocol_db,
+        debug_mode=debug_mode,
+    )
+
+
+def finish_config_seeds(
+    job_config: dict,
+    run_ids: list,
+    no_protocol: bool = False,
+    message_id: Union[str, None] = None,
+    bot=None,
+) -> None:
+    """Merge per-config logs into meta log once all configs completed."""
+    merge_config_logs(
+        experiment_dir=job_config.meta_job_args["experiment_dir"],
+        all_run_ids=run_ids,
+    )
+    notify_main_finished(job_config, no_protocol, message_id, bot)
+
+
+def notify_main_finished(
+    job_config: dict,
+    no_protocol: bool = False,
+    message_id: Union[str, None] = None,
+    bot=None,
+) -> None:
+    """Update slack bot experiment message - main experiment jobs."""
+    if not no_protocol and mle_config.general.use_slack_bot:
+        bot.reply(
+            message_id,
+            ":steam_locomotive: "
+            "Finished main experiment: "
+            f"`{job_config.meta_job_args['experiment_type']}`"
+            " :steam_locomotive:",
+            user_name=mle_config.slack.user_name,
+        )
+
+
+def launch_main_experiment(
+    resource_to_run: str,
+    job_config: dict,
+    no_protocol: bool = False,
+    message_id: Union[str, None] = None,
+    protocol_db: Union[MLEProtocol, None] = None,
+    bot=None,
+    debug_mode: bool = False,
+) -> None:
+    """Run single-config, multi-config or search experiment."""
+    # Run the main experiment
+    print_framed("RUN EXPERIMENT")
     # (a) Experiment: Run a single experiment
     if job_config.meta_job_args["experiment_type"] == "single-config":
         run_single_config(
@@ -137,19 +349,4 @@ def launch_experiment(
             debug_mode,
         )
 
-    # Update slack bot experiment message - main experiment jobs
-    if not no_protocol and mle_config.general.use_slack_bot:
-        bot.reply(
-            message_id,
-            ":steam_locomotive: "
-            "Finished main experiment: "
-            f"`{job_config.meta_job_args['experiment_type']}`"
-            " :steam_locomotive:",
-            user_name=mle_config.slack.user_name,
-        )
-
-    # 10. Perform post-processing of results if arguments are provided
-    if "post_processing_args" in job_config.keys():
-        launch_processing(
-            False, job_config, no_protocol, message_id, bot, debug_mode
-        )
+    notify_main_finished(job_config, no_protocol, message_id, bot)
@@ -0,0 +1,110 @@
+import os
+import json
+import hashlib
+import logging
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Callable, Dict, List, Union
+
+
+class StagePipeline(object):
+    def __init__(
+        self,
+        cache_dir: Union[str, None] = None,
+        max_workers: Union[int, None] = None,
+    ):
+        """Dependency graph executor for experiment stages (pre/main/post).
+        - Stages run in threads as soon as all their dependencies completed
+        - Failed stages skip their dependents, independent stages still run
+        - Stages w. `cache_key` (& cached deps) are skipped if a marker in
+          `cache_dir` stores the same key from a previous successful run
+        """
+        self.cache_dir = cache_dir
+        self.max_workers = max_workers
+        self.stages = {}
+        self.logger = logging.getLogger(__name__)
+
+    def add_stage(
+        self,
+        name: str,
+        fn: Callable,
+        deps: Union[List[str], None] = None,
+        cache_key: Union[str, None] = None,
+    ) -> None:
+        """Add stage - dependencies have to be added before (no cycles)."""
+        assert name not in self.stages.keys(), f"Stage {name} already exists."
+        deps = deps or []
+        for dep in deps:
+            assert dep in self.stages.keys(), f"Stage {name}: {dep} unknown."
+        # Stage outputs are only reusable if all inputs are reusable, too
+        if cache_key is not None and all(
+            [self.stages[d]["cache_key"] is not None for d in deps]
+        ):
+            dep_keys = [self.stages[d]["cache_key"] for d in deps]
+            cache_key = hashlib.sha256(
+                json.dumps([cache_key] + dep_keys).encode()
+            ).hexdigest()
+        else:
+            cache_key = None
+        self.stages[name] = {"fn": fn, "deps": deps, "cache_key": cache_key}
+
+    def run(self) -> Dict[str, str]:
+        """Execute stages - return status (done/cached/failed/skipped) per stage.
+        - Re-raises the first stage error after all runnable stages finished
+        """
+        status, errors, running = {}, {}, {}
+        max_workers = self.max_workers or max(1, len(self.stages))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while len(status) < len(self.stages):
+                for name, stage in self.stages.items():
+                    if name in status or name in running.values():
+                        continue
+                    dep_status = [status.get(d) for d in stage["deps"]]
+                    if any([s in ["failed", "skipped"] for s in dep_status]):
+                        status[name] = "skipped"
+                        self.logger.info(f"STAGE - {name} - SKIPPED")
+                    elif all([s in ["done", "cached"] for s in dep_status]):
+                        if self.is_cached(name):
+                            status[name] = "cached"
+                            self.logger.info(f"STAGE - {name} - CACHED")
+                        else:
+                            self.logger.info(f"STAGE - {name} - STARTING")
+                            running[executor.submit(stage["fn"])] = name
+                if len(running) == 0:
+                    continue
+                done, _ = wait(list(running.keys()), return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    if future.exception() is not None:
+                        status[name] = "failed"
+                        errors[name] = future.exception()
+                        self.logger.info(f"STAGE - {name} - FAILED")
+                    else:
+                        status[name] = "done"
+                        self.store_cache(name)
+                        self.logger.info(f"STAGE - {name} - COMPLETED")
+        if len(errors) > 0:
+            raise list(errors.values())[0]
+        return status
+
+    def cache_fname(self, name: str) -> str:
+        """Marker file storing cache key of a completed stage."""
+        return os.path.join(self.cache_dir, f"{name.replace('/', '_')}.json")
+
+    def is_cached(self, name: str) -> bool:
+        """Check if stage already completed w. same inputs."""
+        cache_key = self.stages[name]["cache_key"]
+        if self.cache_dir is None or cache_key is None:
+            return False
+        if not os.path.exists(self.cache_fname(name)):
+            return False
+        with open(self.cache_fname(name), "r") as f:
+            return json.load(f)["cache_key"] == cache_key
+
+    def store_cache(self, name: str) -> None:
+        """Write cache marker after stage completed successfully."""
+        cache_key = self.stages[name]["cache_key"]
+        if self.cache_dir is None or cache_key is None:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with open(self.cache_fname(name), "w") as f:
+            json.dump({"cache_key": cache_key}, f)
@@ -1,4 +1,9 @@
+import logging
+from typing import Union
+from mle_monitor import MLEProtocol
 from .spawn_jobs import spawn_processing_job
+from ..utils.processing_cache import get_processing_cache
+from ..utils.protocol_data import record_processing_cache_hit
 
 
 def run_processing_job(
@@ -6,13 +11,31 @@ def run_processing_job(
     processing_args: dict,
     experiment_dir: str,
     debug_mode: bool = False,
+    protocol_db: Union[MLEProtocol, None] = None,
 ):
-    """Execute job for post processing of previously obtained results."""
+    """Execute job for post processing of previously obtained results.
+    - Jobs declaring `outputs` (& `inputs`) are skipped if the outputs exist
+      & the hash manifest of script, args & inputs matches the previous run.
+      Returns "cached" in that case & records the hit in the protocol.
+    """
     if "extra_cmd_line_input" in processing_args.keys():
         extra_cmd_line_input = processing_args["extra_cmd_line_input"]
     else:
         extra_cmd_line_input = None
 
+    cache = get_processing_cache(processing_args, experiment_dir)
+    if cache is not None and cache.is_hit():
+        logger = logging.getLogger(__name__)
+        logger.info(
+            f"Processing job {processing_args['processing_fname']} - CACHED"
+            f" ({cache.manifest_fname})"
+        )
+        if protocol_db is not None:
+            record_processing_cache_hit(
+                protocol_db, processing_args["processing_fname"], cache
+            )
+        return "cached"
+
     status_out = spawn_processing_job(
         resource_to_run=resource_to_run,
         job_filename=processing_args["processing_fname"],
@@ -21,4 +44,6 @@ def run_processing_job(
         extra_cmd_line_input=extra_cmd_line_input,
         debug_mode=debug_mode,
     )
+    if cache is not None and status_out == 0:
+        cache.store()
     return status_out
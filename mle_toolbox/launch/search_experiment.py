@@ -1,6 +1,9 @@
 import os
+import copy
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Union
 from ..hyperopt import HyperoptLogger, MLE_BatchSearch
+from ..hyperopt.eval_pool import JobBudget
 from pathlib import Path
 from mle_monitor import MLEProtocol
 
@@ -28,6 +31,36 @@ def run_hyperparameter_search(
         config_files = [meta_job_args["base_train_config"]]
         experiment_dirs = [meta_job_args["experiment_dir"]]
 
+    # Run per-config async searches concurrently w. shared running job budget
+    if meta_job_args.get("concurrent_configs", False) and len(config_files) > 1:
+        assert (
+            param_search_args["search_config"].get("search_schedule") == "async"
+        ), "Concurrent config searches require 'async' search schedule."
+        job_budget = JobBudget(
+            param_search_args["search_resources"]["max_running_jobs"]
+        )
+        with ThreadPoolExecutor(max_workers=len(config_files)) as executor:
+            futures = [
+                executor.submit(
+                    run_single_batch_search,
+                    resource_to_run,
+                    meta_job_args["base_train_fname"],
+                    config_files[i],
+                    experiment_dirs[i],
+                    single_job_args,
+                    copy.deepcopy(param_search_args),
+                    message_id,
+                    protocol_db,
+                    debug_mode,
+                    job_budget,
+                )
+                for i in range(len(config_files))
+            ]
+            # Raise exceptions of individual searches
+            for future in futures:
+                future.result()
+        return
+
     for i in range(len(config_files)):
         run_single_batch_search(
             resource_to_run,
@@ -54,6 +87,7 @@ def run_single_batch_search(
     message_id: Union[str, None] = None,
     protocol_db: Union[MLEProtocol, None] = None,
     debug_mode: bool = False,
+    job_budget: Union[JobBudget, None] = None,
 ) -> None:
     """Run a hyperparameter search experiment for a single configuration."""
     # 1. Setup the hyperlogger for the experiment
@@ -130,7 +164,8 @@ def run_single_batch_search(
         **param_search_args["search_config"],
         message_id=message_id,
         protocol_db=protocol_db,
-        debug_mode=debug_mode
+        debug_mode=debug_mode,
+        job_budget=job_budget,
     )
 
     # Special Case: Hyperband & Successive Halving -> Compute required
@@ -1,9 +1,11 @@
 import os
 import logging
 from typing import Union, List
-from mle_scheduler import MLEJob, MLEQueue
+from mle_scheduler import MLEJob
 from mle_monitor import MLEProtocol
 from mle_toolbox import mle_config, check_single_job_args
+from ..utils.warm_pool import use_warm_pool, get_warm_pool
+from ..utils.job_queue import get_job_queue_class
 
 
 def spawn_single_job(
@@ -26,6 +28,17 @@ def spawn_single_job(
         else:
             extra_cmd_line_input = None
 
+    # Run in a pre-forked warm worker instead of a fresh python process
+    if use_warm_pool(resource_to_run, job_arguments):
+        job = get_warm_pool(job_arguments.get("warm_pool_preload")).submit_job(
+            job_filename,
+            config_filename,
+            experiment_dir,
+            None,
+            extra_cmd_line_input,
+        )
+        return 0 if job.wait() == 0 else -1
+
     # 1. Instantiate the experiment class
     experiment = MLEJob(
         resource_to_run=resource_to_run,
@@ -84,13 +97,16 @@ def spawn_multiple_seeds(
     random_seeds: Union[None, List[int]] = None,
     logger_level: int = logging.WARNING,
     debug_mode: bool = False,
+    slack_message_id: Union[str, None] = None,
+    protocol_db: Union[MLEProtocol, None] = None,
 ):
     """Spawn same experiment w. diff. seeds multiple times locally/remote."""
     # 0. Check if all required args are given - otw. add default to copy
     job_arguments = check_single_job_args(resource_to_run, job_arguments.copy())
 
-    # 1. Instantiate the experiment class
-    multi_experiment = MLEQueue(
+    # 1. Instantiate the experiment class (warm workers, seed groups)
+    queue_class = get_job_queue_class(resource_to_run, job_arguments)
+    multi_experiment = queue_class(
         resource_to_run=resource_to_run,
         job_filename=job_filename,
         job_arguments=job_arguments,
@@ -101,6 +117,11 @@ def spawn_multiple_seeds(
         max_running_jobs=num_seeds,
         automerge_seeds=True,
         cloud_settings=mle_config.gcp,
+        use_slack_bot=mle_config.general.use_slack_bot,
+        slack_message_id=slack_message_id,
+        slack_user_name=mle_config.slack.user_name,
+        slack_auth_token=mle_config.slack.slack_token,
+        protocol_db=protocol_db,
         debug_mode=debug_mode,
     )
 
@@ -149,7 +170,8 @@ def spawn_multiple_configs(
 
     # Run Experiment Jobs in Batch mode!
     default_seed = 0
-    multi_experiment = MLEQueue(
+    queue_class = get_job_queue_class(resource_to_run, job_arguments)
+    multi_experiment = queue_class(
         resource_to_run=resource_to_run,
         job_filename=job_filename,
         job_arguments=job_arguments,
@@ -169,6 +191,9 @@ def spawn_multiple_configs(
         debug_mode=debug_mode,
     )
     multi_experiment.run()
+    # Local admission control - report queue wait vs. run time
+    if hasattr(multi_experiment, "admission"):
+        logger.info(multi_experiment.admission.summary())
 
     logger.info(
         "DONE  - different {} configurations & {} random seeds".format(
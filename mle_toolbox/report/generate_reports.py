@@ -1,10 +1,12 @@
 import os
 import logging
+import numpy as np
 from datetime import datetime
 from typing import Union
 from dotmap import DotMap
 from .generate_markdown import MarkdownGenerator
 from .generate_figures import FigureGenerator
+from ..utils.profiler import load_profiles
 from ..launch import prepare_logger
 
 
@@ -84,8 +86,9 @@ class ReportGenerator:
         self.logger.info(f"{self.experiment_dir}")
         # 2a. Write the relevant data to the markdown report file
         self.md_report_fname = os.path.join(self.reports_dir, self.e_id + ".md")
+        profile_table = construct_profile_table(self.fig_generator.meta_log)
         self.markdown_text = generate_markdown(
-            self.e_id, self.md_report_fname, self.report_data
+            self.e_id, self.md_report_fname, self.report_data, profile_table
         )
         self.logger.info(f'Report - GENERATED - .md: {self.e_id + ".md"}')
 
@@ -173,6 +176,48 @@ def construct_markdown_table(
     return table
 
 
+def construct_profile_table(meta_log):
+    """Construct a markdown table for the profiled timing breakdown per run."""
+    table = []
+    for run_id in meta_log.eval_ids:
+        if "meta" not in meta_log[run_id].keys():
+            continue
+        profiles = load_profiles(meta_log[run_id].meta)
+        if len(profiles) == 0:
+            continue
+        # Mean over the profiled seeds of the run
+        phases = {}
+        for profile in profiles:
+            for name, stats in profile["phases"].items():
+                phases.setdefault(name, []).append(stats["wall_frac"])
+        phase_fracs = {name: np.mean(fracs) for name, fracs in phases.items()}
+        phase_str = ", ".join(
+            [
+                f"{name} {100 * frac:.0f}%"
+                for name, frac in sorted(
+                    phase_fracs.items(), key=lambda x: -x[1]
+                )
+            ]
+        )
+
+        mean_of = {
+            k: np.mean([p[k] for p in profiles])
+            for k in ["steps_per_sec", "wall_time", "cpu_time"]
+        }
+        max_rss = max([p["peak_rss_mb"] for p in profiles])
+        table.append(
+            {
+                "Run": "`" + str(run_id) + "`",
+                "Steps/Sec": f"{mean_of['steps_per_sec']:.2f}",
+                "Wall (s)": f"{mean_of['wall_time']:.1f}",
+                "CPU (s)": f"{mean_of['cpu_time']:.1f}",
+                "Peak RSS (MB)": f"{max_rss:.0f}",
+                "Phases (Wall)": phase_str,
+            }
+        )
+    return table
+
+
 def construct_hypersearch_table(search_params):
     """Construct a markdown table for the hyperparameter search ranges."""
     table, current_row = [], {}
@@ -195,8 +240,8 @@ def construct_hypersearch_table(search_params):
     return table
 
 
-def generate_markdown(e_id, md_report_fname, report_data):
-    """Generate MD report from experiment meta data."""
+def generate_markdown(e_id, md_report_fname, report_data, profile_table=None):
+    """Generate MD report from experiment meta data (& run profiles)."""
     # Special treatment of dict keys/individual vars in report_data
     job_keys = ["meta_job_args", "single_job_args", "job_spec_args"]
     config_keys = ["loaded_config"]
@@ -277,6 +322,11 @@ def generate_markdown(e_id, md_report_fname, report_data):
         )
         doc.addTable(dictionary_list=log_table)
 
+        # Timing breakdown of runs launched w. profiling enabled
+        if profile_table is not None and len(profile_table) > 0:
+            doc.addHeader(2, "Run Profiles.")
+            doc.addTable(dictionary_list=profile_table)
+
         # Generated header for figures of the Experiment
         doc.addHeader(2, "Generated Figures.")
 
@@ -0,0 +1,198 @@
+import os
+import time
+import threading
+import contextlib
+import numpy as np
+from typing import List, Union
+from mle_scheduler import MLEJob
+from .warm_pool import WarmJobQueue, merge_queue_logs
+
+# Safely import such that no import errors are thrown - reduce dependencies
+try:
+    import psutil
+
+    __psutil_installed = True
+except ImportError:
+    __psutil_installed = False
+    pass
+
+
+def use_admission_control(
+    resource_to_run: str, job_arguments: Union[dict, None]
+) -> bool:
+    """Check if local jobs are admitted by cores/memory (`admission_control`)."""
+    if resource_to_run != "local" or job_arguments is None:
+        return False
+    return bool(job_arguments.get("admission_control", False))
+
+
+def get_available_cpus() -> List[int]:
+    """Logical cores this process may run on (respects existing pinning)."""
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count()))
+
+
+def get_available_memory() -> Union[float, None]:
+    """Available memory in MB (psutil or /proc/meminfo) - None if unknown."""
+    if __psutil_installed:
+        return psutil.virtual_memory().available / 1024**2
+    try:
+        with open("/proc/meminfo") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+@contextlib.contextmanager
+def pinned_affinity(cpu_set: Union[List[int], None]):
+    """Pin calling thread to cores - processes spawned meanwhile inherit them.
+    - Affinity is set before fork/exec, so the shell & job interpreter (and
+      all their threads) start on `cpu_set` (best effort, restored on exit)
+    """
+    if cpu_set is None or not hasattr(os, "sched_setaffinity"):
+        yield
+        return
+    prev_cpus = os.sched_getaffinity(0)
+    try:
+        os.sched_setaffinity(0, cpu_set)
+    except OSError:
+        prev_cpus = None
+    try:
+        yield
+    finally:
+        if prev_cpus is not None:
+            os.sched_setaffinity(0, prev_cpus)
+
+
+class AdmissionController(object):
+    def __init__(
+        self,
+        cores_per_job: int = 1,
+        memory_per_job: Union[float, None] = None,
+        max_running_jobs: Union[int, None] = None,
+    ):
+        """Budget concurrent local jobs by logical cores & memory.
+        - Each admitted job gets a disjoint set of `cores_per_job` cores
+        - `memory_per_job` (MB) hint caps jobs by memory available at start
+        - Records queue wait & run time per job for reporting
+        """
+        self.cpus = get_available_cpus()
+        self.cores_per_job = max(1, min(int(cores_per_job), len(self.cpus)))
+        self.free_cpus = list(self.cpus)
+        self.max_jobs = len(self.cpus) // self.cores_per_job
+        self.available_memory = get_available_memory()
+        if memory_per_job is not None and self.available_memory is not None:
+            self.max_jobs = min(
+                self.max_jobs, max(1, int(self.available_memory // memory_per_job))
+            )
+        if max_running_jobs is not None:
+            self.max_jobs = max(1, min(self.max_jobs, max_running_jobs))
+        self.num_running = 0
+        self.wait_times, self.run_times = [], []
+        self.lock = threading.Lock()
+
+    def admit(self) -> Union[List[int], None]:
+        """Reserve cores for one job - None if job has to wait in queue."""
+        with self.lock:
+            if self.num_running >= self.max_jobs:
+                return None
+            if len(self.free_cpus) < self.cores_per_job:
+                return None
+            cpu_set = self.free_cpus[: self.cores_per_job]
+            self.free_cpus = self.free_cpus[self.cores_per_job :]
+            self.num_running += 1
+            return cpu_set
+
+    def release(self, cpu_set: List[int], wait_time: float, run_time: float) -> None:
+        """Free cores of finished job & record its queue wait/run time."""
+        with self.lock:
+            self.free_cpus = sorted(self.free_cpus + list(cpu_set))
+            self.num_running -= 1
+            self.wait_times.append(wait_time)
+            self.run_times.append(run_time)
+
+    def summary(self) -> str:
+        """Report of admitted jobs: mean/max queue wait vs. run time."""
+        if len(self.run_times) == 0:
+            return "ADMISSION - No jobs completed"
+        return (
+            f"ADMISSION - {len(self.run_times)} Jobs, {self.max_jobs} at a Time"
+            f" ({self.cores_per_job} Cores/Job) - Queue Wait:"
+            f" {np.mean(self.wait_times):.1f}s (max {np.max(self.wait_times):.1f}s)"
+            f" - Run: {np.mean(self.run_times):.1f}s"
+            f" (max {np.max(self.run_times):.1f}s)"
+        )
+
+
+class AdmittedJobQueue(WarmJobQueue):
+    def __init__(self, *args, **kwargs):
+        """Local job queue admitting jobs by free cores/memory & pinning them.
+        - Uses `num_logical_cores` (per job) & `memory_per_job` (MB) hints
+        - Jobs run as subprocesses or in the warm pool (`use_warm_pool`)
+        - `admission.summary()` reports queue wait vs. run time
+        """
+        super().__init__(*args, **kwargs)
+        self.admission = AdmissionController(
+            self.job_arguments.get("num_logical_cores", 1),
+            self.job_arguments.get("memory_per_job"),
+            self.max_running_jobs,
+        )
+
+    def run(self) -> None:
+        """Launch queued jobs whenever cores are free - merge logs at end."""
+        self.progress.start(self)
+        queue_t = time.time()
+        to_launch, running = list(self.queue), []
+        while len(to_launch) > 0 or len(running) > 0:
+            while len(to_launch) > 0:
+                cpu_set = self.admission.admit()
+                if cpu_set is None:
+                    break
+                start_t = time.time()
+                proc = self.launch(to_launch.pop(0), cpu_set)
+                running.append((proc, cpu_set, start_t))
+            still_running = []
+            for proc, cpu_set, start_t in running:
+                if proc.poll() is None:
+                    still_running.append((proc, cpu_set, start_t))
+                else:
+                    self.admission.release(
+                        cpu_set, start_t - queue_t, time.time() - start_t
+                    )
+                    self.progress.job_completed()
+            running = still_running
+            time.sleep(0.05)
+
+        merge_queue_logs(
+            self.experiment_dir,
+            self.mle_log_dirs,
+            self.mle_run_ids,
+            self.num_seeds,
+            self.automerge_seeds,
+            self.automerge_configs,
+        )
+
+    def launch(self, job: dict, cpu_set: Union[List[int], None] = None):
+        """Start job in warm pool or as subprocess pinned to its cores."""
+        if self.pool is not None:
+            return super().launch(job, cpu_set)
+        mle_job = MLEJob(
+            self.resource_to_run,
+            self.job_filename,
+            self.job_arguments,
+            job["config_fname"],
+            self.experiment_dir,
+            job["seed_id"],
+            self.extra_cmd_line_input,
+            False,
+            self.debug_mode,
+        )
+        with pinned_affinity(cpu_set):
+            proc = mle_job.schedule()
+        # Drain stdout/stderr pipes so that jobs don't block on full pipes
+        threading.Thread(target=proc.communicate, daemon=True).start()
+        return proc
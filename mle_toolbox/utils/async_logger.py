@@ -0,0 +1,142 @@
+import os
+import copy
+import time
+import queue
+import atexit
+import signal
+import threading
+from typing import Union
+
+
+class AsyncLogWriter(object):
+    def __init__(self, queue_size: int = 16, drop_when_full: bool = False):
+        """Write `MLELogger.update` calls from a background thread.
+        - Updates are put on a bounded queue & applied in order by the writer
+        - Full queue blocks the training step (or drops the update if
+          `drop_when_full`) - both are counted & reported on `close`
+        - Stats are copied & models/extra objects deep-copied on submit so
+          later in-place parameter updates don't leak into the checkpoint
+        - Pending updates are flushed on process exit & on SIGTERM/SIGUSR2
+        """
+        assert queue_size > 0, "Async logging queue needs at least one slot."
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.drop_when_full = drop_when_full
+        self.num_submitted, self.num_blocked, self.num_dropped = 0, 0, 0
+        self.blocked_time = 0.0
+        self.error = None
+        self.closed = False
+        self.thread = threading.Thread(target=self.write_loop, daemon=True)
+        self.thread.start()
+        atexit.register(self.close)
+        self.previous_handlers = {}
+        if threading.current_thread() is threading.main_thread():
+            for signum in [signal.SIGTERM, signal.SIGUSR2]:
+                self.previous_handlers[signum] = signal.signal(
+                    signum, self.handle_signal
+                )
+
+    def write_loop(self) -> None:
+        """Apply queued logger updates until the `None` sentinel arrives."""
+        while True:
+            item = self.queue.get()
+            try:
+                if item is None:
+                    return
+                log, args, kwargs = item
+                if self.error is None:
+                    log.update(*args, **kwargs)
+            except Exception as e:
+                self.error = e
+            finally:
+                self.queue.task_done()
+
+    def check_error(self) -> None:
+        """Re-raise exception of the writer thread in the training process."""
+        if self.error is not None:
+            error, self.error = self.error, None
+            raise error
+
+    def submit(
+        self,
+        log,
+        clock_tick: dict,
+        stats_tick: dict,
+        model=None,
+        plot_fig=None,
+        extra_obj=None,
+        save: bool = False,
+    ) -> bool:
+        """Queue a logger update - returns False if it had to be dropped."""
+        self.check_error()
+        assert not self.closed, "Async log writer was already closed."
+        args = (dict(clock_tick), dict(stats_tick))
+        kwargs = {
+            "model": copy.deepcopy(model) if model is not None else None,
+            "plot_fig": plot_fig,
+            "extra_obj": copy.deepcopy(extra_obj) if extra_obj is not None else None,
+            "save": save,
+        }
+        self.num_submitted += 1
+        try:
+            self.queue.put_nowait((log, args, kwargs))
+            return True
+        except queue.Full:
+            if self.drop_when_full:
+                self.num_dropped += 1
+                return False
+        self.num_blocked += 1
+        start_t = time.time()
+        self.queue.put((log, args, kwargs))
+        self.blocked_time += time.time() - start_t
+        return True
+
+    def flush(self) -> None:
+        """Wait until all queued updates are written."""
+        self.queue.join()
+        self.check_error()
+
+    def close(self, verbose: bool = True) -> None:
+        """Flush pending updates, stop writer thread & report queue stats."""
+        if self.closed:
+            return
+        self.closed = True
+        self.queue.put(None)
+        self.thread.join()
+        atexit.unregister(self.close)
+        for signum, handler in self.previous_handlers.items():
+            if signal.getsignal(signum) == self.handle_signal:
+                signal.signal(signum, handler)
+        if verbose and self.num_submitted > 0:
+            print(self.summary())
+        self.check_error()
+
+    def summary(self) -> str:
+        """Submitted, blocked & dropped updates of the async logger."""
+        return (
+            f"ASYNC LOGGING - {self.num_submitted} updates,"
+            f" {self.num_blocked} blocked ({self.blocked_time:.2f}s),"
+            f" {self.num_dropped} dropped"
+        )
+
+    def handle_signal(self, signum: int, frame) -> None:
+        """Flush pending updates before the process is terminated."""
+        try:
+            self.close()
+        finally:
+            previous = self.previous_handlers.get(signum)
+            if callable(previous):
+                previous(signum, frame)
+            elif previous != signal.SIG_IGN:
+                signal.signal(signum, signal.SIG_DFL)
+                os.kill(os.getpid(), signum)
+
+
+def get_async_log_writer(
+    async_logging: Union[bool, dict, None],
+) -> Union[AsyncLogWriter, None]:
+    """Writer if `async_logging` is set (True or dict of writer kwargs)."""
+    if not async_logging:
+        return None
+    if isinstance(async_logging, dict):
+        return AsyncLogWriter(**async_logging)
+    return AsyncLogWriter()
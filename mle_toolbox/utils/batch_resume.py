@@ -0,0 +1,48 @@
+import os
+from typing import Dict, List
+
+
+def get_seed_marker_fname(run_dir: str, seed_id: int) -> str:
+    """Marker written by `MLExperiment` once a seed job exits without error."""
+    return os.path.join(run_dir, f"seed_{seed_id}.done")
+
+
+def get_pending_batch_fname(experiment_dir: str, batch_id: int) -> str:
+    """Proposals & seeds of a launched but not yet logged search batch."""
+    return os.path.join(experiment_dir, f"b_{batch_id}_pending.pkl")
+
+
+def get_missing_seed_jobs(
+    experiment_dir: str, run_ids: List[str], seeds: List[int]
+) -> Dict[str, List[int]]:
+    """Get (run_id, seeds) pairs of a batch that have not completed yet.
+    - Runs with a seed-merged `log.hdf5` are complete
+    - Seeds are complete if their log & completion marker exist
+    """
+    missing = {}
+    for run_id in run_ids:
+        run_dir = os.path.join(experiment_dir, run_id)
+        if os.path.exists(os.path.join(run_dir, "logs", "log.hdf5")):
+            continue
+        missing_seeds = []
+        for seed_id in seeds:
+            log_fname = os.path.join(run_dir, "logs", f"log_seed_{seed_id}.hdf5")
+            marker_fname = get_seed_marker_fname(run_dir, seed_id)
+            if not (os.path.exists(log_fname) and os.path.exists(marker_fname)):
+                missing_seeds.append(seed_id)
+        if len(missing_seeds) > 0:
+            missing[run_id] = missing_seeds
+    return missing
+
+
+def remove_partial_seed_logs(
+    experiment_dir: str, missing: Dict[str, List[int]]
+) -> None:
+    """Delete logs of interrupted seed jobs before they are relaunched."""
+    for run_id, seeds in missing.items():
+        for seed_id in seeds:
+            log_fname = os.path.join(
+                experiment_dir, run_id, "logs", f"log_seed_{seed_id}.hdf5"
+            )
+            if os.path.exists(log_fname):
+                os.remove(log_fname)
@@ -0,0 +1,178 @@
+import os
+import copy
+import time
+import atexit
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Union
+from .helpers import save_pkl_object
+
+# Model types whose parameters can be snapshotted to host memory
+snapshot_model_types = ["torch", "jax", "sklearn", "numpy"]
+
+
+def snapshot_to_host(model, model_type: str):
+    """Copy parameters to host memory - training can keep updating them.
+    - torch: `state_dict` w. detached cpu tensor copies
+    - jax: `jax.device_get` of the parameter tree (arrays are immutable)
+    """
+    if model_type == "torch":
+        return {
+            k: v.detach().to("cpu", copy=True) if hasattr(v, "detach") else v
+            for k, v in model.state_dict().items()
+        }
+    elif model_type == "jax":
+        import jax
+
+        return jax.device_get(model)
+    return copy.deepcopy(model)
+
+
+def write_snapshot(snapshot, ckpt_fname: str, model_type: str) -> None:
+    """Serialize snapshot to tmp file & atomically rename it into place."""
+    os.makedirs(os.path.dirname(ckpt_fname), exist_ok=True)
+    tmp_fname = ckpt_fname + ".tmp"
+    if model_type == "torch":
+        import torch
+
+        torch.save(snapshot, tmp_fname)
+    else:
+        save_pkl_object(snapshot, tmp_fname)
+    os.replace(tmp_fname, ckpt_fname)
+
+
+def link_into_place(src_fname: str, ckpt_fname: str) -> None:
+    """Atomically point `ckpt_fname` at `src_fname` (hard link, else copy)."""
+    tmp_fname = ckpt_fname + ".tmp"
+    if os.path.exists(tmp_fname):
+        os.remove(tmp_fname)
+    try:
+        os.link(src_fname, tmp_fname)
+    except OSError:
+        shutil.copyfile(src_fname, tmp_fname)
+    os.replace(tmp_fname, ckpt_fname)
+
+
+class CheckpointManager(object):
+    def __init__(self, keep_last: int = 1, num_buffers: int = 2):
+        """Double-buffered background checkpointing for `MLExperiment`.
+        - `save` snapshots params to host memory & returns, a writer thread
+          serializes them to a tmp file & renames it into place (atomic)
+        - At most `num_buffers` snapshots are in flight - further saves block
+        - `keep_last` > 1 keeps the newest numbered checkpoints in
+          `models/history/`, the final ckpt is a link to the newest one
+        """
+        assert keep_last >= 1, "Keep at least the most recent checkpoint."
+        assert num_buffers >= 1, "Need at least one snapshot buffer."
+        self.keep_last = keep_last
+        self.buffers = threading.Semaphore(num_buffers)
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.futures = []
+        self.history = {}
+        self.num_saved, self.num_blocked = 0, 0
+        self.blocked_time = 0.0
+        atexit.register(self.wait)
+
+    def supports(self, log) -> bool:
+        """Check if logger's model ckpt can be written in the background.
+        - every-k/top-k checkpointing of `MLELogger` stays synchronous
+        """
+        model_log = log.model_log
+        return (
+            model_log.model_type in snapshot_model_types
+            and model_log.save_every_k_ckpt is None
+            and model_log.save_top_k_ckpt is None
+        )
+
+    def save(self, model, model_type: str, ckpt_fname: str) -> None:
+        """Snapshot model & write it to `ckpt_fname` in the background."""
+        self.check_errors()
+        if not self.buffers.acquire(blocking=False):
+            self.num_blocked += 1
+            start_t = time.time()
+            self.buffers.acquire()
+            self.blocked_time += time.time() - start_t
+        try:
+            snapshot = snapshot_to_host(model, model_type)
+        except Exception:
+            self.buffers.release()
+            raise
+        self.num_saved += 1
+        history_fname = None
+        if self.keep_last > 1:
+            base, ext = os.path.splitext(os.path.basename(ckpt_fname))
+            history_fname = os.path.join(
+                os.path.dirname(os.path.dirname(ckpt_fname)),
+                "history",
+                f"{base}_{self.num_saved}{ext}",
+            )
+        self.futures.append(
+            self.executor.submit(
+                self.write, snapshot, model_type, ckpt_fname, history_fname
+            )
+        )
+
+    def write(
+        self,
+        snapshot,
+        model_type: str,
+        ckpt_fname: str,
+        history_fname: Union[str, None],
+    ) -> None:
+        """Writer thread: store snapshot, update final ckpt & prune history."""
+        try:
+            if history_fname is None:
+                write_snapshot(snapshot, ckpt_fname, model_type)
+                return
+            write_snapshot(snapshot, history_fname, model_type)
+            os.makedirs(os.path.dirname(ckpt_fname), exist_ok=True)
+            link_into_place(history_fname, ckpt_fname)
+            history = self.history.setdefault(ckpt_fname, [])
+            history.append(history_fname)
+            while len(history) > self.keep_last:
+                os.remove(history.pop(0))
+        finally:
+            self.buffers.release()
+
+    def save_log_model(self, log, model) -> None:
+        """Background replacement of `MLELogger.save_model` (final ckpt).
+        - Path stays `model_log.final_model_save_fname`, which is stored as
+          `model_ckpt` in the meta log & reloaded by PBT/Halving searches
+        """
+        log.model_log.model_save_counter += 1
+        self.save(model, log.model_log.model_type, log.model_log.final_model_save_fname)
+
+    def check_errors(self) -> None:
+        """Re-raise errors of completed writes in the training process."""
+        pending = []
+        for future in self.futures:
+            if future.done():
+                future.result()
+            else:
+                pending.append(future)
+        self.futures = pending
+
+    def wait(self) -> None:
+        """Block until all pending checkpoints are written."""
+        futures, self.futures = self.futures, []
+        for future in futures:
+            future.result()
+
+    def summary(self) -> str:
+        """Saved & blocked checkpoints of the manager."""
+        return (
+            f"ASYNC CHECKPOINTING - {self.num_saved} saves,"
+            f" {self.num_blocked} blocked ({self.blocked_time:.2f}s)"
+        )
+
+
+def get_checkpoint_manager(
+    async_checkpointing: Union[bool, dict, None],
+) -> Union[CheckpointManager, None]:
+    """Manager if `async_checkpointing` is set (True or dict of kwargs)."""
+    if not async_checkpointing:
+        return None
+    if isinstance(async_checkpointing, dict):
+        return CheckpointManager(**async_checkpointing)
+    return CheckpointManager()
@@ -0,0 +1,82 @@
+import os
+import json
+from typing import List, Tuple
+
+# Manifest layout: [no. entries][fixed-width byte offsets][json line/entry]
+HEADER_WIDTH = 13
+OFFSET_WIDTH = 21
+
+
+def write_config_manifest(
+    configs: List[dict], run_ids: List[str], manifest_fname: str
+) -> List[str]:
+    """Write batch of configs to single indexed file. Return references.
+    - Each reference `<run_id>.<manifest>:<index>` points to one entry.
+    - The run_id prefix keeps run log dirs the same as for per-run files.
+    """
+    entries = [
+        (json.dumps({"run_id": run_id, "config": config}) + "\n").encode()
+        for run_id, config in zip(run_ids, configs)
+    ]
+    # Entries start after header & index block - store absolute byte offsets
+    offset = HEADER_WIDTH + OFFSET_WIDTH * len(entries)
+    index_block = b""
+    for entry in entries:
+        index_block += f"{offset:020d}\n".encode()
+        offset += len(entry)
+
+    # Write to temporary file first - only a single create/rename per batch
+    tmp_fname = manifest_fname + ".tmp"
+    with open(tmp_fname, "wb") as f:
+        f.write(f"{len(entries):012d}\n".encode())
+        f.write(index_block)
+        f.write(b"".join(entries))
+    os.replace(tmp_fname, manifest_fname)
+
+    manifest_dir, manifest_base = os.path.split(manifest_fname)
+    return [
+        os.path.join(manifest_dir, f"{run_id}.{manifest_base}:{i}")
+        for i, run_id in enumerate(run_ids)
+    ]
+
+
+def parse_manifest_ref(config_ref: str) -> Tuple[str, str, int]:
+    """Split reference into manifest path, run_id & entry index."""
+    ref_dir, ref_base = os.path.split(config_ref)
+    run_id, manifest_ref = ref_base.split(".", 1)
+    manifest_base, index = manifest_ref.rsplit(":", 1)
+    return os.path.join(ref_dir, manifest_base), run_id, int(index)
+
+
+def get_run_id(config_fname: str) -> str:
+    """Run id of config file or manifest reference (as in `MLEQueue`).
+    - `b_1_eval_0.yaml` & `b_1_eval_0.b_1_manifest.json:0` -> `b_1_eval_0`
+    """
+    return os.path.split(config_fname)[1].split(".")[0]
+
+
+def is_manifest_ref(config_fname: str) -> bool:
+    """Check if config filename is a reference to a manifest entry."""
+    if type(config_fname) != str or os.path.exists(config_fname):
+        return False
+    try:
+        manifest_fname, _, _ = parse_manifest_ref(config_fname)
+    except ValueError:
+        return False
+    return os.path.exists(manifest_fname)
+
+
+def load_manifest_entry(config_ref: str) -> Tuple[str, dict]:
+    """Seek & load a single config entry of manifest. Return run_id, config."""
+    manifest_fname, run_id, index = parse_manifest_ref(config_ref)
+    with open(manifest_fname, "rb") as f:
+        num_entries = int(f.read(HEADER_WIDTH))
+        if index >= num_entries:
+            raise IndexError(
+                f"Manifest {manifest_fname} only has {num_entries} entries."
+            )
+        f.seek(HEADER_WIDTH + OFFSET_WIDTH * index)
+        f.seek(int(f.read(OFFSET_WIDTH)))
+        entry = json.loads(f.readline())
+    assert entry["run_id"] == run_id, f"Manifest entry {index} is not {run_id}."
+    return run_id, entry["config"]
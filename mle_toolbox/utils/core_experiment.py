@@ -7,40 +7,15 @@ import select
 from typing import Union, Tuple
 from dotmap import DotMap
 from datetime import datetime
-import subprocess as sp
 from mle_logging import load_config
-from .core_files_load import load_mle_toolbox_config
+from .core_files_load import LazyConfig
 from .helpers import print_framed
+from .config_manifest import is_manifest_ref, load_manifest_entry
+from .resource_detection import determine_resource
 
 
-# Safely import such that no import errors are thrown - reduce dependencies
-try:
-    import torch
-
-    __torch_installed = True
-except ImportError:
-    __torch_installed = False
-    pass
-
-try:
-    import gym
-
-    __gym_installed = True
-except ImportError:
-    __gym_installed = False
-    pass
-
-try:
-    import jax
-
-    __jax_installed = True
-except ImportError:
-    __jax_installed = False
-    pass
-
-
-# Load in the base toolbox configurations to use throughout
-mle_config = load_mle_toolbox_config()
+# Base toolbox configurations to use throughout - loaded on first access
+mle_config = LazyConfig()
 
 
 def check_single_job_args(resource_to_run: str, job_arguments: dict):
@@ -114,19 +89,18 @@ def gcp_check_job_args(job_arguments: Union[dict, None]) -> dict:
     return DotMap(job_arguments)
 
 
-# Default job arguments (if not different supplied)
-local_default_job_arguments = {
-    "env_name": mle_config.general.remote_env_name,
-    "use_conda_venv": mle_config.general.use_conda_venv,
-    "use_venv_venv": mle_config.general.use_venv_venv,
-}
-
-
 def local_check_job_args(job_arguments: Union[dict, None]) -> dict:
     """Check the input job arguments & add default values if missing."""
     if job_arguments is None:
         job_arguments = {}
 
+    # Default job arguments (if not different supplied)
+    local_default_job_arguments = {
+        "env_name": mle_config.general.remote_env_name,
+        "use_conda_venv": mle_config.general.use_conda_venv,
+        "use_venv_venv": mle_config.general.use_venv_venv,
+    }
+
     # Add the default config values if they are missing from job_args
     for k, v in local_default_job_arguments.items():
         if k not in job_arguments.keys():
@@ -185,13 +159,18 @@ def load_experiment_config(cmd_args: dict) -> DotMap:
 def set_random_seeds(
     seed_id: Union[int, None], return_key: bool = False, verbose: bool = False
 ):
-    """Set random seed (random, npy, torch, gym) for reproduction"""
+    """Set random seed (random, npy, torch, gym) for reproduction
+    - torch/gym are only seeded if the job already imported them
+    - jax is only imported if a PRNG key is requested
+    """
     if seed_id is not None:
         os.environ["PYTHONHASHSEED"] = str(seed_id)
         random.seed(seed_id)
         np.random.seed(seed_id)
         seeds_set = ["random", "numpy"]
-        if __torch_installed:
+        if "torch" in sys.modules:
+            import torch
+
             torch.backends.cudnn.deterministic = True
             torch.backends.cudnn.benchmark = False
             torch.manual_seed(seed_id)
@@ -200,7 +179,9 @@ def set_random_seeds(
                 torch.cuda.manual_seed(seed_id)
             seeds_set.append("torch")
 
-        if __gym_installed:
+        if "gym" in sys.modules:
+            import gym
+
             if hasattr(gym.spaces, "prng"):
                 gym.spaces.prng.seed(seed_id)
             seeds_set.append("gym")
@@ -209,7 +190,9 @@ def set_random_seeds(
             print(f"-- Random seeds ({', '.join(seeds_set)}) set to {seed_id}")
 
         if return_key:
-            if not __jax_installed:
+            try:
+                import jax
+            except ImportError:
                 raise ValueError("You need to install jax to return PRNG key.")
             key = jax.random.PRNGKey(seed_id)
             return key
@@ -252,6 +235,16 @@ def parse_experiment_args(
         help="Seed id on which to train.",
     )
 
+    # Optional: Multiple seeds trained within the same process
+    parser.add_argument(
+        "-seed_ids",
+        "--seed_ids",
+        action="store",
+        default=None,
+        type=str,
+        help="Comma-separated seed ids to train in one process.",
+    )
+
     # Optional: Checkpoint path to potentially reload model
     parser.add_argument(
         "-model_ckpt",
@@ -302,7 +295,14 @@ def load_job_config(
 ) -> Tuple[DotMap, DotMap, DotMap, DotMap]:
     """Prepare job config files for experiment run (add seed id, etc.)."""
     # Load .json/.yaml job config + add config fname/experiment dir
-    if os.path.exists(config_fname):
+    run_id = None
+    if is_manifest_ref(config_fname):
+        # Batch manifest `<run_id>.<manifest>:<index>` - only read own entry
+        run_id, config_dict = load_manifest_entry(config_fname)
+        config = DotMap(config_dict)
+        assert "train_config" in config.keys(), "Provide train_config key."
+        assert "log_config" in config.keys(), "Provide log_config key."
+    elif os.path.exists(config_fname):
         config = load_config(config_fname, return_dotmap=True)
         # Check that train and log config exist!
         assert "train_config" in config.keys(), "Provide train_config key."
@@ -341,6 +341,12 @@ def load_job_config(
     train_config = DotMap(config["train_config"], _dynamic=False)
     log_config = DotMap(config["log_config"], _dynamic=False)
 
+    # No config file for manifest entries - log config dict in run dir
+    if run_id is not None:
+        log_config.config_fname = None
+        log_config.config_dict = config_dict
+        log_config.experiment_dir = os.path.join(experiment_dir, run_id)
+
     # Add device config to the standard configurations
     # In experiment setup this will be passed to get_os_env_ready
     if "device_config" in config.keys():
@@ -351,18 +357,25 @@ def load_job_config(
     # Add device to train on if not already set in the config file
     if "device_name" in train_config.keys():
         device_name = "cpu"
-        if __torch_installed:
+        try:
+            import torch
+
             if torch.cuda.is_available():
                 device_name = "cuda"
+        except ImportError:
+            pass
         train_config.device_name = device_name
 
     # Add tensorboard usage to logging config if desired
     if "tboard_fname" not in log_config.keys():
         if "use_tboard" in log_config.keys():
             if log_config.use_tboard:
-                tboard_temp = os.path.split(config_fname)[1]
-                tboard_base = os.path.splitext(tboard_temp)[0]
-                log_config.tboard_fname = tboard_base
+                if run_id is not None:
+                    log_config.tboard_fname = run_id
+                else:
+                    tboard_temp = os.path.split(config_fname)[1]
+                    tboard_base = os.path.splitext(tboard_temp)[0]
+                    log_config.tboard_fname = tboard_base
 
     # Set seed for run of your choice - has to be done via command line
     if seed_id is not None:
@@ -460,21 +473,6 @@ def ask_for_binary_input(question: str, default_answer: str = "N"):
     return answer in ["Y", "y"]
 
 
-def determine_resource() -> str:
-    """Check if cluster (sge/slurm) is available - otherwise local."""
-    try:
-        sp.check_output(["qstat"])
-        return "sge-cluster"
-    except Exception:
-        pass
-
-    try:
-        sp.check_output(["squeue"])
-        return "slurm-cluster"
-    except Exception:
-        return "local"
-
-
 def setup_proxy_server():
     """Set Gcloud creds & port to tunnel for internet connection."""
     if "credentials_path" in mle_config.gcp.keys():
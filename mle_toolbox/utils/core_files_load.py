@@ -37,6 +37,54 @@ def load_mle_toolbox_config(config_fname: str = "~/mle_config.toml") -> DotMap:
     return mle_config
 
 
+class LazyConfig(object):
+    def __init__(self, config_fname: str = "~/mle_config.toml"):
+        """Toolbox config which is only loaded from .toml on first access.
+        - Keeps `import mle_toolbox` cheap for jobs that never touch it
+        - Behaves like the loaded DotMap (attribute, item & key access)
+        """
+        object.__setattr__(self, "_config_fname", config_fname)
+        object.__setattr__(self, "_config", None)
+
+    def load(self) -> DotMap:
+        """Load the .toml config once & return the DotMap."""
+        if self._config is None:
+            object.__setattr__(
+                self, "_config", load_mle_toolbox_config(self._config_fname)
+            )
+        return self._config
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._config is not None
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return getattr(self.load(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self.load(), name, value)
+
+    def __getitem__(self, key: str) -> Any:
+        return self.load()[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.load()[key] = value
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.load()
+
+    def __iter__(self):
+        return iter(self.load())
+
+    def __len__(self) -> int:
+        return len(self.load())
+
+    def __repr__(self) -> str:
+        return repr(self.load())
+
+
 def load_pkl_object(filename: str) -> Any:
     """Helper to reload pickle objects."""
     with open(filename, "rb") as input:
@@ -0,0 +1,98 @@
+import os
+import zlib
+import struct
+import pickle
+from typing import Tuple
+
+# Record header: payload length & crc32 checksum of pickled (iter_id, dict)
+RECORD_HEADER = struct.Struct("<II")
+
+
+def get_journal_fname(hyperlog_fname: str) -> str:
+    """Get journal path stored next to the .pkl hyper log snapshot."""
+    return os.path.splitext(hyperlog_fname)[0] + ".journal"
+
+
+def get_snapshot_fname(journal_fname: str) -> str:
+    """Get .pkl snapshot path corresponding to a journal file."""
+    return os.path.splitext(journal_fname)[0] + ".pkl"
+
+
+class HyperLogJournal(object):
+    def __init__(self, hyperlog_fname: str, compact_every: int = 100):
+        """Append-only storage of hyper log: .pkl snapshot + record journal.
+        - `append` writes one checksummed record per evaluation & fsyncs.
+        - `compact` atomically rewrites the snapshot & truncates journal.
+        - `load` skips a truncated/corrupt record tail (crash mid-append).
+        """
+        self.snapshot_fname = hyperlog_fname
+        self.journal_fname = get_journal_fname(hyperlog_fname)
+        self.compact_every = compact_every
+        self.num_records = 0
+
+    def load(self) -> dict:
+        """Load snapshot & replay journal records on top of it."""
+        opt_log, valid_bytes, self.num_records = load_journaled_log(
+            self.snapshot_fname, self.journal_fname
+        )
+        # Drop partially written record so that new appends stay readable
+        if os.path.exists(self.journal_fname):
+            if valid_bytes < os.path.getsize(self.journal_fname):
+                with open(self.journal_fname, "r+b") as f:
+                    f.truncate(valid_bytes)
+        return opt_log
+
+    def append(self, records: dict) -> None:
+        """Append {iter_id: eval dict} records to the journal & sync to disk."""
+        with open(self.journal_fname, "ab") as f:
+            for iter_id, eval_iter in records.items():
+                payload = pickle.dumps((iter_id, eval_iter), pickle.HIGHEST_PROTOCOL)
+                f.write(RECORD_HEADER.pack(len(payload), zlib.crc32(payload)))
+                f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        self.num_records += len(records)
+
+    def compact(self, opt_log: dict) -> None:
+        """Write full snapshot via atomic rename & start new empty journal."""
+        tmp_fname = self.snapshot_fname + ".tmp"
+        with open(tmp_fname, "wb") as f:
+            pickle.dump(opt_log, f, pickle.HIGHEST_PROTOCOL)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_fname, self.snapshot_fname)
+        # Crash before truncation only leads to replay of duplicate iter_ids
+        open(self.journal_fname, "wb").close()
+        self.num_records = 0
+
+    @property
+    def compaction_due(self) -> bool:
+        """Check if journal has grown beyond compaction threshold."""
+        return self.num_records >= self.compact_every
+
+
+def load_journaled_log(
+    snapshot_fname: str, journal_fname: str
+) -> Tuple[dict, int, int]:
+    """Load snapshot & journal. Return log, valid journal bytes, no. records."""
+    opt_log = {}
+    if os.path.exists(snapshot_fname):
+        with open(snapshot_fname, "rb") as f:
+            opt_log = pickle.load(f)
+
+    valid_bytes, num_records = 0, 0
+    if os.path.exists(journal_fname):
+        with open(journal_fname, "rb") as f:
+            while True:
+                header = f.read(RECORD_HEADER.size)
+                if len(header) < RECORD_HEADER.size:
+                    break
+                length, checksum = RECORD_HEADER.unpack(header)
+                payload = f.read(length)
+                if len(payload) < length or zlib.crc32(payload) != checksum:
+                    break
+                iter_id, eval_iter = pickle.loads(payload)
+                opt_log[iter_id] = eval_iter
+                valid_bytes += RECORD_HEADER.size + length
+                num_records += 1
+    return opt_log, valid_bytes, num_records
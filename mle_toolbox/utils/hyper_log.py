@@ -1,8 +1,14 @@
+import os
 import pickle5 as pickle
 import pandas as pd
 import numpy as np
 from typing import Union, List
 from mle_hyperopt.utils.helpers import flatten_config
+from .hyper_journal import (
+    get_journal_fname,
+    get_snapshot_fname,
+    load_journaled_log,
+)
 
 
 # Set pandas printing option (print more columns!)
@@ -25,7 +31,12 @@ class HyperLog(object):
         """Reconstruct search & metric variable names from meta log data."""
         self.search_vars = list(
             set(self.columns)
-            - set(meta_vars + stats_vars + time_vars + ["run_id", "log_fname"])
+            - set(
+                meta_vars
+                + stats_vars
+                + time_vars
+                + ["run_id", "log_fname", "truncated", "throughput"]
+            )
         )
         self.search_metrics = stats_vars
 
@@ -179,6 +190,13 @@ def load_hyper_log(hyper_log_fpath: str) -> HyperLog:
 
 def load_pkl_hyper_log(hyper_log_fpath: str):
     """Load stored .pkl serach log file as list of iteration dicts."""
+    # Journaled log: replay appended eval records on top of .pkl snapshot
+    journal_fname = get_journal_fname(hyper_log_fpath)
+    if os.path.exists(journal_fname):
+        opt_log, _, _ = load_journaled_log(
+            get_snapshot_fname(journal_fname), journal_fname
+        )
+        return opt_log
     with open(hyper_log_fpath, "rb") as input:
         opt_log = pickle.load(input)
     return opt_log
@@ -0,0 +1,235 @@
+import os
+import time
+import random
+import getpass
+import subprocess as sp
+from typing import List, Union
+from mle_scheduler.cluster.sge.helpers_launch_sge import sge_generate_startup_file
+from mle_scheduler.cluster.slurm.helpers_launch_slurm import (
+    slurm_generate_startup_file,
+)
+from .warm_pool import merge_queue_logs
+from .config_manifest import get_run_id
+
+# Array task id env variable (1-based line of the task file) per resource
+array_task_ids = {"slurm-cluster": "SLURM_ARRAY_TASK_ID", "sge-cluster": "SGE_TASK_ID"}
+
+
+def use_job_array(resource_to_run: str, job_arguments: Union[dict, None]) -> bool:
+    """Check if cluster batches are submitted as one array job (`use_job_array`)."""
+    if resource_to_run not in array_task_ids.keys() or job_arguments is None:
+        return False
+    return bool(job_arguments.get("use_job_array", False))
+
+
+def write_array_tasks(tasks_fname: str, jobs: List[dict]) -> None:
+    """Write one `<config_fname> <seed_id>` line per array task."""
+    with open(tasks_fname, "w") as f:
+        for job in jobs:
+            f.write(f"{job['config_fname']} {job['seed_id']}\n")
+
+
+def generate_array_script(
+    resource_to_run: str,
+    job_filename: str,
+    job_arguments: dict,
+    tasks_fname: str,
+    experiment_dir: str,
+    num_tasks: int,
+    max_running_tasks: Union[int, None] = None,
+    extra_cmd_line_input: Union[dict, None] = None,
+) -> str:
+    """Fill mle-scheduler Slurm/SGE template with an array task execution.
+    - Each task reads its config & seed from line `<task id>` of task file
+    - `max_running_tasks` throttles the number of concurrently running tasks
+    """
+    job_arguments = job_arguments.copy()
+    f_name, f_extension = os.path.splitext(job_filename)
+    if f_extension == ".py":
+        exec_cmd = "python"
+    elif f_extension == ".sh":
+        exec_cmd = "bash"
+    else:
+        raise ValueError(f"Script with {f_extension} cannot be handled by array jobs.")
+    task_id = array_task_ids[resource_to_run]
+    cmd_line_args = f" -exp_dir {experiment_dir} -config $1 -seed $2"
+    if extra_cmd_line_input is not None:
+        for k, v in extra_cmd_line_input.items():
+            cmd_line_args += f" -{k} {v}"
+    # `set --` keeps the task lookup POSIX (SGE jobs may run in `sh`)
+    job_arguments["script"] = (
+        f'set -- $(sed -n "${{{task_id}}}p" {tasks_fname})\n'
+        f"{exec_cmd} {job_filename}{cmd_line_args}"
+    )
+
+    if "use_venv_venv" in job_arguments.keys():
+        if job_arguments["use_venv_venv"]:
+            job_arguments["work_on_dir"] = os.environ["WORKON_HOME"]
+    if "job_name" not in job_arguments.keys():
+        job_arguments["job_name"] = "job"
+
+    if resource_to_run == "slurm-cluster":
+        if type(job_arguments["partition"]) == list:
+            job_arguments["partition"] = ",".join(job_arguments["partition"])
+        # Slurm: dd:hh:mm -> d-hh:mm
+        if "time_per_job" in job_arguments.keys():
+            days, hours, minutes = job_arguments["time_per_job"].split(":")
+            job_arguments["time_per_job"] = days[1] + "-" + hours + ":" + minutes
+        template = slurm_generate_startup_file(job_arguments)
+        # One log per task instead of all tasks writing to log.txt
+        template = template.replace("log.txt", "log_%A_%a.txt")
+        template = template.replace("err.err", "err_%A_%a.err")
+        array_line = f"#SBATCH --array=1-{num_tasks}"
+        if max_running_tasks is not None:
+            array_line += f"%{max_running_tasks}"
+        template = template.replace("\n", f"\n{array_line}\n", 1)
+    else:
+        if type(job_arguments["queue"]) == list:
+            job_arguments["queue"] = ",".join(job_arguments["queue"])
+        # SGE: dd:hh:mm -> hh:mm:ss
+        if "time_per_job" in job_arguments.keys():
+            days, hours, minutes = job_arguments["time_per_job"].split(":")
+            hours_sge = str(int(days) * 24 + int(hours)).zfill(2)
+            job_arguments["time_per_job"] = hours_sge + ":" + minutes + ":00"
+        template = sge_generate_startup_file(job_arguments)
+        array_line = f"#$ -t 1-{num_tasks}"
+        if max_running_tasks is not None:
+            array_line += f"\n#$ -tc {max_running_tasks}"
+        template = template.replace("#$ -terse\n", f"#$ -terse\n{array_line}\n")
+    return template.format(**job_arguments)
+
+
+def submit_array(resource_to_run: str, script_fname: str) -> int:
+    """Submit array job script once via `sbatch`/`qsub` & return array job id."""
+    submit_cmd = "sbatch" if resource_to_run == "slurm-cluster" else "qsub"
+    with open(script_fname, "r") as f:
+        proc = sp.run([submit_cmd], stdin=f, stdout=sp.PIPE, stderr=sp.PIPE)
+    if proc.returncode != 0:
+        raise RuntimeError(
+            f"{submit_cmd} failed ({proc.returncode}): {proc.stderr.decode()}"
+        )
+    out = proc.stdout.decode().split()
+    # sbatch: `Submitted batch job <id>`, qsub -terse: `<id>.<first>-<last>:<step>`
+    if resource_to_run == "slurm-cluster":
+        return int(out[-1])
+    return int(out[0].split(".")[0])
+
+
+def monitor_array(resource_to_run: str, job_id: int, user_name: str) -> bool:
+    """Single `squeue`/`qstat` call - check if any task of array is queued/running."""
+    if resource_to_run == "slurm-cluster":
+        status_cmd, num_header = ["squeue", "-u", user_name], 1
+    else:
+        status_cmd, num_header = ["qstat", "-u", user_name], 2
+    while True:
+        try:
+            out = sp.check_output(status_cmd, stderr=sp.PIPE)
+            break
+        except sp.CalledProcessError as e:
+            print(e.stderr, e.returncode)
+            time.sleep(0.5)
+
+    # Slurm lists array tasks as `<id>_<task>`/`<id>_[<range>]`, SGE as `<id>`
+    for line in out.decode().split("\n")[num_header:]:
+        if len(line.split()) == 0:
+            continue
+        if line.split()[0].split("_")[0] == str(job_id):
+            return True
+    return False
+
+
+class ArrayJobQueue(object):
+    def __init__(
+        self,
+        resource_to_run: str,
+        job_filename: str,
+        job_arguments: dict,
+        config_filenames: Union[List[str], str],
+        experiment_dir: str,
+        num_seeds: int = 1,
+        default_seed: int = 0,
+        random_seeds: Union[None, List[int]] = None,
+        max_running_jobs: Union[int, None] = 10,
+        automerge_seeds: bool = False,
+        automerge_configs: bool = False,
+        debug_mode: bool = False,
+        **kwargs,
+    ):
+        """Drop-in for Slurm/SGE `MLEQueue` submitting batch as one array job.
+        - Task `i` runs line `i` of `<experiment_dir>/array_<id>_tasks.txt`
+        - `max_running_jobs` is passed on as array task throttle
+        - Status of all tasks is polled with one `squeue`/`qstat` call
+        """
+        assert (
+            resource_to_run in array_task_ids.keys()
+        ), "Job arrays are only supported on SGE/Slurm clusters."
+        self.resource_to_run = resource_to_run
+        self.job_filename = job_filename
+        self.job_arguments = job_arguments.copy()
+        if type(config_filenames) != list:
+            config_filenames = [config_filenames]
+        self.config_filenames = config_filenames
+        self.experiment_dir = experiment_dir
+        if random_seeds is not None:
+            num_seeds = len(random_seeds)
+        elif num_seeds > 1:
+            random_seeds = random.sample(range(100000, 999999), num_seeds)
+        else:
+            random_seeds = [default_seed]
+        self.num_seeds = num_seeds
+        self.random_seeds = random_seeds
+        self.max_running_jobs = max_running_jobs
+        self.automerge_seeds = automerge_seeds
+        self.automerge_configs = automerge_configs
+        self.debug_mode = debug_mode
+        self.extra_cmd_line_input = self.job_arguments.pop("extra_cmd_line_input", None)
+        self.poll_interval = self.job_arguments.pop("array_poll_interval", 10)
+        self.user_name = getpass.getuser()
+
+        self.queue, self.mle_log_dirs, self.mle_run_ids = [], [], []
+        for config_fname in self.config_filenames:
+            base_str = get_run_id(config_fname)
+            self.mle_log_dirs.append(os.path.join(experiment_dir, base_str))
+            self.mle_run_ids.append(base_str)
+            for seed_id in self.random_seeds:
+                self.queue.append({"config_fname": config_fname, "seed_id": seed_id})
+
+    def run(self) -> None:
+        """Submit all config/seed jobs as one array, wait for it & merge logs."""
+        job_id = self.submit()
+        while monitor_array(self.resource_to_run, job_id, self.user_name):
+            time.sleep(self.poll_interval)
+        if not self.debug_mode:
+            os.remove(self.tasks_fname)
+            os.remove(self.script_fname)
+
+        merge_queue_logs(
+            self.experiment_dir,
+            self.mle_log_dirs,
+            self.mle_run_ids,
+            self.num_seeds,
+            self.automerge_seeds,
+            self.automerge_configs,
+        )
+
+    def submit(self) -> int:
+        """Write task file & array script and submit them - return array id."""
+        os.makedirs(self.experiment_dir, exist_ok=True)
+        base = os.path.join(self.experiment_dir, f"array_{random.getrandbits(32):x}")
+        self.tasks_fname = base + "_tasks.txt"
+        self.script_fname = base + ".sh"
+        write_array_tasks(self.tasks_fname, self.queue)
+        script = generate_array_script(
+            self.resource_to_run,
+            self.job_filename,
+            self.job_arguments,
+            os.path.abspath(self.tasks_fname),
+            self.experiment_dir,
+            len(self.queue),
+            self.max_running_jobs,
+            self.extra_cmd_line_input,
+        )
+        with open(self.script_fname, "w") as f:
+            f.write(script)
+        self.job_id = submit_array(self.resource_to_run, self.script_fname)
+        return self.job_id
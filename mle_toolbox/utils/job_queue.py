@@ -0,0 +1,107 @@
+import random
+from typing import List, Union
+from mle_scheduler import MLEQueue
+from .warm_pool import use_warm_pool, WarmJobQueue, merge_queue_logs
+from .admission import use_admission_control, AdmittedJobQueue
+from .job_array import use_job_array, ArrayJobQueue
+
+
+def use_seeds_per_process(job_arguments: Union[dict, None]) -> bool:
+    """Check if all seeds of a config run in one process (`seeds_per_process`)."""
+    if job_arguments is None:
+        return False
+    return bool(job_arguments.get("seeds_per_process", False))
+
+
+def get_job_queue_class(resource_to_run: str, job_arguments: Union[dict, None]):
+    """Select job queue for resource & opt-in `single_job_args` options."""
+    if use_seeds_per_process(job_arguments):
+        return SeedGroupQueue
+    return get_base_queue_class(resource_to_run, job_arguments)
+
+
+def get_base_queue_class(resource_to_run: str, job_arguments: Union[dict, None]):
+    """Select queue launching one process per config/seed job."""
+    if use_job_array(resource_to_run, job_arguments):
+        return ArrayJobQueue
+    if use_admission_control(resource_to_run, job_arguments):
+        return AdmittedJobQueue
+    if use_warm_pool(resource_to_run, job_arguments):
+        return WarmJobQueue
+    return MLEQueue
+
+
+def add_seed_ids_arg(extra_cmd_line_input: Union[dict, None], seeds: List[int]):
+    """Add `-seed_ids` cmd line input for multi-seed processes."""
+    extra_cmd_line_input = dict(extra_cmd_line_input or {})
+    extra_cmd_line_input["seed_ids"] = ",".join([str(s) for s in seeds])
+    return extra_cmd_line_input
+
+
+class SeedGroupQueue(object):
+    def __init__(
+        self,
+        resource_to_run: str,
+        job_filename: str,
+        job_arguments: dict,
+        config_filenames: Union[List[str], str],
+        experiment_dir: str,
+        num_seeds: int = 1,
+        default_seed: int = 0,
+        random_seeds: Union[None, List[int]] = None,
+        max_running_jobs: Union[int, None] = 10,
+        automerge_seeds: bool = False,
+        automerge_configs: bool = False,
+        **kwargs,
+    ):
+        """Drop-in for `MLEQueue` launching one process per config for all seeds.
+        - Jobs get the first seed as `-seed` & all seeds as `-seed_ids`
+        - `MLExperiment` writes one `log_seed_<id>.hdf5` per seed, which are
+          merged as if each seed had run in its own process
+        """
+        if random_seeds is None:
+            if num_seeds > 1:
+                random_seeds = random.sample(range(100000, 999999), num_seeds)
+            else:
+                random_seeds = [default_seed]
+        self.random_seeds = random_seeds
+        self.num_seeds = len(random_seeds)
+        self.experiment_dir = experiment_dir
+        self.automerge_seeds = automerge_seeds
+        self.automerge_configs = automerge_configs
+
+        job_arguments = job_arguments.copy()
+        job_arguments["extra_cmd_line_input"] = add_seed_ids_arg(
+            job_arguments.get("extra_cmd_line_input"), random_seeds
+        )
+        # Merge after all seeds are logged - inner queue only sees first seed
+        queue_class = get_base_queue_class(resource_to_run, job_arguments)
+        self.queue = queue_class(
+            resource_to_run=resource_to_run,
+            job_filename=job_filename,
+            job_arguments=job_arguments,
+            config_filenames=config_filenames,
+            experiment_dir=experiment_dir,
+            num_seeds=1,
+            random_seeds=random_seeds[:1],
+            max_running_jobs=max_running_jobs,
+            automerge_seeds=False,
+            automerge_configs=False,
+            **kwargs,
+        )
+        self.mle_log_dirs = self.queue.mle_log_dirs
+        self.mle_run_ids = self.queue.mle_run_ids
+        if hasattr(self.queue, "admission"):
+            self.admission = self.queue.admission
+
+    def run(self) -> None:
+        """Run one process per config & merge the per-seed logs."""
+        self.queue.run()
+        merge_queue_logs(
+            self.experiment_dir,
+            self.mle_log_dirs,
+            self.mle_run_ids,
+            self.num_seeds,
+            self.automerge_seeds,
+            self.automerge_configs,
+        )
@@ -0,0 +1,149 @@
+import os
+import glob
+import json
+import hashlib
+from typing import Dict, List, Union
+
+
+def hash_file(fname: str, chunk_size: int = 2**20) -> str:
+    """sha256 of file content - read in chunks for large data files."""
+    h = hashlib.sha256()
+    with open(fname, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def expand_paths(paths: List[str]) -> List[str]:
+    """Expand declared files, directories (recursive) & glob patterns."""
+    fnames = []
+    for path in paths:
+        for match in sorted(glob.glob(path, recursive=True)):
+            if os.path.isdir(match):
+                for root, _, files in os.walk(match):
+                    fnames += [os.path.join(root, f) for f in files]
+            else:
+                fnames.append(match)
+    return sorted(set(fnames))
+
+
+class ProcessingCache(object):
+    def __init__(
+        self,
+        processing_fname: str,
+        extra_cmd_line_input: Union[dict, None],
+        inputs: Union[List[str], None],
+        outputs: List[str],
+        cache_dir: str = ".mle_cache",
+        experiment_dir: Union[str, None] = None,
+    ):
+        """Hash manifest of processing script, cmd line args & input files.
+        - A job is cached if all `outputs` exist & the manifest is unchanged
+        - Input files w. same size/mtime reuse their previous content hash
+        - Relative `cache_dir` is resolved against the job's `experiment_dir`
+        - Manifest: `<cache_dir>/<script>_<hash of experiment_dir & outputs>.json`
+        """
+        self.processing_fname = processing_fname
+        self.extra_cmd_line_input = extra_cmd_line_input or {}
+        self.inputs = list(inputs or [])
+        self.outputs = list(outputs)
+        self.experiment_dir = experiment_dir
+        cache_dir = os.path.expanduser(cache_dir)
+        if experiment_dir is not None and not os.path.isabs(cache_dir):
+            cache_dir = os.path.join(experiment_dir, cache_dir)
+        name_hash = hashlib.sha256(
+            json.dumps([experiment_dir, self.outputs]).encode()
+        ).hexdigest()
+        script_base = os.path.splitext(os.path.basename(processing_fname))[0]
+        self.manifest_fname = os.path.join(
+            cache_dir, f"{script_base}_{name_hash[:16]}.json"
+        )
+        self.previous = self.load()
+        self.manifest = self.compute_manifest()
+
+    def load(self) -> Union[dict, None]:
+        """Manifest stored by previous successful run (None if there is none)."""
+        if not os.path.exists(self.manifest_fname):
+            return None
+        try:
+            with open(self.manifest_fname, "r") as f:
+                return json.load(f)
+        except ValueError:
+            return None
+
+    def input_hashes(self) -> Dict[str, dict]:
+        """Size, mtime & content hash of every declared input file."""
+        previous_inputs = {}
+        if self.previous is not None:
+            previous_inputs = self.previous["inputs"]
+        hashes = {}
+        for fname in expand_paths(self.inputs):
+            stat = os.stat(fname)
+            entry = {"size": stat.st_size, "mtime": stat.st_mtime}
+            prev = previous_inputs.get(fname)
+            if prev is not None and all([prev[k] == entry[k] for k in entry]):
+                entry["sha256"] = prev["sha256"]
+            else:
+                entry["sha256"] = hash_file(fname)
+            hashes[fname] = entry
+        return hashes
+
+    def compute_manifest(self) -> dict:
+        """Hash script, arguments & inputs of the processing job."""
+        args_str = json.dumps(
+            {
+                "extra_cmd_line_input": self.extra_cmd_line_input,
+                "inputs": self.inputs,
+                "experiment_dir": self.experiment_dir,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return {
+            "script": hash_file(self.processing_fname),
+            "args": hashlib.sha256(args_str.encode()).hexdigest(),
+            "inputs": self.input_hashes(),
+            "outputs": self.outputs,
+        }
+
+    @property
+    def key(self) -> str:
+        """Single hash summarizing the content manifest."""
+        content = {
+            "script": self.manifest["script"],
+            "args": self.manifest["args"],
+            "inputs": {k: v["sha256"] for k, v in self.manifest["inputs"].items()},
+        }
+        return hashlib.sha256(json.dumps(content, sort_keys=True).encode()).hexdigest()
+
+    def is_hit(self) -> bool:
+        """Check if outputs exist & script/args/inputs are unchanged."""
+        if self.previous is None:
+            return False
+        if not all([len(glob.glob(p)) > 0 for p in self.outputs]):
+            return False
+        return self.previous.get("key") == self.key
+
+    def store(self) -> None:
+        """Write manifest after the processing job completed."""
+        os.makedirs(os.path.dirname(self.manifest_fname) or ".", exist_ok=True)
+        tmp_fname = self.manifest_fname + ".tmp"
+        with open(tmp_fname, "w") as f:
+            json.dump(dict(self.manifest, key=self.key), f, indent=1)
+        os.replace(tmp_fname, self.manifest_fname)
+
+
+def get_processing_cache(
+    processing_args: dict, experiment_dir: Union[str, None] = None
+) -> Union[ProcessingCache, None]:
+    """Content-hash cache if processing job declares its `outputs`."""
+    if processing_args.get("outputs") is None:
+        return None
+    return ProcessingCache(
+        processing_args["processing_fname"],
+        processing_args.get("extra_cmd_line_input"),
+        processing_args.get("inputs"),
+        processing_args["outputs"],
+        processing_args.get("cache_dir", ".mle_cache"),
+        experiment_dir,
+    )
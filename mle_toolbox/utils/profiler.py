@@ -0,0 +1,156 @@
+import os
+import sys
+import json
+import time
+import contextlib
+import numpy as np
+from typing import List, Union
+from mle_logging.utils import write_to_hdf5
+
+# Safely import such that no import errors are thrown - resource is unix-only
+try:
+    import resource
+
+    __resource_installed = True
+except ImportError:
+    __resource_installed = False
+    pass
+
+# Shared no-op context for timers of a disabled profiler
+null_phase = contextlib.nullcontext()
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of the process in MB (0 if unavailable)."""
+    if not __resource_installed:
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KB, macOS bytes
+    return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
+
+
+class PhaseTimer(object):
+    __slots__ = ["profiler", "name", "wall_start", "cpu_start"]
+
+    def __init__(self, profiler, name: str):
+        """Context manager recording wall & cpu time of one phase call."""
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.wall_start = time.perf_counter()
+        self.cpu_start = time.process_time()
+        return self
+
+    def __exit__(self, *args):
+        self.profiler.record(
+            self.name,
+            time.perf_counter() - self.wall_start,
+            time.process_time() - self.cpu_start,
+        )
+
+
+class StepProfiler(object):
+    def __init__(self, enabled: bool = True):
+        """Per-phase timing breakdown of a training job.
+        - `phase(name)` times a block (wall, cpu & process peak RSS at exit)
+        - `step()` counts training steps for the throughput (steps/sec)
+        - Disabled profilers return a shared no-op context & skip counting
+        """
+        self.enabled = enabled
+        self.phases = {}
+        self.num_steps = 0
+        self.wall_start = time.perf_counter()
+        self.cpu_start = time.process_time()
+
+    def phase(self, name: str):
+        """Context manager timing a phase, e.g. `with prof.phase("data"):`"""
+        if not self.enabled:
+            return null_phase
+        return PhaseTimer(self, name)
+
+    def record(self, name: str, wall_time: float, cpu_time: float) -> None:
+        """Add one timed call to the totals of a phase."""
+        if name not in self.phases:
+            self.phases[name] = {
+                "count": 0,
+                "wall_time": 0.0,
+                "cpu_time": 0.0,
+                "peak_rss_mb": 0.0,
+            }
+        stats = self.phases[name]
+        stats["count"] += 1
+        stats["wall_time"] += wall_time
+        stats["cpu_time"] += cpu_time
+        stats["peak_rss_mb"] = max(stats["peak_rss_mb"], peak_rss_mb())
+
+    def step(self, num_steps: int = 1) -> None:
+        """Step hook - count completed training steps."""
+        if self.enabled:
+            self.num_steps += num_steps
+
+    def summary(self) -> dict:
+        """Totals since start, throughput & per-phase breakdown."""
+        wall_time = time.perf_counter() - self.wall_start
+        phases = {}
+        for name, stats in self.phases.items():
+            phases[name] = dict(stats, wall_frac=stats["wall_time"] / wall_time)
+        return {
+            "wall_time": wall_time,
+            "cpu_time": time.process_time() - self.cpu_start,
+            "peak_rss_mb": peak_rss_mb(),
+            "num_steps": self.num_steps,
+            "steps_per_sec": self.num_steps / wall_time,
+            "phases": phases,
+        }
+
+
+def profile_to_str(profile: dict) -> str:
+    """One line summary: throughput & share of wall time per phase."""
+    phases = ", ".join(
+        [
+            f"{name} {100 * stats['wall_frac']:.0f}%"
+            for name, stats in sorted(
+                profile["phases"].items(), key=lambda x: -x[1]["wall_time"]
+            )
+        ]
+    )
+    return (
+        f"{profile['num_steps']} steps ({profile['steps_per_sec']:.2f}/s)"
+        f" | {profile['wall_time']:.1f}s wall, {profile['cpu_time']:.1f}s cpu"
+        f" | {profile['peak_rss_mb']:.0f}MB peak RSS"
+        + (f" | {phases}" if len(phases) > 0 else "")
+    )
+
+
+def write_profile(log, profile: dict) -> None:
+    """Store profile summary as `profile` in the seed's meta log."""
+    # Only add to existing logs - empty files break meta log loading
+    if not os.path.exists(log.log_save_fname):
+        return
+    write_to_hdf5(
+        log.log_save_fname, log.seed_id + "/meta/profile", [json.dumps(profile)]
+    )
+
+
+def load_profiles(meta: dict) -> List[dict]:
+    """Profile summaries (one per seed) stored in a run's meta data."""
+    if "profile" not in meta.keys():
+        return []
+    profiles = meta["profile"]
+    if isinstance(profiles, (str, bytes)):
+        profiles = [profiles]
+    profiles = np.array(profiles, dtype=object).ravel().tolist()
+    return [
+        json.loads(p.decode() if isinstance(p, bytes) else p)
+        for p in profiles
+        if len(p) > 0
+    ]
+
+
+def get_throughput(meta: dict) -> Union[float, None]:
+    """Mean steps/sec over the profiled seeds of a run (None if not profiled)."""
+    profiles = load_profiles(meta)
+    if len(profiles) == 0:
+        return None
+    return float(np.mean([p["steps_per_sec"] for p in profiles]))
@@ -106,3 +106,17 @@ def compose_protocol_data(job_config: dict, resource_to_run: str, purpose: str):
     if job_config.meta_job_args["experiment_type"] == "hyperparameter-search":
         extra_data["job_spec_args"] = job_config.param_search_args.toDict()
     return meta_data, extra_data
+
+
+def record_processing_cache_hit(protocol_db, processing_fname: str, cache) -> None:
+    """Add skipped (cached) processing job to protocol extra data."""
+    experiment_id = protocol_db.last_experiment_id
+    try:
+        cache_hits = protocol_db.get(experiment_id, "processing_cache_hits")
+    except KeyError:
+        cache_hits = {}
+    cache_hits[processing_fname] = {
+        "manifest": cache.manifest_fname,
+        "key": cache.key,
+    }
+    protocol_db.update(experiment_id, "processing_cache_hits", cache_hits)
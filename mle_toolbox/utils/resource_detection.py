@@ -0,0 +1,105 @@
+import os
+import json
+import time
+import subprocess as sp
+from typing import Union
+
+# Env variable set after detection - inherited by all launched jobs
+resource_env_var = "MLE_TOOLBOX_RESOURCE"
+# Scheduler probes in order of priority (sge before slurm as before)
+probe_commands = {"sge-cluster": "qstat", "slurm-cluster": "squeue"}
+detectable_resources = ["sge-cluster", "slurm-cluster", "local"]
+
+
+def load_cached_resource(cache_fname: str, cache_ttl: float) -> Union[str, None]:
+    """Resource stored by previous detection (None if missing or expired)."""
+    cache_fname = os.path.expanduser(cache_fname)
+    try:
+        with open(cache_fname, "r") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if time.time() - cache.get("time", 0) > cache_ttl:
+        return None
+    if cache.get("resource") not in detectable_resources:
+        return None
+    return cache["resource"]
+
+
+def store_cached_resource(resource: str, cache_fname: str) -> None:
+    """Atomically write detected resource & detection time to disk cache."""
+    cache_fname = os.path.expanduser(cache_fname)
+    try:
+        os.makedirs(os.path.dirname(cache_fname) or ".", exist_ok=True)
+        tmp_fname = f"{cache_fname}.{os.getpid()}.tmp"
+        with open(tmp_fname, "w") as f:
+            json.dump({"resource": resource, "time": time.time()}, f)
+        os.replace(tmp_fname, cache_fname)
+    except OSError:
+        # Read-only home directories etc. - simply probe again next time
+        pass
+
+
+def probe_resource(timeout: float = 10.0) -> Union[str, None]:
+    """Run qstat & squeue concurrently instead of one after the other.
+    - Higher priority probes (sge) still running are waited for
+    - After `timeout` seconds running probes are killed & count as failed,
+      returns None if no probe succeeded by then (inconclusive)
+    """
+    procs, status = {}, {}
+    for resource, cmd in probe_commands.items():
+        try:
+            procs[resource] = sp.Popen([cmd], stdout=sp.DEVNULL, stderr=sp.DEVNULL)
+        except OSError:
+            # Scheduler binary is not installed
+            status[resource] = -1
+    start_t = time.time()
+    detected = None
+    try:
+        while True:
+            for resource, proc in procs.items():
+                if resource not in status and proc.poll() is not None:
+                    status[resource] = proc.returncode
+            for resource in probe_commands.keys():
+                if resource not in status:
+                    break
+                if status[resource] == 0:
+                    detected = resource
+                    break
+            else:
+                detected = "local"
+            if detected is not None:
+                return detected
+            if time.time() - start_t > timeout:
+                successful = [r for r, s in status.items() if s == 0]
+                return successful[0] if len(successful) > 0 else None
+            time.sleep(0.01)
+    finally:
+        for proc in procs.values():
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+
+
+def determine_resource(
+    cache_fname: str = "~/.mle_toolbox/resource.json",
+    cache_ttl: float = 3600.0,
+    timeout: float = 10.0,
+) -> str:
+    """Check if cluster (sge/slurm) is available - otherwise local.
+    - Uses `MLE_TOOLBOX_RESOURCE` env variable (set by launcher) first
+    - Then disk cache of previous detection if younger than `cache_ttl`
+    - Otherwise probes qstat/squeue concurrently & caches the result
+    """
+    resource = os.environ.get(resource_env_var)
+    if resource in detectable_resources:
+        return resource
+    resource = load_cached_resource(cache_fname, cache_ttl)
+    if resource is None:
+        resource = probe_resource(timeout)
+        if resource is None:
+            # Timed out probes are inconclusive - don't cache 'local'
+            return "local"
+        store_cached_resource(resource, cache_fname)
+    os.environ[resource_env_var] = resource
+    return resource
@@ -0,0 +1,364 @@
+import os
+import sys
+import time
+import runpy
+import atexit
+import random
+import logging
+import multiprocessing as mp
+from typing import List, Tuple, Union
+from mle_logging import merge_config_logs, merge_seed_logs
+from .config_manifest import get_run_id
+
+# Modules imported once by the fork server & inherited by every warm job
+default_preload_modules = ["numpy", "mle_logging", "mle_toolbox"]
+
+# Fork server is global per process - keep a single pool instance around
+_warm_pool = None
+
+
+def use_warm_pool(resource_to_run: str, job_arguments: Union[dict, None]) -> bool:
+    """Check if local jobs should run in warm workers (`use_warm_pool`)."""
+    if resource_to_run != "local" or job_arguments is None:
+        return False
+    return bool(job_arguments.get("use_warm_pool", False))
+
+
+def get_warm_pool(preload_modules: Union[List[str], None] = None):
+    """Get (and start) the process-wide warm worker pool."""
+    global _warm_pool
+    if _warm_pool is None:
+        _warm_pool = WarmWorkerPool(preload_modules)
+    return _warm_pool
+
+
+class WarmJob(object):
+    def __init__(self, process: mp.Process):
+        """Popen-like handle of a single job running in a warm worker."""
+        self.process = process
+        self.pid = process.pid
+
+    @property
+    def returncode(self) -> Union[int, None]:
+        return self.process.exitcode
+
+    def poll(self) -> Union[int, None]:
+        """Exit code of finished job - None if still running."""
+        return self.process.exitcode
+
+    def wait(self, timeout: Union[float, None] = None) -> Union[int, None]:
+        """Block until job has finished (or timeout has passed)."""
+        self.process.join(timeout)
+        return self.process.exitcode
+
+    def communicate(self) -> Tuple[None, None]:
+        """Wait for job - stdout/stderr go to per-job files, not pipes."""
+        self.wait()
+        return None, None
+
+    def terminate(self) -> None:
+        self.process.terminate()
+
+    def kill(self) -> None:
+        self.process.kill()
+
+
+class WarmWorkerPool(object):
+    def __init__(self, preload_modules: Union[List[str], None] = None):
+        """Local executor forking jobs from a server w. heavy imports done.
+        - The fork server imports `preload_modules` (numpy, torch, jax, ...)
+          once. Each job is a fresh fork - module state is not shared
+        - Jobs run the training script as `__main__` w. its cmd line args
+        - Runs in the launching interpreter (no conda/venv activation)
+        """
+        self.preload_modules = default_preload_modules + [
+            m for m in (preload_modules or []) if m not in default_preload_modules
+        ]
+        self.ctx = mp.get_context("forkserver")
+        self.ctx.set_forkserver_preload(self.preload_modules)
+
+    def submit(
+        self,
+        job_filename: str,
+        cmd_line_args: List[str],
+        stdout_fname: Union[str, None] = None,
+        stderr_fname: Union[str, None] = None,
+        cpu_set: Union[List[int], None] = None,
+    ) -> WarmJob:
+        """Fork a warm worker & run the job script in it (pinned to `cpu_set`)."""
+        process = self.ctx.Process(
+            target=run_warm_job,
+            args=(
+                os.path.abspath(job_filename),
+                cmd_line_args,
+                stdout_fname,
+                stderr_fname,
+                os.getcwd(),
+                cpu_set,
+            ),
+            daemon=False,
+        )
+        process.start()
+        return WarmJob(process)
+
+    def submit_job(
+        self,
+        job_filename: str,
+        config_filename: Union[str, None],
+        experiment_dir: Union[str, None],
+        seed_id: Union[int, None],
+        extra_cmd_line_input: Union[dict, None] = None,
+        log_dir: Union[str, None] = None,
+        cpu_set: Union[List[int], None] = None,
+    ) -> WarmJob:
+        """Submit job w. the same cmd line args as `MLEJob` local jobs.
+        - Per-job stdout/stderr files are written to `log_dir` (if given)
+        """
+        cmd_line_args = []
+        if experiment_dir is not None:
+            cmd_line_args += ["-exp_dir", experiment_dir]
+        if config_filename is not None:
+            cmd_line_args += ["-config", config_filename]
+        if seed_id is not None:
+            cmd_line_args += ["-seed", str(seed_id)]
+        if extra_cmd_line_input is not None:
+            for k, v in extra_cmd_line_input.items():
+                cmd_line_args += ["-" + k, str(v)]
+
+        stdout_fname, stderr_fname = None, None
+        if log_dir is not None:
+            os.makedirs(log_dir, exist_ok=True)
+            stdout_fname = os.path.join(log_dir, f"stdout_seed_{seed_id}.txt")
+            stderr_fname = os.path.join(log_dir, f"stderr_seed_{seed_id}.txt")
+        return self.submit(
+            job_filename, cmd_line_args, stdout_fname, stderr_fname, cpu_set
+        )
+
+
+def run_warm_job(
+    job_filename: str,
+    cmd_line_args: List[str],
+    stdout_fname: Union[str, None],
+    stderr_fname: Union[str, None],
+    cwd: str,
+    cpu_set: Union[List[int], None] = None,
+) -> None:
+    """Entry point of a forked worker - isolate job & run script as main."""
+    # Pin job (& threads it starts) to its admitted cores
+    if cpu_set is not None:
+        os.sched_setaffinity(0, cpu_set)
+    # Redirect fds so that output of C extensions/subprocesses is captured
+    sys.stdout.flush()
+    sys.stderr.flush()
+    for fd, fname in [(1, stdout_fname), (2, stderr_fname)]:
+        target = os.open(
+            fname or os.devnull, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644
+        )
+        os.dup2(target, fd)
+        os.close(target)
+
+    # Forks share the server's RNG states - reseed like a fresh interpreter
+    random.seed()
+    if "numpy" in sys.modules:
+        sys.modules["numpy"].random.seed()
+
+    os.chdir(cwd)
+    sys.argv = [job_filename] + cmd_line_args
+    sys.path.insert(0, os.path.dirname(job_filename))
+    try:
+        runpy.run_path(job_filename, run_name="__main__")
+    except BaseException as e:
+        # Record unhandled exception like the interpreter does for a script
+        if not isinstance(e, SystemExit):
+            sys.last_type, sys.last_value = type(e), e
+            sys.last_traceback = e.__traceback__
+        raise
+    finally:
+        # Workers exit via `os._exit` - run job's exit hooks (markers, async
+        # log writer, profile) as on a normal interpreter exit
+        atexit._run_exitfuncs()
+        sys.stdout.flush()
+        sys.stderr.flush()
+
+
+class QueueProgress(object):
+    def __init__(
+        self,
+        use_slack_bot: bool = False,
+        slack_message_id: Union[str, None] = None,
+        slack_user_name: Union[str, None] = None,
+        slack_auth_token: Union[str, None] = None,
+        protocol_db=None,
+        **kwargs,
+    ):
+        """Protocol & slack progress bars of completed jobs (as `MLEQueue`).
+        - Takes the `MLEQueue` slack/protocol kwargs of a replacement queue
+        """
+        self.use_slack_bot = (
+            use_slack_bot
+            and slack_user_name is not None
+            and slack_auth_token is not None
+        )
+        self.slack_message_id = slack_message_id
+        self.slack_user_name = slack_user_name
+        self.slack_auth_token = slack_auth_token
+        self.protocol_db = protocol_db
+        self.slackbot = None
+
+    def start(self, queue) -> None:
+        """Initialize slack progress bar for all jobs of a queue.
+        - Announces the queue's jobs if there is no slack message to update
+        """
+        if not self.use_slack_bot:
+            return
+        try:
+            from clusterbot import ClusterBot
+        except ImportError:
+            raise ImportError(
+                "You need to install & setup `slack-clusterbot` to "
+                "use status notifications."
+            )
+        logging.getLogger("clusterbot").setLevel(logging.WARNING)
+        self.slackbot = ClusterBot(
+            slack_token=self.slack_auth_token, user_name=self.slack_user_name
+        )
+        if self.slack_message_id is None:
+            self.slack_message_id = self.slackbot.send(
+                f":rocket: Start running {len(queue.queue)} jobs :rocket:\n"
+                f"→ Compute resource: `{queue.resource_to_run}`\n"
+                f"→ Bash execution file: `{queue.job_filename}`\n"
+                f"→ Config .yaml: `{queue.config_filenames}`\n"
+                f"→ Seeds: `{queue.random_seeds}`",
+                user_name=self.slack_user_name,
+            )
+        self.slackbot.init_pbar(len(queue.queue), ts=self.slack_message_id)
+
+    def job_completed(self) -> None:
+        """Advance slack & protocol progress bars by one completed job."""
+        if self.slackbot is not None:
+            try:
+                self.slackbot.update_pbar()
+            except Exception:
+                pass
+        if self.protocol_db is not None:
+            self.protocol_db.update_progress_bar()
+
+
+class WarmJobQueue(object):
+    def __init__(
+        self,
+        resource_to_run: str,
+        job_filename: str,
+        job_arguments: dict,
+        config_filenames: Union[List[str], str],
+        experiment_dir: str,
+        num_seeds: int = 1,
+        default_seed: int = 0,
+        random_seeds: Union[None, List[int]] = None,
+        max_running_jobs: Union[int, None] = 10,
+        automerge_seeds: bool = False,
+        automerge_configs: bool = False,
+        debug_mode: bool = False,
+        **kwargs,
+    ):
+        """Drop-in for local `MLEQueue` runs executed by the warm pool.
+        - Jobs & run directories/ids match `MLEQueue` (config basename)
+        - Completed jobs update protocol & slack progress bars (`QueueProgress`),
+          remaining `MLEQueue` kwargs (cloud) are ignored
+        """
+        assert resource_to_run == "local", "Warm pool only runs local jobs."
+        self.resource_to_run = resource_to_run
+        self.job_filename = job_filename
+        self.job_arguments = job_arguments.copy()
+        if type(config_filenames) != list:
+            config_filenames = [config_filenames]
+        self.config_filenames = config_filenames
+        self.experiment_dir = experiment_dir
+        if random_seeds is not None:
+            num_seeds = len(random_seeds)
+        elif num_seeds > 1:
+            random_seeds = random.sample(range(100000, 999999), num_seeds)
+        else:
+            random_seeds = [default_seed]
+        self.num_seeds = num_seeds
+        self.random_seeds = random_seeds
+        self.max_running_jobs = max_running_jobs
+        self.automerge_seeds = automerge_seeds
+        self.automerge_configs = automerge_configs
+        self.debug_mode = debug_mode
+        self.extra_cmd_line_input = self.job_arguments.pop("extra_cmd_line_input", None)
+        self.pool = None
+        if use_warm_pool(resource_to_run, self.job_arguments):
+            self.pool = get_warm_pool(self.job_arguments.get("warm_pool_preload"))
+        self.progress = QueueProgress(**kwargs)
+
+        self.queue, self.mle_log_dirs, self.mle_run_ids = [], [], []
+        for config_fname in self.config_filenames:
+            base_str = get_run_id(config_fname)
+            sub_experiment_dir = os.path.join(experiment_dir, base_str)
+            self.mle_log_dirs.append(sub_experiment_dir)
+            self.mle_run_ids.append(base_str)
+            for seed_id in self.random_seeds:
+                self.queue.append(
+                    {
+                        "config_fname": config_fname,
+                        "seed_id": seed_id,
+                        "log_dir": sub_experiment_dir if debug_mode else None,
+                    }
+                )
+
+    def run(self) -> None:
+        """Run all config/seed jobs w. at most `max_running_jobs` at a time."""
+        self.progress.start(self)
+        to_launch, running = list(self.queue), []
+        max_running_jobs = self.max_running_jobs or len(self.queue)
+        while len(to_launch) > 0 or len(running) > 0:
+            while len(to_launch) > 0 and len(running) < max_running_jobs:
+                running.append(self.launch(to_launch.pop(0)))
+            still_running = []
+            for job in running:
+                if job.poll() is None:
+                    still_running.append(job)
+                else:
+                    self.progress.job_completed()
+            running = still_running
+            time.sleep(0.05)
+
+        merge_queue_logs(
+            self.experiment_dir,
+            self.mle_log_dirs,
+            self.mle_run_ids,
+            self.num_seeds,
+            self.automerge_seeds,
+            self.automerge_configs,
+        )
+
+    def launch(self, job: dict, cpu_set: Union[List[int], None] = None) -> WarmJob:
+        """Submit a single queued config/seed job to the warm pool."""
+        return self.pool.submit_job(
+            self.job_filename,
+            job["config_fname"],
+            self.experiment_dir,
+            job["seed_id"],
+            self.extra_cmd_line_input,
+            job["log_dir"],
+            cpu_set,
+        )
+
+
+def merge_queue_logs(
+    experiment_dir: str,
+    log_dirs: List[str],
+    run_ids: List[str],
+    num_seeds: int,
+    automerge_seeds: bool = False,
+    automerge_configs: bool = False,
+) -> None:
+    """Merge seed logs per run (& run logs into meta log) like `MLEQueue`."""
+    if not (automerge_seeds or automerge_configs):
+        return
+    for log_dir in log_dirs:
+        merged_path = os.path.join(log_dir, "logs", "log.hdf5")
+        merge_seed_logs(merged_path, log_dir, num_seeds)
+    if automerge_configs:
+        merge_config_logs(experiment_dir=experiment_dir, all_run_ids=run_ids)
@@ -1,7 +1,12 @@
 import os
+import copy
 import shutil
 import subprocess as sp
+from mle_logging import load_config, load_log
+from mle_hyperopt.utils import write_configs
 from mle_toolbox.launch.search_experiment import run_hyperparameter_search
+from mle_toolbox.utils import save_pkl_object, load_hyper_log
+from mle_toolbox.utils.batch_resume import get_seed_marker_fname
 
 
 resource_to_run = "local"
@@ -80,6 +85,66 @@ def test_run_grid_sync() -> None:
     check_correct_results(exp_dir)
 
 
+def test_run_grid_sync_resume() -> None:
+    """Resume interrupted batch & only relaunch missing seed jobs."""
+    exp_dir = os.path.join(experiment_dir, "run_sync_resume_test")
+    meta_job_args["experiment_dir"] = exp_dir
+    # Remove experiment dir at start of test
+    if os.path.exists(exp_dir) and os.path.isdir(exp_dir):
+        shutil.rmtree(exp_dir)
+
+    param_search_args = {
+        "search_logging": copy.deepcopy(search_logging),
+        "search_resources": dict(search_resources_sync, num_search_batches=1),
+        "search_config": copy.deepcopy(search_config),
+    }
+    param_search_args["search_config"]["search_schedule"] = "sync"
+    run_hyperparameter_search(
+        resource_to_run, meta_job_args, single_job_args, param_search_args
+    )
+
+    # Simulate batch 2 interrupted after single completed seed job
+    proposals = [{"lrate": 0.3}, {"lrate": 0.4}]
+    save_pkl_object(
+        {"proposals": proposals, "random_seeds": [1, 4]},
+        os.path.join(exp_dir, "b_2_pending.pkl"),
+    )
+    configs, config_fnames = [], []
+    for i, proposal in enumerate(proposals):
+        config = load_config(meta_job_args["base_train_config"])
+        config["train_config"]["lrate"] = proposal["lrate"]
+        config["log_config"]["verbose"] = False
+        configs.append(config)
+        config_fnames.append(os.path.join(exp_dir, f"b_2_eval_{i}.yaml"))
+    write_configs(configs, config_fnames)
+    sp.run(
+        f"python {meta_job_args['base_train_fname']} -config {config_fnames[0]}"
+        f" -exp_dir {exp_dir} -seed 1",
+        shell=True,
+        stdout=sp.DEVNULL,
+    )
+    marker_fname = get_seed_marker_fname(os.path.join(exp_dir, "b_2_eval_0"), 1)
+    marker_mtime = os.path.getmtime(marker_fname)
+
+    param_search_args["search_logging"]["reload_log"] = True
+    param_search_args["search_resources"]["num_search_batches"] = 2
+    run_hyperparameter_search(
+        resource_to_run, meta_job_args, single_job_args, param_search_args
+    )
+
+    check_correct_results(exp_dir)
+    hyper_log = load_hyper_log(os.path.join(exp_dir, "hyper_log.pkl"))
+    assert hyper_log.run_id.tolist() == [
+        "b_1_eval_0",
+        "b_1_eval_1",
+        "b_2_eval_0",
+        "b_2_eval_1",
+    ]
+    # Completed seed job was not relaunched & pending batch was cleaned up
+    assert os.path.getmtime(marker_fname) == marker_mtime
+    assert not os.path.exists(os.path.join(exp_dir, "b_2_pending.pkl"))
+
+
 def test_run_grid_async() -> None:
     """Test job launch wrapper - Run PDE experiment on local machine."""
     exp_dir = os.path.join(experiment_dir, "run_async_test")
@@ -102,6 +167,74 @@ def test_run_grid_async() -> None:
     check_correct_results(exp_dir)
 
 
+def test_run_grid_async_concurrent_configs() -> None:
+    """Test concurrent per-config async searches with shared job budget."""
+    exp_dir = os.path.join(experiment_dir, "run_async_concurrent_test")
+    # Remove experiment dir at start of test
+    if os.path.exists(exp_dir) and os.path.isdir(exp_dir):
+        shutil.rmtree(exp_dir)
+
+    multi_meta_job_args = {
+        "base_train_fname": "examples/toy_single_objective/train.py",
+        "base_train_config": [
+            "examples/toy_single_objective/base_config_1.yaml",
+            "examples/toy_single_objective/base_config_2.yaml",
+        ],
+        "experiment_dir": exp_dir,
+        "concurrent_configs": True,
+    }
+    param_search_args = {
+        "search_logging": search_logging,
+        "search_resources": search_resources_async,
+        "search_config": search_config,
+    }
+    param_search_args["search_config"]["search_schedule"] = "async"
+
+    run_hyperparameter_search(
+        resource_to_run, multi_meta_job_args, single_job_args, param_search_args
+    )
+
+    # Each config keeps its own hyper log, strategy & meta log
+    check_correct_results(os.path.join(exp_dir, "base_config_1"))
+    check_correct_results(os.path.join(exp_dir, "base_config_2"))
+
+
+def test_run_grid_async_seeds_per_process() -> None:
+    """Run all seeds of an eval in one process - same per-seed logs."""
+    exp_dir = os.path.join(experiment_dir, "run_async_seeds_per_process_test")
+    # Remove experiment dir at start of test
+    if os.path.exists(exp_dir) and os.path.isdir(exp_dir):
+        shutil.rmtree(exp_dir)
+    os.makedirs(exp_dir)
+
+    config = load_config(meta_job_args["base_train_config"])
+    config["log_config"]["verbose"] = False
+    config_fname = os.path.join(exp_dir, "base_config.yaml")
+    write_configs([config], [config_fname])
+    seed_meta_job_args = dict(
+        meta_job_args, base_train_config=config_fname, experiment_dir=exp_dir
+    )
+    param_search_args = {
+        "search_logging": copy.deepcopy(search_logging),
+        "search_resources": search_resources_async,
+        "search_config": dict(search_config, search_schedule="async"),
+    }
+    run_hyperparameter_search(
+        resource_to_run,
+        seed_meta_job_args,
+        {"seeds_per_process": True},
+        param_search_args,
+    )
+
+    check_correct_results(exp_dir)
+    meta_log = load_log(os.path.join(exp_dir, "meta_log.hdf5"))
+    assert len(meta_log.eval_ids) == 4
+    for run_id in meta_log.eval_ids:
+        for seed_id in [1, 4]:
+            run_dir = os.path.join(exp_dir, run_id)
+            assert os.path.exists(get_seed_marker_fname(run_dir, seed_id))
+
+
 def test_api_grid_sync() -> None:
     """Execute `mle run pde_grid_sync.yaml` and check running pipeline."""
     os.chdir("./examples")
@@ -26,3 +26,23 @@ def test_run_processing() -> None:
         shutil.rmtree(experiment_dir)
     run_processing_job(resource_to_run, processing_args, experiment_dir)
     check_correct_results(experiment_dir)
+
+
+def test_run_processing_cached() -> None:
+    """Processing job declaring outputs is skipped if nothing changed."""
+    if os.path.exists(experiment_dir) and os.path.isdir(experiment_dir):
+        shutil.rmtree(experiment_dir)
+    cached_args = dict(
+        processing_args,
+        inputs=["tests/unit/fixtures/json_config.json"],
+        outputs=[os.path.join(experiment_dir, "figures/sine_wave.png")],
+        cache_dir=os.path.join(experiment_dir, ".mle_cache"),
+    )
+    assert run_processing_job(resource_to_run, cached_args, experiment_dir) == 0
+    check_correct_results(experiment_dir)
+    status = run_processing_job(resource_to_run, cached_args, experiment_dir)
+    assert status == "cached"
+    # Missing outputs trigger a re-run
+    os.remove(os.path.join(experiment_dir, "figures/sine_wave.png"))
+    assert run_processing_job(resource_to_run, cached_args, experiment_dir) == 0
+    check_correct_results(experiment_dir)
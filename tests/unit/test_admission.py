@@ -0,0 +1,65 @@
+import os
+from mle_toolbox.utils.admission import (
+    AdmissionController,
+    AdmittedJobQueue,
+    get_available_cpus,
+)
+
+job_script = """
+import os
+from mle_toolbox.utils import parse_experiment_args
+
+cmd_args, _ = parse_experiment_args()
+fname = os.path.join(cmd_args.experiment_dir, f"affinity_{cmd_args.seed_id}.txt")
+with open(fname, "w") as f:
+    f.write(" ".join([str(c) for c in sorted(os.sched_getaffinity(0))]))
+"""
+
+
+def test_admission_disjoint_cores():
+    """Admitted jobs get disjoint core sets & wait once cores are taken."""
+    num_cpus = len(get_available_cpus())
+    admission = AdmissionController(cores_per_job=1)
+    assert admission.max_jobs == num_cpus
+    cpu_sets = [admission.admit() for _ in range(num_cpus)]
+    assert sorted(sum(cpu_sets, [])) == get_available_cpus()
+    assert admission.admit() is None
+
+    admission.release(cpu_sets[0], 2.0, 1.0)
+    assert admission.admit() == cpu_sets[0]
+    assert "Queue Wait: 2.0s" in admission.summary()
+
+
+def test_admission_memory_budget():
+    """Memory hint & max running jobs cap the number of concurrent jobs."""
+    admission = AdmissionController(memory_per_job=1e12)
+    if admission.available_memory is not None:
+        assert admission.max_jobs == 1
+    admission = AdmissionController(max_running_jobs=1)
+    assert admission.admit() is not None
+    assert admission.admit() is None
+
+
+def test_admitted_jobs_pinned(tmp_path):
+    """Job interpreters (spawned via shell) start on their admitted cores."""
+    job_fname = os.path.join(str(tmp_path), "train.py")
+    with open(job_fname, "w") as f:
+        f.write(job_script)
+    experiment_dir = os.path.join(str(tmp_path), "experiments")
+    os.makedirs(experiment_dir)
+    cpus_before = get_available_cpus()
+    queue = AdmittedJobQueue(
+        "local",
+        job_fname,
+        {"admission_control": True, "num_logical_cores": 1},
+        "configs/eval_0.yaml",
+        experiment_dir,
+        random_seeds=[1, 2],
+    )
+    queue.run()
+    for seed_id in [1, 2]:
+        with open(os.path.join(experiment_dir, f"affinity_{seed_id}.txt")) as f:
+            cpu_set = [int(c) for c in f.read().split()]
+        assert len(cpu_set) == 1 and cpu_set[0] in cpus_before
+    # Queue itself keeps running on all of its cores
+    assert get_available_cpus() == cpus_before
@@ -0,0 +1,48 @@
+import time
+import pytest
+from mle_toolbox.utils.async_logger import AsyncLogWriter
+
+
+class SlowLog(object):
+    """Stand-in for `MLELogger` w. slow (disk-bound) updates."""
+
+    def __init__(self, write_time: float = 0.05):
+        self.write_time = write_time
+        self.updates = []
+
+    def update(self, clock_tick, stats_tick, model=None, **kwargs):
+        time.sleep(self.write_time)
+        if stats_tick.get("fail", False):
+            raise IOError("Disk full")
+        self.updates.append((clock_tick["step"], model))
+
+
+def test_async_writer():
+    """Updates are written in order - model is snapshotted on submit."""
+    log, writer = SlowLog(), AsyncLogWriter(queue_size=2)
+    model = {"w": [0]}
+    start_t = time.time()
+    for step in range(4):
+        model["w"][0] = step
+        writer.submit(log, {"step": step}, {"loss": 1.0}, model=model)
+    # First updates don't wait for the disk, full queue blocks the step
+    assert writer.num_blocked >= 1 and time.time() - start_t < 0.2
+    writer.flush()
+    assert log.updates == [(s, {"w": [s]}) for s in range(4)]
+    writer.close(verbose=False)
+    assert writer.num_submitted == 4 and writer.num_dropped == 0
+
+
+def test_async_writer_drop_and_error():
+    """Full queue drops updates if desired & writer errors are re-raised."""
+    log = SlowLog()
+    writer = AsyncLogWriter(queue_size=1, drop_when_full=True)
+    submitted = [writer.submit(log, {"step": s}, {}) for s in range(5)]
+    writer.flush()
+    assert writer.num_dropped == submitted.count(False) > 0
+    assert len(log.updates) == submitted.count(True)
+    writer.submit(log, {"step": 5}, {"fail": True})
+    with pytest.raises(IOError):
+        writer.flush()
+    writer.close(verbose=False)
+    assert f"{writer.num_dropped} dropped" in writer.summary()
@@ -0,0 +1,63 @@
+import os
+import sys
+import subprocess as sp
+from mle_toolbox.utils.batch_resume import (
+    get_seed_marker_fname,
+    get_missing_seed_jobs,
+    remove_partial_seed_logs,
+)
+
+
+def touch(fname: str) -> None:
+    os.makedirs(os.path.dirname(fname), exist_ok=True)
+    open(fname, "w").close()
+
+
+def test_missing_seed_jobs(tmp_path):
+    """Only seeds w. log & completion marker (or merged runs) are done."""
+    exp_dir = str(tmp_path)
+    run_ids = ["b_2_eval_0", "b_2_eval_1", "b_2_eval_2"]
+    # Run 0: merged seed logs - complete
+    touch(os.path.join(exp_dir, "b_2_eval_0", "logs", "log.hdf5"))
+    # Run 1: seed 1 completed, seed 4 interrupted mid-run (no marker)
+    for seed_id in [1, 4]:
+        touch(os.path.join(exp_dir, "b_2_eval_1", "logs", f"log_seed_{seed_id}.hdf5"))
+    touch(get_seed_marker_fname(os.path.join(exp_dir, "b_2_eval_1"), 1))
+    # Run 2: never launched
+    missing = get_missing_seed_jobs(exp_dir, run_ids, [1, 4])
+    assert missing == {"b_2_eval_1": [4], "b_2_eval_2": [1, 4]}
+
+    remove_partial_seed_logs(exp_dir, missing)
+    log_dir = os.path.join(exp_dir, "b_2_eval_1", "logs")
+    assert os.listdir(log_dir) == ["log_seed_1.hdf5"]
+
+
+# Plain `MLExperiment` job without the `experiment` decorator
+job_script = """
+import sys
+from mle_toolbox import MLExperiment
+
+mle = MLExperiment(
+    log_config={"time_to_track": ["step"], "what_to_track": ["loss"], "verbose": False}
+)
+mle.update_log({"step": 1}, {"loss": 0.5}, save=True)
+if sys.argv[-1] == "crash":
+    raise ValueError("Job crashed.")
+"""
+
+
+def test_experiment_marks_completed(tmp_path):
+    """Jobs mark their seeds completed at exit - unless they crashed."""
+    job_fname = str(tmp_path / "train.py")
+    with open(job_fname, "w") as f:
+        f.write(job_script)
+    for run_id, status in [("b_1_eval_0", "done"), ("b_1_eval_1", "crash")]:
+        run_dir = str(tmp_path / run_id)
+        sp.run(
+            [sys.executable, job_fname, "-exp_dir", run_dir, "-seed", "1", status],
+            cwd=str(tmp_path),
+            stdout=sp.DEVNULL,
+            stderr=sp.DEVNULL,
+        )
+    missing = get_missing_seed_jobs(str(tmp_path), ["b_1_eval_0", "b_1_eval_1"], [1])
+    assert missing == {"b_1_eval_1": [1]}
@@ -0,0 +1,38 @@
+import os
+import numpy as np
+from mle_logging import MLELogger, load_log
+from mle_logging.load import load_model
+from mle_toolbox.utils.checkpoint import CheckpointManager
+
+
+def test_checkpoint_manager(tmp_path):
+    """Background ckpts keep final path, snapshot params & prune history."""
+    log = MLELogger(
+        experiment_dir=str(tmp_path),
+        time_to_track=["step"],
+        what_to_track=["loss"],
+        model_type="numpy",
+        seed_id=1,
+        verbose=False,
+    )
+    manager = CheckpointManager(keep_last=2)
+    assert manager.supports(log)
+    params = {"w": np.zeros(10)}
+    for step in range(1, 5):
+        params["w"] += 1
+        manager.save_log_model(log, params)
+        log.update({"step": step}, {"loss": 1 / step}, save=True)
+    # Later in-place update must not end up in the stored checkpoint
+    params["w"] += 100
+    manager.wait()
+    final_fname = log.model_log.final_model_save_fname
+    assert load_model(final_fname, "numpy")["w"][0] == 4
+    history_dir = os.path.join(os.path.dirname(os.path.dirname(final_fname)), "history")
+    assert sorted(os.listdir(history_dir)) == [
+        "final_seed_1_3.pkl",
+        "final_seed_1_4.pkl",
+    ]
+    assert not [f for f in os.listdir(os.path.dirname(final_fname)) if "tmp" in f]
+    # Path consumed as `model_ckpt_path` by PBT/Halving is stored in meta log
+    meta_log = load_log(str(tmp_path))
+    assert meta_log["seed_1"].meta.model_ckpt == final_fname
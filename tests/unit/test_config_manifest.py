@@ -0,0 +1,105 @@
+import os
+import pytest
+from mle_toolbox.utils import load_job_config
+from mle_toolbox.utils.config_manifest import (
+    write_config_manifest,
+    load_manifest_entry,
+    is_manifest_ref,
+    get_run_id,
+)
+from mle_toolbox.utils.warm_pool import WarmJobQueue
+from mle_toolbox.utils.admission import AdmittedJobQueue
+from mle_toolbox.utils.job_array import ArrayJobQueue
+from mle_toolbox.hyperopt.speculation import SpeculativeJobQueue
+from test_job_array import fake_clusters, install_fake_cluster
+
+job_script = """
+import os
+from mle_toolbox.utils import parse_experiment_args
+from mle_toolbox.utils.config_manifest import get_run_id
+
+cmd_args, _ = parse_experiment_args()
+run_dir = os.path.join(cmd_args.experiment_dir, get_run_id(cmd_args.config_fname))
+os.makedirs(run_dir, exist_ok=True)
+open(os.path.join(run_dir, f"seed_{cmd_args.seed_id}.txt"), "w").close()
+"""
+
+
+def get_config(lrate: float) -> dict:
+    return {
+        "train_config": {"lrate": lrate},
+        "log_config": {
+            "time_to_track": ["num_updates"],
+            "what_to_track": ["loss"],
+        },
+    }
+
+
+def test_manifest_entries(tmp_path):
+    """Each reference loads its own config entry from the manifest."""
+    manifest_fname = os.path.join(tmp_path, "b_1_manifest.json")
+    run_ids = [f"b_1_eval_{i}" for i in range(5)]
+    configs = [get_config(0.1 * i) for i in range(5)]
+    config_refs = write_config_manifest(configs, run_ids, manifest_fname)
+    assert os.listdir(tmp_path) == ["b_1_manifest.json"]
+    for i, config_ref in enumerate(config_refs):
+        assert is_manifest_ref(config_ref)
+        # Run id can be recovered like from a per-run config filename
+        assert get_run_id(config_ref) == run_ids[i]
+        assert load_manifest_entry(config_ref) == (run_ids[i], configs[i])
+    assert not is_manifest_ref(manifest_fname)
+
+
+def test_load_job_config_manifest(tmp_path):
+    """Job configs from manifest log into <experiment_dir>/<run_id>."""
+    manifest_fname = os.path.join(tmp_path, "b_1_manifest.json")
+    config_refs = write_config_manifest(
+        [get_config(0.1), get_config(0.2)], ["b_1_eval_0", "b_1_eval_1"], manifest_fname
+    )
+    train_config, _, log_config, _ = load_job_config(
+        config_refs[1], str(tmp_path), seed_id=3
+    )
+    assert train_config.lrate == 0.2
+    assert train_config.seed_id == 3
+    assert log_config.config_fname is None
+    assert log_config.config_dict == get_config(0.2)
+    assert log_config.experiment_dir == os.path.join(tmp_path, "b_1_eval_1")
+
+
+@pytest.mark.parametrize(
+    "queue_class",
+    [WarmJobQueue, AdmittedJobQueue, ArrayJobQueue, SpeculativeJobQueue],
+)
+def test_queue_manifest_run_ids(tmp_path, monkeypatch, queue_class):
+    """Queues log manifest entries into the same run dirs as the jobs."""
+    resource_to_run, job_arguments = "local", {}
+    if queue_class == WarmJobQueue:
+        job_arguments["use_warm_pool"] = True
+    elif queue_class == ArrayJobQueue:
+        resource_to_run = "slurm-cluster"
+        install_fake_cluster(str(tmp_path), resource_to_run)
+        monkeypatch.setenv("PATH", str(tmp_path) + os.pathsep + os.environ["PATH"])
+        job_arguments = dict(fake_clusters[resource_to_run]["job_arguments"])
+        job_arguments["array_poll_interval"] = 0.1
+    job_fname = os.path.join(tmp_path, "train.py")
+    with open(job_fname, "w") as f:
+        f.write(job_script)
+    run_ids = ["b_1_eval_0", "b_1_eval_1"]
+    config_refs = write_config_manifest(
+        [get_config(0.1), get_config(0.2)],
+        run_ids,
+        os.path.join(tmp_path, "b_1_manifest.json"),
+    )
+    experiment_dir = os.path.join(tmp_path, "experiments")
+    queue = queue_class(
+        resource_to_run,
+        job_fname,
+        job_arguments,
+        config_refs,
+        experiment_dir,
+        random_seeds=[1, 2],
+    )
+    assert queue.mle_run_ids == run_ids
+    queue.run()
+    for log_dir in queue.mle_log_dirs:
+        assert sorted(os.listdir(log_dir)) == ["seed_1.txt", "seed_2.txt"]
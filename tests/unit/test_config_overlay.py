@@ -0,0 +1,47 @@
+import copy
+from dotmap import DotMap
+from mle_toolbox.hyperopt.config_overlay import overlay_proposal
+
+base_config = DotMap(
+    {
+        "train_config": {
+            "lrate": 0.1,
+            "schedule": [1, 2, 3],
+            "opt_params": {"beta1": 0.9, "beta2": 0.99},
+        },
+        "model_config": {"num_layers": 2},
+        "log_config": {"time_to_track": ["num_updates"]},
+    }
+)
+
+
+def test_overlay_matches_deepcopy():
+    """Overlay produces same config as modifying a deepcopy of the base."""
+    proposal = {
+        "train:lrate": 0.5,
+        "model:num_layers": 4,
+        "opt_params": {"beta1": 0.8},
+        "batch_size": 32,
+    }
+    base_dict = base_config.toDict()
+    config = overlay_proposal(base_dict, proposal).toDict()
+
+    reference = copy.deepcopy(base_config)
+    reference.train_config.lrate = 0.5
+    reference.model_config.num_layers = 4
+    reference.train_config.opt_params.beta1 = 0.8
+    reference.train_config.batch_size = 32
+    assert config == reference.toDict()
+
+    # Base is left untouched & unchanged sections are shared
+    assert base_dict == base_config.toDict()
+    assert config["log_config"] is base_dict["log_config"]
+    assert config["train_config"]["schedule"] is base_dict["train_config"]["schedule"]
+
+
+def test_overlay_flat_config():
+    """Configs without train_config are overwritten at top-level."""
+    base_dict = {"lrate": 0.1, "num_epochs": 10}
+    config = overlay_proposal(base_dict, {"lrate": 0.2}).toDict()
+    assert config == {"lrate": 0.2, "num_epochs": 10}
+    assert base_dict["lrate"] == 0.1
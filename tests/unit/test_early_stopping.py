@@ -0,0 +1,58 @@
+import os
+import h5py
+import numpy as np
+from mle_toolbox.hyperopt.early_stopping import (
+    EarlyStopper,
+    MedianStoppingRule,
+    CurveExtrapolationRule,
+)
+
+
+def write_seed_log(experiment_dir: str, run_id: str, seed_id: int, curve: list):
+    """Write intermediate seed log <run_id>/logs/log_seed_<id>.hdf5."""
+    log_dir = os.path.join(experiment_dir, run_id, "logs")
+    os.makedirs(log_dir, exist_ok=True)
+    log_path = os.path.join(log_dir, f"log_seed_{seed_id}.hdf5")
+    with h5py.File(log_path, "w") as h5f:
+        h5f.create_dataset(f"seed_{seed_id}/stats/test_loss", data=curve)
+
+
+def test_stopping_rules():
+    """Losing curves are stopped once enough steps & references exist."""
+    rule = MedianStoppingRule(min_steps=2, min_runs=2)
+    refs = [np.array([1.0, 0.8, 0.6]), np.array([1.0, 0.9, 0.8])]
+    assert rule.should_stop(np.array([1.5, 1.4]), refs, max_objective=False)
+    assert not rule.should_stop(np.array([0.9, 0.7]), refs, max_objective=False)
+    assert not rule.should_stop(np.array([1.5, 1.4]), refs, max_objective=True)
+    # Too few steps logged or too few reference runs
+    assert not rule.should_stop(np.array([1.5]), refs, max_objective=False)
+    assert not rule.should_stop(np.array([1.5, 1.4]), refs[:1], max_objective=False)
+
+    rule = CurveExtrapolationRule(final_step=10, min_steps=3)
+    steps = np.arange(1, 4)
+    ref = [1.0 - 0.3 * np.log(np.arange(1, 11))]
+    assert rule.should_stop(1.0 - 0.1 * np.log(steps), ref, max_objective=False)
+    assert not rule.should_stop(1.0 - 0.5 * np.log(steps), ref, max_objective=False)
+
+
+def test_early_stopper_seed_logs(tmp_path):
+    """Curves are averaged over seed logs & compared to completed runs."""
+    for run_id, offset in [("b_1_eval_0", 0.0), ("b_1_eval_1", 0.1)]:
+        for seed_id in range(2):
+            write_seed_log(str(tmp_path), run_id, seed_id, [1.0 + offset, 0.5])
+    stopper = EarlyStopper(
+        str(tmp_path), False, "test_loss", "median", 0, min_steps=2, min_runs=2
+    )
+    stopper.add_completed("b_1_eval_0")
+    stopper.add_completed("b_1_eval_1")
+    assert np.allclose(stopper.completed_curves["b_1_eval_0"], [1.0, 0.5])
+
+    # Ragged seeds: second seed has only logged the first step so far
+    write_seed_log(str(tmp_path), "b_1_eval_2", 0, [2.0, 1.0])
+    write_seed_log(str(tmp_path), "b_1_eval_2", 1, [3.0])
+    write_seed_log(str(tmp_path), "b_1_eval_3", 0, [0.5, 0.2])
+    assert np.allclose(stopper.read_curve("b_1_eval_2"), [2.5, 1.0])
+    assert stopper.read_curve("b_1_eval_4") is None
+    running = ["b_1_eval_2", "b_1_eval_3", "b_1_eval_4"]
+    assert stopper.check(running) == ["b_1_eval_2"]
+    assert stopper.stopped_run_ids == ["b_1_eval_2"]
@@ -0,0 +1,63 @@
+import types
+import numpy as np
+from mle_toolbox.hyperopt.eval_cache import EvalCache
+from mle_toolbox.hyperopt.mle_batch_search import MLE_BatchSearch
+
+scoring = {
+    "problem_type": "final",
+    "aggregate_seeds": "mean",
+    "max_objective": False,
+    "eval_metrics": ["test_loss"],
+}
+base_config = {"train_config": {"lrate": 0.1}, "log_config": {}}
+eval_iter = {
+    "params": {"lrate": 0.2, "opt": {"beta": 0.9}},
+    "time_elapsed": 10.0,
+    "run_id": "b_1_eval_0",
+    "test_loss": 0.5,
+    "experiment_dir": "experiments/b_1_eval_0",
+}
+
+
+def test_cache_hit_miss(tmp_path):
+    """Stored evals are hit independent of dict order & numpy scalar types."""
+    script = tmp_path / "train.py"
+    script.write_text("print('train')")
+    cache = EvalCache(str(tmp_path / "cache"), str(script), base_config, scoring)
+    assert cache.lookup({"lrate": 0.2, "opt": {"beta": 0.9}}, [1, 2]) is None
+    cache.store({"lrate": 0.2, "opt": {"beta": 0.9}}, [1, 2], eval_iter)
+
+    # New cache instance (e.g. later experiment) w. same script & base config
+    cache = EvalCache(str(tmp_path / "cache"), str(script), base_config, scoring)
+    entry = cache.lookup({"opt": {"beta": 0.9}, "lrate": np.float64(0.2)}, [2, 1])
+    assert entry["scores"] == {"test_loss": 0.5}
+    assert entry["meta"] == {"experiment_dir": "experiments/b_1_eval_0"}
+    # Different seeds or scoring are misses
+    assert cache.lookup({"lrate": 0.2, "opt": {"beta": 0.9}}, [3]) is None
+    assert (cache.hits, cache.misses) == (1, 1)
+    cache.scoring = dict(scoring, problem_type="best")
+    assert cache.lookup({"lrate": 0.2, "opt": {"beta": 0.9}}, [1, 2]) is None
+
+    # Changes to the training script invalidate the cache
+    script.write_text("print('train v2')")
+    cache = EvalCache(str(tmp_path / "cache"), str(script), base_config, scoring)
+    assert cache.lookup({"lrate": 0.2, "opt": {"beta": 0.9}}, [1, 2]) is None
+
+
+def test_cache_raced_evals(tmp_path):
+    """Only evals of the full seed set are stored - raced subsets are skipped."""
+    script = tmp_path / "train.py"
+    script.write_text("print('train')")
+    cache = EvalCache(str(tmp_path / "cache"), str(script), base_config, scoring)
+    search = types.SimpleNamespace(
+        eval_cache=cache,
+        hyper_log=types.SimpleNamespace(iter_id=0, opt_log={0: eval_iter}),
+    )
+    proposal = {"lrate": 0.2, "opt": {"beta": 0.9}}
+    # Raced eval dropped after its first seeds - neither key gets an entry
+    MLE_BatchSearch.update_eval_cache(search, [proposal], [1, 2, 3], [1, 2])
+    assert cache.lookup(proposal, [1, 2, 3]) is None
+    assert cache.lookup(proposal, [1, 2]) is None
+    # Raced eval that ran all seeds (in a different order) is stored
+    MLE_BatchSearch.update_eval_cache(search, [proposal], [1, 2, 3], [3, 1, 2])
+    assert cache.lookup(proposal, [1, 2, 3])["scores"] == {"test_loss": 0.5}
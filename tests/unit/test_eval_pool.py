@@ -0,0 +1,117 @@
+import os
+import time
+import threading
+from mle_toolbox.hyperopt.eval_pool import EvalJobPool, JobBudget
+
+# Config name sets the job duration - seed 2 of `mixed` evals hangs
+job_script = """
+import os
+import time
+import argparse
+
+parser = argparse.ArgumentParser()
+parser.add_argument("-config", "--config_fname")
+parser.add_argument("-exp_dir", "--experiment_dir")
+parser.add_argument("-seed", "--seed_id", type=int)
+parser.add_argument("-seed_ids", default=None)
+args, _ = parser.parse_known_args()
+run_id = os.path.splitext(os.path.basename(args.config_fname))[0]
+seeds = [args.seed_id]
+if args.seed_ids is not None:
+    seeds = [int(s) for s in args.seed_ids.split(",")]
+os.makedirs(args.experiment_dir, exist_ok=True)
+with open(os.path.join(args.experiment_dir, f"{run_id}_{seeds[0]}.txt"), "w") as f:
+    f.write(",".join([str(s) for s in seeds]))
+time.sleep(30 if run_id == "mixed" and 2 in seeds else 0.2)
+"""
+
+
+def get_pool(tmp_path, max_running_jobs: int, job_arguments: dict = {}):
+    job_fname = os.path.join(str(tmp_path), "train.py")
+    with open(job_fname, "w") as f:
+        f.write(job_script)
+    experiment_dir = os.path.join(str(tmp_path), "experiments")
+    return EvalJobPool(
+        "local", job_fname, job_arguments, experiment_dir, max_running_jobs
+    )
+
+
+def poll_until(pool, run_id: str, timeout: float = 20.0):
+    """Poll pool until eval `run_id` completed - return all completed ids."""
+    completed, start_t = [], time.time()
+    while run_id not in completed and time.time() - start_t < timeout:
+        completed += [r for r, _ in pool.poll()]
+        time.sleep(0.05)
+    return completed
+
+
+def test_pool_poll_and_stop(tmp_path):
+    """Evals complete once all seeds are done & stopping frees slots."""
+    pool = get_pool(tmp_path, 4)
+    pool.launch("fast", "fast.yaml", [1, 2])
+    pool.launch("mixed", "mixed.yaml", [1, 2])
+    assert pool.budget.num_running_jobs == 4 and not pool.can_launch(1)
+    assert poll_until(pool, "fast") == ["fast"]
+    # Seed 1 of the mixed eval finished - eval itself is still running
+    time.sleep(0.5)
+    assert pool.poll() == []
+    assert pool.num_running_jobs == pool.budget.num_running_jobs == 1
+    assert list(pool.running.keys()) == ["mixed"]
+    pool.stop("mixed")
+    assert pool.running == {} and pool.budget.num_running_jobs == 0
+
+
+def test_pool_seeds_per_process(tmp_path):
+    """All seeds of an eval run in one job which occupies a single slot."""
+    pool = get_pool(tmp_path, 2, {"seeds_per_process": True})
+    assert pool.can_launch(3)
+    pool.launch("fast", "fast.yaml", [1, 2, 3])
+    assert pool.budget.num_running_jobs == 1 and pool.can_launch(3)
+    assert poll_until(pool, "fast") == ["fast"]
+    assert pool.budget.num_running_jobs == 0
+    with open(os.path.join(pool.experiment_dir, "fast_1.txt")) as f:
+        assert f.read() == "1,2,3"
+    # Per-seed accounting: one slot per seed job
+    seed_pool = get_pool(tmp_path, 2)
+    assert seed_pool.can_launch(3)
+    seed_pool.launch("fast", "fast.yaml", [1, 2, 3])
+    assert seed_pool.budget.num_running_jobs == 3 and not seed_pool.can_launch(1)
+    assert poll_until(seed_pool, "fast") == ["fast"]
+    assert seed_pool.budget.num_running_jobs == 0
+
+
+def test_job_budget():
+    """Shared budget is never oversubscribed - empty budget always admits."""
+    budget = JobBudget(3)
+    assert budget.can_launch(5)
+    budget.acquire(5)
+    assert not budget.can_launch(1)
+    budget.release(3)
+    assert budget.can_launch(1) and not budget.can_launch(2)
+    budget.release(2)
+
+    # Concurrent searches check & acquire under the lock
+    max_running, stop = [0], threading.Event()
+
+    def search(num_jobs: int):
+        while not stop.is_set():
+            with budget.lock:
+                if budget.can_launch(num_jobs):
+                    budget.acquire(num_jobs)
+                    max_running[0] = max(max_running[0], budget.num_running_jobs)
+                    launched = True
+                else:
+                    launched = False
+            time.sleep(0.001)
+            if launched:
+                budget.release(num_jobs)
+
+    threads = [threading.Thread(target=search, args=(n,)) for n in [1, 2, 3, 1]]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.5)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    assert 0 < max_running[0] <= budget.max_running_jobs
+    assert budget.num_running_jobs == 0
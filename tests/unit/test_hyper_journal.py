@@ -0,0 +1,55 @@
+import os
+from mle_toolbox.hyperopt import HyperoptLogger
+from mle_toolbox.utils import load_hyper_log
+
+
+def log_batch(hyper_log: HyperoptLogger, batch_id: int, num_evals: int = 2):
+    """Log a batch of evals without results & store the hyper log."""
+    params = [{"lrate": 0.1 * (i + 1)} for i in range(num_evals)]
+    run_ids = [f"b_{batch_id}_eval_{i}" for i in range(num_evals)]
+    hyper_log.update_log(params, None, 1.0, run_ids)
+    hyper_log.save_log()
+
+
+def test_journal_append_compact(tmp_path):
+    """Evals are appended to journal & periodically compacted into .pkl."""
+    hyperlog_fname = os.path.join(tmp_path, "hyper_log.pkl")
+    journal_fname = os.path.join(tmp_path, "hyper_log.journal")
+    hyper_log = HyperoptLogger(
+        hyperlog_fname, no_results_logging=True, use_journal=True, compact_every=4
+    )
+    log_batch(hyper_log, 1)
+    snapshot_size = os.path.getsize(hyperlog_fname)
+    log_batch(hyper_log, 2)
+    # Second batch only appended to journal - snapshot is left untouched
+    assert os.path.getsize(hyperlog_fname) == snapshot_size
+    assert os.path.getsize(journal_fname) > 0
+    log = load_hyper_log(hyperlog_fname)
+    assert log.eval_ids == ["b_1_eval_0", "b_1_eval_1", "b_2_eval_0", "b_2_eval_1"]
+    log_batch(hyper_log, 3)
+    # 4 journal records - compaction rewrote snapshot & truncated journal
+    assert os.path.getsize(journal_fname) == 0
+    assert len(load_hyper_log(journal_fname)) == 6
+
+
+def test_journal_crash_reload(tmp_path):
+    """A partially written journal record is dropped on reload."""
+    hyperlog_fname = os.path.join(tmp_path, "hyper_log.pkl")
+    journal_fname = os.path.join(tmp_path, "hyper_log.journal")
+    hyper_log = HyperoptLogger(
+        hyperlog_fname, no_results_logging=True, use_journal=True
+    )
+    log_batch(hyper_log, 1)
+    log_batch(hyper_log, 2)
+    # Simulate crash in the middle of appending the last eval record
+    with open(journal_fname, "r+b") as f:
+        f.truncate(os.path.getsize(journal_fname) - 5)
+    assert len(load_hyper_log(hyperlog_fname)) == 3
+
+    reloaded = HyperoptLogger(
+        hyperlog_fname, no_results_logging=True, reload_log=True, use_journal=True
+    )
+    assert reloaded.iter_id == 3
+    assert reloaded.all_run_ids == ["b_1_eval_0", "b_1_eval_1", "b_2_eval_0"]
+    log_batch(reloaded, 3)
+    assert len(load_hyper_log(hyperlog_fname)) == 5
@@ -0,0 +1,55 @@
+import numpy as np
+from dotmap import DotMap
+from mle_toolbox.hyperopt import HyperoptLogger
+
+
+def get_meta_eval_log(run_ids, scores):
+    """Construct minimal aggregated meta log for a batch of evals."""
+    meta_eval_log = DotMap()
+    for run_id, score in zip(run_ids, scores):
+        meta_eval_log[run_id] = DotMap(
+            {
+                "stats": {"test_loss": {"mean": np.array([1.0, score])}},
+                "meta": {"experiment_dir": run_id},
+            }
+        )
+    return meta_eval_log
+
+
+def test_leaderboard_updates(tmp_path):
+    """Best-so-far & top-k leaders match a full rescan of all evals."""
+    hyper_log = HyperoptLogger(
+        str(tmp_path / "hyper_log.pkl"),
+        max_objective=False,
+        eval_metrics="test_loss",
+        top_k=3,
+    )
+    rng = np.random.RandomState(0)
+    all_scores = []
+    for batch_id in range(5):
+        run_ids = [f"b_{batch_id}_eval_{i}" for i in range(4)]
+        scores = rng.rand(4).round(1).tolist()
+        all_scores += scores
+        hyper_log.update_log(
+            [{"lrate": s} for s in scores],
+            get_meta_eval_log(run_ids, scores),
+            1.0,
+            run_ids,
+        )
+    # Ties are broken in favour of the earlier evaluation
+    ranking = np.argsort(all_scores, kind="stable")[:3] + 1
+    leaders = hyper_log.get_leaderboard("test_loss")
+    assert [leader["iter_id"] for leader in leaders] == ranking.tolist()
+    assert [leader["score"] for leader in leaders] == sorted(all_scores)[:3]
+    assert hyper_log.best_per_metric["test_loss"]["run_id"] == ranking[0]
+
+    # Reloaded logger reconstructs the same leaderboard
+    hyper_log.save_log()
+    reloaded = HyperoptLogger(
+        str(tmp_path / "hyper_log.pkl"),
+        max_objective=False,
+        eval_metrics="test_loss",
+        top_k=3,
+        reload_log=True,
+    )
+    assert reloaded.get_leaderboard("test_loss") == leaders
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+from mle_logging import load_log
+from mle_toolbox.hyperopt.hyper_logger import evaluate_hyperparams
+
+meta_log_fname = "tests/unit/fixtures/experiment_1/meta_log.hdf5"
+
+
+def evaluate_loop(eval_logs, run_ids, problem_type, metric, agg, max_objective):
+    """Reference per-run scoring of a single metric."""
+    scores = {}
+    for run in run_ids:
+        series = eval_logs[run]["stats"][metric][agg]
+        if problem_type == "final":
+            scores[run] = series[-1]
+        elif problem_type == "mean":
+            scores[run] = np.mean(series)
+        elif max_objective:
+            scores[run] = np.max(series)
+        else:
+            scores[run] = np.min(series)
+    return scores
+
+
+@pytest.mark.parametrize("problem_type", ["final", "best", "mean"])
+@pytest.mark.parametrize("aggregate_seeds", ["mean", "p10", "p50", "p90"])
+def test_scores_match_fixture(problem_type, aggregate_seeds):
+    """Vectorized scores are identical to per-run numpy evaluation."""
+    meta_log = load_log(meta_log_fname, aggregate_seeds=True)
+    run_ids = meta_log.eval_ids
+    for max_objective in [True, False]:
+        perf = evaluate_hyperparams(
+            meta_log,
+            run_ids,
+            problem_type,
+            ["integral", "noise"],
+            aggregate_seeds,
+            max_objective,
+        )
+        for metric in ["integral", "noise"]:
+            assert perf[metric] == evaluate_loop(
+                meta_log, run_ids, problem_type, metric, aggregate_seeds, max_objective
+            )
+
+
+def test_scores_ragged_runs():
+    """Runs with different numbers of logged steps are masked correctly."""
+    rng = np.random.RandomState(0)
+    eval_logs = {
+        f"run_{i}": {"stats": {"loss": {"mean": rng.rand(rng.randint(1, 50))}}}
+        for i in range(100)
+    }
+    run_ids = list(eval_logs.keys())
+    for problem_type in ["final", "best", "mean"]:
+        perf = evaluate_hyperparams(
+            eval_logs, run_ids, problem_type, ["loss"], "mean", False
+        )
+        assert perf["loss"] == evaluate_loop(
+            eval_logs, run_ids, problem_type, "loss", "mean", False
+        )
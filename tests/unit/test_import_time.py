@@ -0,0 +1,43 @@
+import sys
+import json
+import subprocess
+
+# Generous budget - `import mle_toolbox` mostly pays for mle_logging/pandas
+IMPORT_BUDGET_SECONDS = 3.0
+
+import_script = """
+import sys
+import json
+import time
+
+start_t = time.time()
+import mle_toolbox
+
+print(json.dumps({
+    "import_time": time.time() - start_t,
+    "frameworks": [m for m in ["torch", "jax", "gym"] if m in sys.modules],
+    "config_loaded": mle_toolbox.mle_config.is_loaded,
+}))
+"""
+
+
+def test_import_time():
+    """Import stays cheap: no framework imports & no config loading."""
+    out = subprocess.run(
+        [sys.executable, "-c", import_script], capture_output=True, check=True
+    )
+    result = json.loads(out.stdout.decode().strip().split("\n")[-1])
+    assert result["import_time"] < IMPORT_BUDGET_SECONDS
+    assert result["frameworks"] == []
+    assert not result["config_loaded"]
+
+
+def test_lazy_config():
+    """Config is loaded on first access & behaves like the DotMap."""
+    from mle_toolbox.utils.core_files_load import LazyConfig
+
+    mle_config = LazyConfig("non_existent_config.toml")
+    assert not mle_config.is_loaded
+    assert mle_config.general.random_seed == 42
+    assert mle_config["slack"]["slack_token"] is None
+    assert "general" in mle_config and mle_config.is_loaded
@@ -0,0 +1,108 @@
+import os
+import stat
+import pytest
+from mle_toolbox.utils.job_array import ArrayJobQueue, use_job_array
+
+job_script = """
+import os
+from mle_toolbox.utils import parse_experiment_args
+
+cmd_args, extra_args = parse_experiment_args()
+run_id = os.path.splitext(os.path.basename(cmd_args.config_fname))[0]
+fname = os.path.join(cmd_args.experiment_dir, f"{run_id}_{cmd_args.seed_id}.txt")
+with open(fname, "w") as f:
+    f.write(" ".join(extra_args))
+"""
+
+# Stand-ins run all array tasks in background & list array until all are done
+fake_submit = """#!/bin/bash
+cat > {fake_dir}/job.sh
+echo x >> {fake_dir}/submit_calls
+N=$(sed -n 's/^{array_prefix}\\([0-9]*\\).*/\\1/p' {fake_dir}/job.sh)
+touch {fake_dir}/running
+(for i in $(seq 1 $N); do {task_id}=$i bash {fake_dir}/job.sh; done;
+ rm {fake_dir}/running) > /dev/null 2>&1 &
+echo "{submit_out}"
+"""
+
+fake_status = """#!/bin/bash
+echo x >> {fake_dir}/status_calls
+printf "{header}\\n"
+if [ -f {fake_dir}/running ]; then echo "{job_line}"; fi
+"""
+
+fake_clusters = {
+    "slurm-cluster": {
+        "submit": "sbatch",
+        "status": "squeue",
+        "array_prefix": "#SBATCH --array=1-",
+        "task_id": "SLURM_ARRAY_TASK_ID",
+        "submit_out": "Submitted batch job 4242",
+        "header": "JOBID PARTITION NAME USER ST TIME NODES",
+        "job_line": "4242_[2-4] partition job user R 0:01 1",
+        "job_arguments": {"partition": "debug", "num_logical_cores": 1},
+    },
+    "sge-cluster": {
+        "submit": "qsub",
+        "status": "qstat",
+        "array_prefix": "#\\$ -t 1-",
+        "task_id": "SGE_TASK_ID",
+        "submit_out": "4343.1-4:1",
+        "header": "job-ID prior name user state\\n---------------",
+        "job_line": "4343 0.5 job user r 1-4:1",
+        "job_arguments": {"queue": "debug", "num_logical_cores": 1},
+    },
+}
+
+
+def install_fake_cluster(fake_dir: str, resource_to_run: str) -> None:
+    """Write fake submit/status commands for resource to `fake_dir`."""
+    fake = fake_clusters[resource_to_run]
+    for cmd, template in [("submit", fake_submit), ("status", fake_status)]:
+        fname = os.path.join(fake_dir, fake[cmd])
+        with open(fname, "w") as f:
+            f.write(template.format(fake_dir=fake_dir, **fake))
+        os.chmod(fname, os.stat(fname).st_mode | stat.S_IEXEC)
+
+
+@pytest.mark.parametrize("resource_to_run", ["slurm-cluster", "sge-cluster"])
+def test_array_job_queue(tmp_path, monkeypatch, resource_to_run):
+    """Batch is submitted as one array & polled once per array status check."""
+    fake_dir = str(tmp_path)
+    install_fake_cluster(fake_dir, resource_to_run)
+    monkeypatch.setenv("PATH", fake_dir + os.pathsep + os.environ["PATH"])
+    job_fname = os.path.join(fake_dir, "train.py")
+    with open(job_fname, "w") as f:
+        f.write(job_script)
+    experiment_dir = os.path.join(fake_dir, "experiments")
+    job_arguments = dict(fake_clusters[resource_to_run]["job_arguments"])
+    job_arguments["use_job_array"] = True
+    job_arguments["array_poll_interval"] = 0.1
+    job_arguments["extra_cmd_line_input"] = {"lr": 0.1}
+
+    queue = ArrayJobQueue(
+        resource_to_run,
+        job_fname,
+        job_arguments,
+        ["configs/eval_0.yaml", "configs/eval_1.yaml"],
+        experiment_dir,
+        random_seeds=[1, 2],
+        max_running_jobs=2,
+    )
+    queue.run()
+    for run_id in ["eval_0", "eval_1"]:
+        for seed_id in [1, 2]:
+            with open(os.path.join(experiment_dir, f"{run_id}_{seed_id}.txt")) as f:
+                assert f.read() == "-lr 0.1"
+    with open(os.path.join(fake_dir, "submit_calls")) as f:
+        assert len(f.readlines()) == 1
+    # Task file & script are removed after the array completed
+    assert not any([f.startswith("array_") for f in os.listdir(experiment_dir)])
+
+
+def test_use_job_array():
+    """Job arrays are opt-in & only used on SGE/Slurm clusters."""
+    assert use_job_array("slurm-cluster", {"use_job_array": True})
+    assert use_job_array("sge-cluster", {"use_job_array": True})
+    assert not use_job_array("slurm-cluster", {})
+    assert not use_job_array("local", {"use_job_array": True})
@@ -0,0 +1,69 @@
+import os
+import types
+import h5py
+import pytest
+from mle_toolbox.hyperopt import log_watcher
+from mle_toolbox.hyperopt.log_watcher import RunLogWatcher
+
+
+def write_seed_log(experiment_dir: str, run_id: str, seed_id: int) -> str:
+    """Write minimal seed log file <run_id>/logs/log_seed_<id>.hdf5."""
+    log_dir = os.path.join(experiment_dir, run_id, "logs")
+    os.makedirs(log_dir, exist_ok=True)
+    log_path = os.path.join(log_dir, f"log_seed_{seed_id}.hdf5")
+    with h5py.File(log_path, "w") as h5f:
+        h5f.create_dataset(f"seed_{seed_id}/meta/eval_id", data=[run_id.encode()])
+    return log_path
+
+
+def test_watcher_ready_runs(tmp_path):
+    """Runs are only handed over once all seed logs are written."""
+    watcher = RunLogWatcher(str(tmp_path), ["b_1_eval_0", "b_1_eval_1"], 2)
+    write_seed_log(str(tmp_path), "b_1_eval_0", 0)
+    write_seed_log(str(tmp_path), "b_1_eval_0", 1)
+    write_seed_log(str(tmp_path), "b_1_eval_1", 0)
+    assert watcher.ready_runs() == ["b_1_eval_0"]
+    write_seed_log(str(tmp_path), "b_1_eval_1", 1)
+    assert list(watcher.wait()) == [["b_1_eval_1"]]
+
+
+def test_watcher_timeout_corrupt(tmp_path):
+    """Corrupt & missing logs are reported after the timeout."""
+    write_seed_log(str(tmp_path), "b_1_eval_0", 0)
+    log_path = write_seed_log(str(tmp_path), "b_1_eval_0", 1)
+    with open(log_path, "wb") as f:
+        f.write(b"not-an-hdf5-file")
+    watcher = RunLogWatcher(str(tmp_path), ["b_1_eval_0", "b_1_eval_1"], 2, timeout=0.3)
+    with pytest.raises(TimeoutError) as err:
+        watcher.wait_all()
+    assert "b_1_eval_0: corrupt log" in str(err.value)
+    assert "b_1_eval_1: missing logs" in str(err.value)
+
+
+class FakeINotify(object):
+    """Stand-in for `inotify_simple.INotify` recording watches & close."""
+
+    def __init__(self):
+        self.watches, self.closed = [], False
+
+    def add_watch(self, path, mask):
+        self.watches.append(path)
+
+    def read(self, timeout=None):
+        return []
+
+    def close(self):
+        self.closed = True
+
+
+def test_watcher_closes_inotify(tmp_path, monkeypatch):
+    """Watcher releases its inotify instance on exit - also after timeouts."""
+    flags = types.SimpleNamespace(CREATE=1, CLOSE_WRITE=2, MOVED_TO=4)
+    monkeypatch.setattr(log_watcher, "flags", flags, raising=False)
+    inotify = FakeINotify()
+    with pytest.raises(TimeoutError):
+        with RunLogWatcher(str(tmp_path), ["b_1_eval_0"], 1, timeout=0.2) as watcher:
+            watcher.inotify = inotify
+            watcher.wait_all()
+    assert inotify.closed and str(tmp_path) in inotify.watches
+    assert watcher.inotify is None
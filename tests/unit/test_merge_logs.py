@@ -0,0 +1,44 @@
+import os
+import h5py
+import numpy as np
+from mle_logging import load_log
+from mle_toolbox.hyperopt.merge_logs import merge_batch_logs
+
+meta_log_fname = "tests/unit/fixtures/experiment_1/meta_log.hdf5"
+
+
+def setup_run_logs(experiment_dir: str) -> list:
+    """Split fixture meta log into seed-merged logs of individual runs."""
+    with h5py.File(meta_log_fname, "r") as file_from:
+        run_ids = list(file_from.keys())
+        for run_id in run_ids:
+            log_dir = os.path.join(experiment_dir, run_id, "logs")
+            os.makedirs(log_dir)
+            with h5py.File(os.path.join(log_dir, "log.hdf5"), "w") as file_to:
+                for seed_id in file_from[run_id].keys():
+                    file_from.copy(file_from[run_id][seed_id], file_to, seed_id)
+    return run_ids
+
+
+def test_merge_batch_logs(tmp_path):
+    """Check that incremental merge matches loading the full meta log."""
+    experiment_dir = str(tmp_path)
+    run_ids = setup_run_logs(experiment_dir)
+    full_log = load_log(meta_log_fname, aggregate_seeds=True)
+
+    # Merge in two batches - only new runs are loaded & returned
+    batch_1 = merge_batch_logs(experiment_dir, run_ids[:2])
+    batch_2 = merge_batch_logs(experiment_dir, run_ids[2:])
+    assert batch_1.eval_ids == run_ids[:2]
+    assert batch_2.eval_ids == run_ids[2:]
+    for run_id in run_ids[2:]:
+        assert np.allclose(
+            batch_2[run_id].stats.integral.mean, full_log[run_id].stats.integral.mean
+        )
+
+    # Meta log file should contain all runs after both batches
+    meta_log = load_log(
+        os.path.join(experiment_dir, "meta_log.hdf5"), aggregate_seeds=True
+    )
+    assert meta_log.eval_ids == full_log.eval_ids
+    assert not os.path.exists(os.path.join(experiment_dir, "batch_log.hdf5"))
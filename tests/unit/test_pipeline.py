@@ -0,0 +1,63 @@
+import time
+import threading
+import pytest
+from mle_toolbox.launch.pipeline import StagePipeline
+
+
+def test_stage_overlap():
+    """Dependents start as soon as their own dependencies completed."""
+    events, lock = [], threading.Lock()
+
+    def stage(name: str, duration: float):
+        def fn():
+            time.sleep(duration)
+            with lock:
+                events.append(name)
+
+        return fn
+
+    pipeline = StagePipeline()
+    pipeline.add_stage("pre", stage("pre", 0.0))
+    pipeline.add_stage("main/a", stage("main/a", 0.1), ["pre"])
+    pipeline.add_stage("main/b", stage("main/b", 0.5), ["pre"])
+    pipeline.add_stage("post/a", stage("post/a", 0.1), ["main/a"])
+    pipeline.add_stage("main", stage("main", 0.0), ["main/a", "main/b"])
+    status = pipeline.run()
+    assert all([s == "done" for s in status.values()])
+    # Post-processing of config a overlaps w. main jobs of config b
+    assert events == ["pre", "main/a", "post/a", "main/b", "main"]
+
+
+def test_stage_failure():
+    """Failed stage skips its dependents & error is raised at the end."""
+    ran = []
+
+    def fail():
+        raise ValueError("Stage failed")
+
+    pipeline = StagePipeline()
+    pipeline.add_stage("main/a", fail)
+    pipeline.add_stage("main/b", lambda: ran.append("main/b"))
+    pipeline.add_stage("post/a", lambda: ran.append("post/a"), ["main/a"])
+    with pytest.raises(ValueError):
+        pipeline.run()
+    assert ran == ["main/b"]
+
+
+def test_stage_cache(tmp_path):
+    """Stages w. same cache key & cached deps are skipped on re-runs."""
+    ran = []
+
+    def build(pre_key: str):
+        pipeline = StagePipeline(str(tmp_path))
+        pipeline.add_stage("pre", lambda: ran.append("pre"), cache_key=pre_key)
+        pipeline.add_stage("main", lambda: ran.append("main"), ["pre"])
+        pipeline.add_stage("post", lambda: ran.append("post"), ["main"], "post")
+        return pipeline
+
+    assert build("v1").run()["pre"] == "done"
+    status = build("v1").run()
+    # Post depends on uncached main stage - always re-runs
+    assert status == {"pre": "cached", "main": "done", "post": "done"}
+    assert build("v2").run()["pre"] == "done"
+    assert ran == ["pre", "main", "post", "main", "post", "pre", "main", "post"]
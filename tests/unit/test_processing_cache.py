@@ -0,0 +1,87 @@
+import os
+from mle_toolbox.utils.processing_cache import ProcessingCache
+from mle_toolbox.utils.protocol_data import record_processing_cache_hit
+
+
+def write_file(fname: str, content: str) -> None:
+    os.makedirs(os.path.dirname(fname), exist_ok=True)
+    with open(fname, "w") as f:
+        f.write(content)
+
+
+def test_processing_cache(tmp_path):
+    """Cache hits require outputs & unchanged script, args and inputs."""
+    script = os.path.join(str(tmp_path), "preprocess.py")
+    data_dir = os.path.join(str(tmp_path), "data")
+    output = os.path.join(str(tmp_path), "processed", "data.npy")
+    cache_dir = os.path.join(str(tmp_path), ".mle_cache")
+    write_file(script, "print('preprocess')")
+    write_file(os.path.join(data_dir, "raw_1.txt"), "1")
+    write_file(os.path.join(data_dir, "raw_2.txt"), "2")
+
+    def get_cache(args: dict = {"n": 1}):
+        return ProcessingCache(script, args, [data_dir], [output], cache_dir)
+
+    # First run: no manifest - then outputs are still missing
+    cache = get_cache()
+    assert not cache.is_hit()
+    cache.store()
+    assert not get_cache().is_hit()
+    write_file(output, "processed")
+    assert get_cache().is_hit()
+    # Changed arguments, input content & script invalidate the manifest
+    assert not get_cache({"n": 2}).is_hit()
+    write_file(os.path.join(data_dir, "raw_2.txt"), "3")
+    assert not get_cache().is_hit()
+    get_cache().store()
+    assert get_cache().is_hit()
+    write_file(script, "print('preprocess v2')")
+    assert not get_cache().is_hit()
+
+
+def test_processing_cache_experiment_dirs(tmp_path):
+    """Per-config jobs keep separate manifests in their experiment dirs."""
+    script = os.path.join(str(tmp_path), "postprocess.py")
+    output = os.path.join(str(tmp_path), "summary.txt")
+    write_file(script, "print('postprocess')")
+    write_file(output, "summary")
+    caches = [
+        ProcessingCache(script, {}, [], [output], experiment_dir=exp_dir)
+        for exp_dir in [str(tmp_path / "b_1_eval_0"), str(tmp_path / "b_1_eval_1")]
+    ]
+    assert caches[0].manifest_fname.startswith(str(tmp_path / "b_1_eval_0"))
+    assert caches[0].manifest_fname != caches[1].manifest_fname
+    assert caches[0].key != caches[1].key
+    caches[0].store()
+    assert not caches[1].is_hit()
+    assert ProcessingCache(
+        script, {}, [], [output], experiment_dir=str(tmp_path / "b_1_eval_0")
+    ).is_hit()
+
+
+class DummyProtocol(object):
+    """In-memory stand-in for `MLEProtocol.get`/`update` of one experiment."""
+
+    last_experiment_id = 1
+
+    def __init__(self):
+        self.db = {"1": {}}
+
+    def get(self, experiment_id, var_name):
+        return self.db[str(experiment_id)][var_name]
+
+    def update(self, experiment_id, var_name, var_value):
+        self.db[str(experiment_id)][var_name] = var_value
+
+
+def test_record_cache_hit(tmp_path):
+    """Cache hits are added to the protocol's extra data."""
+    script = os.path.join(str(tmp_path), "preprocess.py")
+    write_file(script, "print('preprocess')")
+    cache = ProcessingCache(script, {}, [], [script], str(tmp_path))
+    protocol_db = DummyProtocol()
+    record_processing_cache_hit(protocol_db, script, cache)
+    record_processing_cache_hit(protocol_db, "postprocess.py", cache)
+    hits = protocol_db.get(1, "processing_cache_hits")
+    assert list(hits.keys()) == [script, "postprocess.py"]
+    assert hits[script]["key"] == cache.key
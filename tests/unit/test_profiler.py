@@ -0,0 +1,119 @@
+import os
+import sys
+import json
+import time
+import subprocess as sp
+from dotmap import DotMap
+import numpy as np
+from mle_logging import MLELogger, load_log
+from mle_toolbox.hyperopt import HyperoptLogger
+from mle_toolbox.report.generate_reports import construct_profile_table
+from mle_toolbox.utils.profiler import (
+    StepProfiler,
+    null_phase,
+    load_profiles,
+    write_profile,
+)
+
+
+def test_step_profiler():
+    """Per-phase wall/cpu totals, throughput & no-op when disabled."""
+    profiler = StepProfiler()
+    for _ in range(3):
+        with profiler.phase("data"):
+            time.sleep(0.02)
+        with profiler.phase("train"):
+            np.linalg.inv(np.random.normal(size=(200, 200)))
+        profiler.step()
+    profile = profiler.summary()
+    data, train = profile["phases"]["data"], profile["phases"]["train"]
+    assert data["count"] == train["count"] == 3
+    assert data["wall_time"] >= 0.06 and data["cpu_time"] < data["wall_time"]
+    assert train["peak_rss_mb"] > 0 and 0 < data["wall_frac"] < 1
+    assert profile["num_steps"] == 3
+    assert profile["steps_per_sec"] == 3 / profile["wall_time"]
+
+    disabled = StepProfiler(enabled=False)
+    assert disabled.phase("data") is null_phase
+    with disabled.phase("data"):
+        disabled.step()
+    assert disabled.phases == {} and disabled.num_steps == 0
+
+
+def test_profile_meta_log(tmp_path):
+    """Profile is stored in meta log, shown in report & ranks throughput."""
+    log = MLELogger(
+        experiment_dir=str(tmp_path),
+        time_to_track=["step"],
+        what_to_track=["loss"],
+        seed_id=1,
+        verbose=False,
+    )
+    log.update({"step": 1}, {"loss": 0.5}, save=True)
+    profiler = StepProfiler()
+    with profiler.phase("train"):
+        profiler.step(10)
+    write_profile(log, profiler.summary())
+    meta_log = load_log(str(tmp_path))
+    profiles = load_profiles(meta_log["seed_1"].meta)
+    assert profiles[0]["num_steps"] == 10
+    table = construct_profile_table(meta_log)
+    assert table[0]["Run"] == "`seed_1`" and "train" in table[0]["Phases (Wall)"]
+
+    # Hyper log stores mean throughput over seeds & ranks configs by it
+    meta_eval_log = DotMap()
+    for run_id, steps_per_sec in [("eval_0", [1.0, 3.0]), ("eval_1", [4.0])]:
+        meta_eval_log[run_id] = DotMap(
+            {
+                "stats": {"loss": {"mean": np.array([1.0, 0.5])}},
+                "meta": {
+                    "experiment_dir": run_id,
+                    "profile": [
+                        json.dumps({"steps_per_sec": s, "phases": {}})
+                        for s in steps_per_sec
+                    ],
+                },
+            }
+        )
+    hyper_log = HyperoptLogger(str(tmp_path / "hyper_log.pkl"), eval_metrics="loss")
+    hyper_log.update_log(
+        [{"lrate": 0.1}, {"lrate": 0.2}], meta_eval_log, 1.0, ["eval_0", "eval_1"]
+    )
+    ranking = hyper_log.rank_by_throughput()
+    assert [(r["run_id"], r["throughput"]) for r in ranking] == [
+        ("eval_1", 4.0),
+        ("eval_0", 2.0),
+    ]
+
+
+# Plain `MLExperiment` job without the `experiment` decorator
+job_script = """
+from mle_toolbox import MLExperiment
+
+mle = MLExperiment(
+    log_config={"time_to_track": ["step"], "what_to_track": ["loss"], "verbose": False},
+    profile=True,
+)
+for step in range(5):
+    with mle.timer("train"):
+        mle.step()
+mle.update_log({"step": 5}, {"loss": 0.5}, save=True)
+"""
+
+
+def test_experiment_profile_at_exit(tmp_path):
+    """Profile of a plain `MLExperiment` job is written when it exits."""
+    job_fname = str(tmp_path / "train.py")
+    with open(job_fname, "w") as f:
+        f.write(job_script)
+    exp_dir = str(tmp_path / "experiment")
+    out = sp.run(
+        [sys.executable, job_fname, "-exp_dir", exp_dir, "-seed", "1"],
+        cwd=str(tmp_path),
+        stdout=sp.PIPE,
+        stderr=sp.DEVNULL,
+    )
+    assert b"PROFILE - 5 steps" in out.stdout
+    log_fname = os.path.join(exp_dir, "logs", "log_seed_1.hdf5")
+    profiles = load_profiles(load_log(log_fname)["seed_1"].meta)
+    assert profiles[0]["num_steps"] == 5 and "train" in profiles[0]["phases"]
@@ -0,0 +1,44 @@
+import os
+import h5py
+import numpy as np
+from mle_toolbox.hyperopt.racing import SeedRacer
+
+
+def write_seed_log(experiment_dir: str, run_id: str, seed_id: int, curve: list):
+    """Write seed log <run_id>/logs/log_seed_<id>.hdf5 w. test loss curve."""
+    log_dir = os.path.join(experiment_dir, run_id, "logs")
+    os.makedirs(log_dir, exist_ok=True)
+    log_path = os.path.join(log_dir, f"log_seed_{seed_id}.hdf5")
+    with h5py.File(log_path, "w") as h5f:
+        h5f.create_dataset(f"seed_{seed_id}/stats/test_loss", data=curve)
+
+
+def test_seed_scores(tmp_path):
+    """Per-seed scores follow the hyper log problem type."""
+    write_seed_log(str(tmp_path), "b_1_eval_0", 1, [3.0, 1.0, 2.0])
+    write_seed_log(str(tmp_path), "b_1_eval_0", 2, [4.0, 2.0, 3.0])
+    for problem_type, scores in [
+        ("final", [2.0, 3.0]),
+        ("best", [1.0, 2.0]),
+        ("mean", [2.0, 3.0]),
+    ]:
+        racer = SeedRacer(str(tmp_path), "test_loss", problem_type, False)
+        assert np.allclose(racer.seed_scores("b_1_eval_0"), scores)
+
+
+def test_race_contention(tmp_path):
+    """Only evals whose CI overlaps the best score get more seeds."""
+    all_seeds = [1, 2, 3, 4, 5, 6]
+    racer = SeedRacer(str(tmp_path), "test_loss", "final", False, min_seeds=2)
+    write_seed_log(str(tmp_path), "b_1_eval_0", 1, [1.0])
+    write_seed_log(str(tmp_path), "b_1_eval_0", 2, [1.2])
+    # No best score yet - always add next round of seeds
+    assert racer.next_seeds("b_1_eval_0", [1, 2], all_seeds, None) == [3, 4]
+    # Clearly worse than best score of 0.5 - drop eval & save 4 seed jobs
+    assert racer.next_seeds("b_1_eval_0", [1, 2], all_seeds, 0.5) == []
+    assert racer.num_dropped == 1 and racer.num_saved_seeds == 4
+    # Noisy eval overlapping the best stays in the race until all seeds ran
+    write_seed_log(str(tmp_path), "b_1_eval_1", 1, [0.2])
+    write_seed_log(str(tmp_path), "b_1_eval_1", 2, [1.8])
+    assert racer.next_seeds("b_1_eval_1", [1, 2], all_seeds, 0.5) == [3, 4]
+    assert racer.next_seeds("b_1_eval_1", all_seeds, all_seeds, 0.5) == []
@@ -0,0 +1,83 @@
+import os
+import json
+import stat
+import time
+from mle_toolbox.utils.resource_detection import determine_resource, resource_env_var
+
+fake_probe = """#!/bin/bash
+echo x >> {fake_dir}/{cmd}_calls
+sleep {duration}
+exit {exit_code}
+"""
+
+
+def install_probes(fake_dir: str, probes: dict) -> None:
+    """Write fake qstat/squeue w. given (duration, exit code)."""
+    for cmd, (duration, exit_code) in probes.items():
+        fname = os.path.join(fake_dir, cmd)
+        with open(fname, "w") as f:
+            f.write(
+                fake_probe.format(
+                    fake_dir=fake_dir,
+                    cmd=cmd,
+                    duration=duration,
+                    exit_code=exit_code,
+                )
+            )
+        os.chmod(fname, os.stat(fname).st_mode | stat.S_IEXEC)
+
+
+def num_calls(fake_dir: str, cmd: str) -> int:
+    fname = os.path.join(fake_dir, f"{cmd}_calls")
+    if not os.path.exists(fname):
+        return 0
+    with open(fname) as f:
+        return len(f.readlines())
+
+
+def clear_resource_env(monkeypatch) -> None:
+    """Unset env variable - restored on teardown even if detection sets it."""
+    monkeypatch.setenv(resource_env_var, "local")
+    monkeypatch.delenv(resource_env_var)
+
+
+def test_resource_cache(tmp_path, monkeypatch):
+    """Probe once - env variable & disk cache (w. TTL) are used afterwards."""
+    fake_dir = str(tmp_path)
+    cache_fname = os.path.join(fake_dir, "cache", "resource.json")
+    install_probes(fake_dir, {"qstat": (0, 1), "squeue": (0, 0)})
+    monkeypatch.setenv("PATH", fake_dir + os.pathsep + os.environ["PATH"])
+    clear_resource_env(monkeypatch)
+    assert determine_resource(cache_fname) == "slurm-cluster"
+    assert os.environ[resource_env_var] == "slurm-cluster"
+    assert determine_resource(cache_fname) == "slurm-cluster"
+    assert num_calls(fake_dir, "squeue") == 1
+    # New job process w/o env variable reads disk cache
+    monkeypatch.delenv(resource_env_var)
+    assert determine_resource(cache_fname) == "slurm-cluster"
+    assert num_calls(fake_dir, "squeue") == 1
+    # Expired cache is probed again
+    monkeypatch.delenv(resource_env_var)
+    with open(cache_fname, "w") as f:
+        json.dump({"resource": "slurm-cluster", "time": time.time() - 10}, f)
+    assert determine_resource(cache_fname, cache_ttl=5) == "slurm-cluster"
+    assert num_calls(fake_dir, "squeue") == 2
+
+
+def test_probe_timeout(tmp_path, monkeypatch):
+    """Probes run concurrently & hanging schedulers are killed."""
+    fake_dir = str(tmp_path)
+    cache_fname = os.path.join(fake_dir, "resource.json")
+    install_probes(fake_dir, {"qstat": (30, 0), "squeue": (0.5, 0)})
+    monkeypatch.setenv("PATH", fake_dir + os.pathsep + os.environ["PATH"])
+    clear_resource_env(monkeypatch)
+    start_t = time.time()
+    assert determine_resource(cache_fname, timeout=1) == "slurm-cluster"
+    assert time.time() - start_t < 5
+    # Nothing responds in time - fall back on local w/o caching it
+    monkeypatch.delenv(resource_env_var)
+    os.remove(cache_fname)
+    install_probes(fake_dir, {"qstat": (30, 0), "squeue": (30, 0)})
+    assert determine_resource(cache_fname, timeout=0.5) == "local"
+    assert not os.path.exists(cache_fname)
+    assert resource_env_var not in os.environ
@@ -0,0 +1,131 @@
+import os
+import time
+from mle_logging import load_log
+from mle_toolbox.hyperopt.speculation import StragglerDetector, SpeculativeJobQueue
+from test_warm_pool import ProgressProtocol
+
+job_script = """
+import os
+import time
+from mle_toolbox.utils import parse_experiment_args
+
+cmd_args, _ = parse_experiment_args()
+run_id = os.path.splitext(os.path.basename(cmd_args.config_fname))[0]
+run_dir = os.path.join(cmd_args.experiment_dir, run_id)
+os.makedirs(run_dir, exist_ok=True)
+duplicate = ".speculative" in cmd_args.experiment_dir
+# Original of seed 2 lands on a 'slow node'
+time.sleep(30 if cmd_args.seed_id == 2 and not duplicate else 0.5)
+with open(os.path.join(run_dir, f"seed_{cmd_args.seed_id}.txt"), "w") as f:
+    f.write("duplicate" if duplicate else "original")
+"""
+
+
+def test_straggler_detector():
+    """Expected runtime from config history, batch & previous batches."""
+    detector = StragglerDetector(slowdown=2.0, min_completed=0.5)
+    detector.start_batch(4)
+    # No runtimes yet - nothing to compare against
+    assert not detector.is_straggler("a", 100.0)
+    detector.add_runtime("a", 10.0)
+    assert detector.is_straggler("a", 21.0) and not detector.is_straggler("a", 19.0)
+    # Other configs wait until half of the batch completed
+    assert not detector.is_straggler("b", 100.0)
+    detector.add_runtime("c", 20.0)
+    assert detector.expected_runtime("b") == 15.0
+    # Next batch falls back on runtimes of previous batches
+    detector.start_batch(4)
+    assert detector.expected_runtime("b") == 15.0
+    detector.max_speculative = 1
+    detector.record_speculation()
+    assert not detector.is_straggler("a", 100.0)
+
+
+def test_speculative_queue(tmp_path):
+    """Straggler gets duplicate - first copy wins & its files are kept."""
+    job_fname = os.path.join(str(tmp_path), "train.py")
+    with open(job_fname, "w") as f:
+        f.write(job_script)
+    experiment_dir = os.path.join(str(tmp_path), "experiments")
+    detector = StragglerDetector(slowdown=2.0, min_runtime=2.0)
+    protocol_db = ProgressProtocol()
+    queue = SpeculativeJobQueue(
+        "local",
+        job_fname,
+        {},
+        "configs/eval_0.yaml",
+        experiment_dir,
+        random_seeds=[1, 2, 3],
+        detector=detector,
+        poll_every=0.1,
+        protocol_db=protocol_db,
+    )
+    start_t = time.time()
+    queue.run()
+    assert time.time() - start_t < 25
+    assert detector.num_speculative == 1 and detector.num_won == 1
+    # Winner & killed copy of straggler count as one completed job
+    assert protocol_db.num_updates == 3
+    run_dir = os.path.join(experiment_dir, "eval_0")
+    for seed_id, winner in [(1, "original"), (2, "duplicate"), (3, "original")]:
+        with open(os.path.join(run_dir, f"seed_{seed_id}.txt")) as f:
+            assert f.read() == winner
+    assert not os.path.exists(os.path.join(experiment_dir, ".speculative"))
+
+
+# Logging job - straggling seed 2 logs before hanging, duplicates of eval_1 fail
+logging_job_script = """
+import time
+from mle_toolbox import MLExperiment
+
+mle = MLExperiment()
+duplicate = ".speculative" in mle.experiment_dir
+run_id = mle.train_config.run_id
+if duplicate and run_id == "eval_1":
+    raise ValueError("Duplicate crashed.")
+mle.update_log({"step": 1}, {"loss": 0.5}, save=True)
+if mle.seed_id == 2 and not duplicate:
+    time.sleep(60 if run_id == "eval_0" else 15)
+mle.update_log({"step": 2}, {"loss": 0.25}, save=True)
+"""
+
+
+def test_speculative_promote_meta(tmp_path):
+    """Only successful duplicates win & promoted logs point to the run dir."""
+    job_fname = os.path.join(str(tmp_path), "train.py")
+    with open(job_fname, "w") as f:
+        f.write(logging_job_script)
+    config_fnames = []
+    for run_id in ["eval_0", "eval_1"]:
+        config_fnames.append(os.path.join(str(tmp_path), f"{run_id}.yaml"))
+        with open(config_fnames[-1], "w") as f:
+            f.write(
+                f"train_config:\n  run_id: {run_id}\n"
+                "log_config:\n  time_to_track: [step]\n  what_to_track: [loss]\n"
+                "  verbose: false\n"
+            )
+    experiment_dir = os.path.join(str(tmp_path), "experiments")
+    detector = StragglerDetector(slowdown=2.0, min_runtime=4.0)
+    queue = SpeculativeJobQueue(
+        "local",
+        job_fname,
+        {},
+        config_fnames,
+        experiment_dir,
+        random_seeds=[1, 2],
+        detector=detector,
+        poll_every=0.1,
+    )
+    start_t = time.time()
+    queue.run()
+    assert time.time() - start_t < 40
+    # Failed duplicate of eval_1 lost - original kept running & completed
+    assert detector.num_speculative == 2 and detector.num_won == 1
+    for run_id in ["eval_0", "eval_1"]:
+        run_dir = os.path.join(experiment_dir, run_id)
+        log_fname = os.path.join(run_dir, "logs", "log_seed_2.hdf5")
+        log = load_log(log_fname)["seed_2"]
+        assert log.stats.loss.tolist() == [0.5, 0.25]
+        assert log.meta.experiment_dir == run_dir
+        assert log.meta.log_paths == log_fname
+    assert not os.path.exists(os.path.join(experiment_dir, ".speculative"))
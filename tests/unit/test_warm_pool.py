@@ -0,0 +1,117 @@
+import os
+from mle_logging import load_log
+from mle_toolbox.utils.batch_resume import get_seed_marker_fname
+from mle_toolbox.utils.warm_pool import get_warm_pool, use_warm_pool, WarmJobQueue
+
+job_script = """
+import sys
+import numpy as np
+from mle_toolbox.utils import parse_experiment_args
+
+cmd_args, _ = parse_experiment_args()
+print("seed", cmd_args.seed_id, "draw", np.random.rand())
+print("error", cmd_args.seed_id, file=sys.stderr)
+if cmd_args.seed_id == 3:
+    raise ValueError("Failing seed job")
+"""
+
+
+def test_warm_pool_jobs(tmp_path):
+    """Warm jobs get own argv, stdout/stderr files, RNG state & exit code."""
+    job_fname = os.path.join(str(tmp_path), "train.py")
+    with open(job_fname, "w") as f:
+        f.write(job_script)
+    log_dir = os.path.join(str(tmp_path), "run")
+    pool = get_warm_pool()
+    jobs = [
+        pool.submit_job(job_fname, "config.json", "exp", seed_id, None, log_dir)
+        for seed_id in [1, 2, 3]
+    ]
+    exit_codes = [job.wait(30) for job in jobs]
+    assert exit_codes[:2] == [0, 0] and exit_codes[2] != 0
+
+    draws = []
+    for seed_id in [1, 2]:
+        with open(os.path.join(log_dir, f"stdout_seed_{seed_id}.txt")) as f:
+            out = f.read().split()
+        assert out[:2] == ["seed", str(seed_id)]
+        draws.append(out[3])
+        with open(os.path.join(log_dir, f"stderr_seed_{seed_id}.txt")) as f:
+            assert f.read() == f"error {seed_id}\n"
+    # Forked workers must not share the fork server's numpy RNG state
+    assert draws[0] != draws[1]
+    with open(os.path.join(log_dir, "stderr_seed_3.txt")) as f:
+        assert "Failing seed job" in f.read()
+
+
+# `MLExperiment` job relying on exit hooks - async log writer & seed marker
+experiment_script = """
+import sys
+from mle_toolbox import MLExperiment
+
+mle = MLExperiment(
+    log_config={"time_to_track": ["step"], "what_to_track": ["loss"], "verbose": False},
+    async_logging=True,
+)
+for step in range(50):
+    mle.update_log({"step": step}, {"loss": 1.0 / (step + 1)}, save=True)
+if mle.seed_id == 2:
+    raise ValueError("Failing seed job")
+"""
+
+
+def test_warm_pool_exit_hooks(tmp_path):
+    """Exit hooks of warm jobs run - queued updates are written & marked."""
+    job_fname = os.path.join(str(tmp_path), "train.py")
+    with open(job_fname, "w") as f:
+        f.write(experiment_script)
+    exp_dir = os.path.join(str(tmp_path), "experiment")
+    pool = get_warm_pool()
+    jobs = [
+        pool.submit_job(job_fname, None, exp_dir, seed_id, None, str(tmp_path))
+        for seed_id in [1, 2]
+    ]
+    assert [job.wait(60) for job in jobs][0] == 0
+    log_fname = os.path.join(exp_dir, "logs", "log_seed_1.hdf5")
+    assert len(load_log(log_fname)["seed_1"].time.step) == 50
+    assert os.path.exists(get_seed_marker_fname(exp_dir, 1))
+    # Crashed job flushes its log but isn't marked as completed
+    assert not os.path.exists(get_seed_marker_fname(exp_dir, 2))
+
+
+def test_use_warm_pool():
+    """Warm pool is opt-in & only used for local jobs."""
+    assert use_warm_pool("local", {"use_warm_pool": True})
+    assert not use_warm_pool("local", {})
+    assert not use_warm_pool("slurm-cluster", {"use_warm_pool": True})
+
+
+class ProgressProtocol(object):
+    """Stand-in for `MLEProtocol` counting progress bar updates."""
+
+    def __init__(self):
+        self.num_updates = 0
+
+    def update_progress_bar(self):
+        self.num_updates += 1
+
+
+def test_warm_queue_progress(tmp_path):
+    """Each completed (also failed) job updates the protocol progress bar."""
+    job_fname = os.path.join(str(tmp_path), "train.py")
+    with open(job_fname, "w") as f:
+        f.write(job_script)
+    protocol_db = ProgressProtocol()
+    queue = WarmJobQueue(
+        "local",
+        job_fname,
+        {"use_warm_pool": True},
+        "configs/eval_0.yaml",
+        os.path.join(str(tmp_path), "experiments"),
+        random_seeds=[1, 2, 3],
+        max_running_jobs=2,
+        use_slack_bot=True,
+        protocol_db=protocol_db,
+    )
+    queue.run()
+    assert protocol_db.num_updates == 3